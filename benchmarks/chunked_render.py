@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+分段平行渲染效能測試 - 量測 10 萬行首頁在不同行程數下的渲染時間
+
+使用方式:
+    poetry run python benchmarks/chunked_render.py [行數] [最大行程數]
+"""
+import hashlib
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+# 確保項目根目錄在搜索路徑中
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.application.html_generator import HtmlGenerator
+from src.domain.models import SheetData
+from src.infrastructure.output_sink import FileSystemSink
+
+HEADERS = ["時間戳記", "作者名", "作品連結", "類別", "作品標題"]
+CATEGORIES = ["小說", "詩歌", "散文", "漫畫"]
+UPDATED_AT = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def make_data(row_count: int) -> SheetData:
+    """產生模擬的投稿資料"""
+    rng = random.Random(0)
+    rows = []
+    for i in range(row_count):
+        rows.append(
+            [
+                f"2023/{i % 12 + 1}/{i % 28 + 1} 下午 {i % 12 + 1:02d}:30:45",
+                f"作者{i % 5000}",
+                f"https://example.com/works/{i}",
+                rng.choice(CATEGORIES),
+                f"作品標題 {i}",
+            ]
+        )
+    return SheetData(headers=HEADERS, rows=rows)
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    generator = HtmlGenerator()
+    data, indices = generator.prepare_data(make_data(row_count))
+
+    worker_counts = sorted({1, *range(2, max_workers + 1, 2), max_workers})
+    baseline = None
+    digests = set()
+    with tempfile.TemporaryDirectory() as output_dir:
+        for workers in [1] + worker_counts:
+            generator.render_workers = workers if workers > 1 else None
+            start = time.perf_counter()
+            generator._generate_index_page(data, FileSystemSink(output_dir), indices)
+            elapsed = time.perf_counter() - start
+
+            # 比對時略過每次不同的更新時間
+            with open(os.path.join(output_dir, "index.html"), "rb") as f:
+                content = UPDATED_AT.sub(b"", f.read())
+            digests.add(hashlib.sha1(content).hexdigest())
+            if baseline is None:
+                # 第一次為暖身
+                baseline = 0.0
+                continue
+            if not baseline:
+                baseline = elapsed
+            print(
+                f"{workers} 個行程: {row_count} 行，共 {elapsed * 1000:.0f} ms，"
+                f"加速 {baseline / elapsed:.2f} 倍"
+            )
+
+    print("輸出一致" if len(digests) == 1 else "錯誤: 輸出不一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+個人資料遮蔽效能測試 - 量測 10 萬行表格中每個儲存格的遮蔽成本
+
+使用方式:
+    poetry run python benchmarks/pii_scrubber.py [行數]
+"""
+import os
+import random
+import sys
+import time
+
+# 確保項目根目錄在搜索路徑中
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.models import SheetData
+from src.domain.pii import PiiScrubber
+
+HEADERS = ["時間戳記", "作者名", "作品連結", "類別", "作品標題", "備註"]
+CATEGORIES = ["小說", "詩歌", "散文", "漫畫"]
+NOTES = [
+    "",
+    "謝謝主辦單位",
+    "有問題請寄信到 writer{0}@example.com",
+    "聯絡電話 0912-{0:03d}-678",
+    "第二次投稿，內容有修改",
+]
+
+
+def make_data(row_count: int) -> SheetData:
+    """產生模擬的投稿資料，備註欄位混入少量個人資料"""
+    rng = random.Random(0)
+    rows = []
+    for i in range(row_count):
+        rows.append(
+            [
+                f"2023/{i % 12 + 1}/{i % 28 + 1} 下午 {i % 12 + 1:02d}:30:45",
+                f"作者{i % 5000}",
+                f"https://example.com/works/{i}",
+                rng.choice(CATEGORIES),
+                f"作品標題 {i}",
+                rng.choice(NOTES).format(i % 1000),
+            ]
+        )
+    return SheetData(headers=HEADERS, rows=rows)
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    data = make_data(row_count)
+    cell_count = row_count * len(HEADERS)
+
+    for label in ("首次建置（無快取）", "重新建置（快取命中）"):
+        if label.startswith("首次"):
+            scrubber = PiiScrubber(cache_size=row_count * len(HEADERS))
+        start = time.perf_counter()
+        scrubber.scrub_data(data, skip_columns=[2])
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label}: {row_count} 行 / {cell_count} 格，"
+            f"共 {elapsed * 1000:.0f} ms，每格 {elapsed / cell_count * 1e9:.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
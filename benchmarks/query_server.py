@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+查詢伺服器負載測試 - 以多個用戶端行程持續送出首頁查詢，量測每秒請求數與延遲
+
+查詢條件由類別、關鍵字與頁碼組合而成，依冪次分布挑選（少數熱門查詢佔大多數請求），
+用戶端使用持續連線並帶上 Accept-Encoding: gzip；部分請求帶上前一次的 ETag。
+
+使用方式:
+    poetry run python benchmarks/query_server.py [行數] [用戶端數] [秒數]
+"""
+import http.client
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import urlencode
+
+# 確保項目根目錄在搜索路徑中
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.application.html_generator import HtmlGenerator
+from src.application.query_server import QueryServer, QueryViews
+from src.domain.models import SheetData
+
+HEADERS = ["時間戳記", "作者名", "作品連結", "類別", "作品標題"]
+CATEGORIES = ["小說", "詩歌", "散文", "漫畫"]
+WORDS = ["春天", "海", "夜晚", "島嶼", "自由", "風", "光", "山"]
+
+
+def make_data(row_count: int) -> SheetData:
+    """產生模擬的投稿資料"""
+    rng = random.Random(0)
+    rows = []
+    for i in range(row_count):
+        rows.append(
+            [
+                f"2023/{i % 12 + 1}/{i % 28 + 1} 下午 {i % 12 + 1:02d}:30:45",
+                f"作者{i % 5000}",
+                f"https://example.com/works/{i}",
+                rng.choice(CATEGORIES),
+                f"{''.join(rng.sample(WORDS, 2))} {i}",
+            ]
+        )
+    return SheetData(headers=HEADERS, rows=rows)
+
+
+def make_paths() -> List[str]:
+    """所有可能的查詢網址，依熱門程度排序"""
+    paths = []
+    for page in range(1, 6):
+        for category in [""] + CATEGORIES:
+            for word in [""] + WORDS:
+                params = {"category": category, "q": word, "page": page}
+                query = urlencode({k: v for k, v in params.items() if v})
+                paths.append("/?" + query)
+    return paths
+
+
+def run_client(port: int, seconds: float, seed: int) -> Tuple[List[float], int]:
+    """
+    持續送出請求直到時間結束
+
+    Returns:
+        (每個請求的延遲秒數, 304 回應數)
+    """
+    rng = random.Random(seed)
+    paths = make_paths()
+    weights = [1 / (rank + 1) for rank in range(len(paths))]
+    etags: Dict[str, str] = {}
+    latencies = []
+    not_modified = 0
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        path = rng.choices(paths, weights)[0]
+        headers = {"Accept-Encoding": "gzip"}
+        if path in etags and rng.random() < 0.3:
+            headers["If-None-Match"] = etags[path]
+        start = time.perf_counter()
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status == 304:
+            not_modified += 1
+        elif response.status != 200:
+            raise RuntimeError(f"{path}: {response.status}")
+        etags[path] = response.getheader("ETag", "")
+    conn.close()
+    return latencies, not_modified
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+
+    views = QueryViews(HtmlGenerator())
+    start = time.perf_counter()
+    views.update(make_data(row_count))
+    print(f"載入 {row_count} 行並建立索引: {(time.perf_counter() - start):.2f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = QueryServer(views, directory, port=0)
+        server.start()
+        port = server.httpd.server_address[1]
+        try:
+            with ProcessPoolExecutor(max_workers=clients) as executor:
+                results = list(
+                    executor.map(
+                        run_client,
+                        [port] * clients,
+                        [seconds] * clients,
+                        range(clients),
+                    )
+                )
+        finally:
+            server.stop()
+
+    latencies = sorted(latency for result, _ in results for latency in result)
+    not_modified = sum(count for _, count in results)
+    info = views.cache_info()
+    print(
+        f"{clients} 個用戶端 {seconds:.0f} 秒: {len(latencies)} 個請求，"
+        f"{len(latencies) / seconds:.0f} 請求/秒（其中 304: {not_modified}）"
+    )
+    print(
+        f"延遲 p50 {latencies[len(latencies) // 2] * 1000:.2f} ms，"
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms"
+    )
+    print(f"快取: 命中 {info.hits}，渲染 {info.misses}，保存 {info.currsize}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Google Sheets 擷取效能測試 - 以本機的模擬 API 伺服器量測 SheetService
+的延遲、傳輸量與配額錯誤
+
+依序量測：
+1. 單一用戶端擷取整個工作表：延遲、每次擷取的請求數與傳輸量（gzip 前後）
+2. 只讀取 Drive 中繼資料（判斷資料是否變更）的成本
+3. 多個用戶端同時擷取的總處理量
+4. 每分鐘請求數上限下，擷取在第幾次遇到 429 配額錯誤
+
+使用方式:
+    poetry run python benchmarks/sheets_fetch.py [行數] [用戶端數] [延遲毫秒]
+
+只啟動模擬伺服器（之後以 SHEETS_API_BASE_URL=http://127.0.0.1:<埠號>
+與 SPREADSHEET_ID=fake 執行 src/main.py）:
+    poetry run python benchmarks/sheets_fetch.py serve [行數] [埠號]
+"""
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+# 確保項目根目錄在搜索路徑中
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gspread.exceptions import APIError
+
+from src.application.sheet_service import SheetService
+from src.infrastructure.fake_sheets_api import (
+    FakeSheetsApi,
+    FakeSheetsServer,
+    synthetic_values,
+)
+
+SPREADSHEET_ID = "fake"
+SHEET_NAME = "Sheet1"
+FETCHES = 5
+
+
+def fetch_times(base_url: str, count: int) -> List[float]:
+    """以一個 SheetService 連續擷取數次，傳回每次的秒數"""
+    service = SheetService(api_base_url=base_url)
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        service.get_sheet_data(SPREADSHEET_ID, SHEET_NAME)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def serve(row_count: int, port: int) -> None:
+    """只啟動模擬伺服器，直到按下 Ctrl+C"""
+    api = FakeSheetsApi()
+    api.add_spreadsheet(SPREADSHEET_ID, {SHEET_NAME: synthetic_values(row_count)})
+    server = FakeSheetsServer(api, port=port)
+    print(f"模擬 API 伺服器: {server.url}（試算表 ID: {SPREADSHEET_ID}）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        row_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+        serve(row_count, int(sys.argv[3]) if len(sys.argv) > 3 else 8800)
+        return
+
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    latency = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.1
+
+    api = FakeSheetsApi()
+    api.add_spreadsheet(SPREADSHEET_ID, {SHEET_NAME: synthetic_values(row_count)})
+
+    with FakeSheetsServer(api) as server:
+        # 暖身：伺服器快取序列化與壓縮後的回應
+        fetch_times(server.url, 1)
+        api.latency = latency
+
+        api.reset_stats()
+        times = fetch_times(server.url, FETCHES)
+        stats = api.stats
+        requests_per_fetch = sum(stats.requests.values()) / FETCHES
+        print(
+            f"單一用戶端: {row_count} 行，延遲 {latency * 1000:.0f} ms，"
+            f"擷取中位數 {statistics.median(times) * 1000:.0f} ms，"
+            f"每次 {requests_per_fetch:.0f} 個請求"
+        )
+        print(
+            f"每次傳輸 {stats.bytes_sent / FETCHES / 1024:.0f} KiB"
+            f"（未壓縮 {stats.raw_bytes / FETCHES / 1024:.0f} KiB）"
+        )
+
+        service = SheetService(api_base_url=server.url)
+        service.get_last_updated(SPREADSHEET_ID)
+        api.reset_stats()
+        start = time.perf_counter()
+        for _ in range(FETCHES):
+            service.get_last_updated(SPREADSHEET_ID)
+        elapsed = (time.perf_counter() - start) / FETCHES
+        print(
+            f"只讀取最後修改時間: {elapsed * 1000:.0f} ms，"
+            f"傳輸 {api.stats.bytes_sent / FETCHES:.0f} bytes"
+        )
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            results = list(
+                executor.map(fetch_times, [server.url] * clients, [3] * clients)
+            )
+        elapsed = time.perf_counter() - start
+        all_times = [t for result in results for t in result]
+        print(
+            f"{clients} 個用戶端同時擷取: {len(all_times) / elapsed:.1f} 次/秒，"
+            f"擷取中位數 {statistics.median(all_times) * 1000:.0f} ms"
+        )
+
+        api.latency = 0.0
+        api.requests_per_minute = 10
+        api.reset_stats()
+        service = SheetService(api_base_url=server.url)
+        fetches = 0
+        try:
+            while fetches < 100:
+                service.get_sheet_data(SPREADSHEET_ID, SHEET_NAME)
+                fetches += 1
+        except APIError as e:
+            print(
+                f"每分鐘 {api.requests_per_minute} 個請求的配額: "
+                f"{fetches} 次擷取成功後收到 {e.code} 錯誤"
+                f"（共 {sum(api.stats.requests.values())} 個請求）"
+            )
+
+
+if __name__ == "__main__":
+    main()
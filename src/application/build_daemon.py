@@ -0,0 +1,189 @@
+"""
+建置常駐程式 - 在同一個程序中持續輪詢資料來源，資料變更時才重新產生網站
+
+SheetService 的授權與 Jinja 模板都只在啟動時建立一次。每次輪詢先比對資料來源
+的版本標記（例如 Google Drive 的最後修改時間），標記不同時才擷取資料，再以內容
+雜湊確認資料確實變更。網站先產生到新的建置目錄，完成後以替換符號連結的方式
+原子地切換輸出目錄，讀取端不會看到寫到一半的網站。
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+
+from src.application.html_generator import HtmlGenerator
+from src.domain.models import SheetData
+from src.infrastructure.data_sources import DataSource
+
+
+def swap_directory(target: str, link_path: str) -> None:
+    """
+    將 link_path 原子地切換為指向 target 的符號連結
+
+    Args:
+        target: 新的建置目錄
+        link_path: 對外提供的輸出目錄路徑
+    """
+    link_path = os.path.abspath(link_path)
+    relative_target = os.path.relpath(
+        os.path.abspath(target), os.path.dirname(link_path)
+    )
+
+    tmp_link = f"{link_path}.tmp-link"
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(relative_target, tmp_link)
+
+    old_dir = None
+    if os.path.isdir(link_path) and not os.path.islink(link_path):
+        # 輸出目錄原本是一般目錄（例如一次性建置的結果）。符號連結無法直接取代
+        # 目錄，先將舊目錄改名移開，連結就位後才刪除，避免刪除期間沒有網站
+        old_dir = f"{link_path}.old"
+        if os.path.lexists(old_dir):
+            shutil.rmtree(old_dir)
+        os.rename(link_path, old_dir)
+
+    os.replace(tmp_link, link_path)
+    if old_dir is not None:
+        shutil.rmtree(old_dir)
+
+
+def _data_digest(data: SheetData) -> str:
+    """計算表格內容的雜湊值"""
+    content = json.dumps([data.headers, data.rows], ensure_ascii=False)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class BuildDaemon:
+    """輪詢資料來源並在資料變更時重新產生網站"""
+
+    def __init__(
+        self,
+        source: DataSource,
+        html_generator: HtmlGenerator,
+        output_dir: str,
+        interval: float = 60,
+        max_interval: float = 600,
+        keep_builds: int = 2,
+        on_change: Optional[Callable[[SheetData], None]] = None,
+    ) -> None:
+        """
+        初始化常駐程式
+
+        Args:
+            source: 資料來源
+            html_generator: HTML 生成器
+            output_dir: 輸出目錄路徑（會被替換為指向最新建置的符號連結）
+            interval: 基本輪詢間隔（秒）
+            max_interval: 沒有變更時輪詢間隔的上限（秒）
+            keep_builds: 保留的建置目錄數量
+            on_change: 資料變更且網站發布成功後呼叫的函式（例如記錄歷史紀錄）
+        """
+        self.source = source
+        self.html_generator = html_generator
+        self.output_dir = output_dir
+        self.builds_dir = f"{os.path.abspath(output_dir)}.builds"
+        self.interval = interval
+        self.max_interval = max(interval, max_interval)
+        self.keep_builds = max(1, keep_builds)
+        self.on_change = on_change
+
+        self._token: Optional[str] = None
+        self._digest: Optional[str] = None
+        self._build_count = 0
+        self._stop_event = threading.Event()
+
+    def poll_once(self) -> bool:
+        """
+        檢查一次資料來源，資料變更時重新產生網站
+
+        Returns:
+            是否重新產生了網站
+        """
+        token = self.source.change_token()
+        if token is not None and token == self._token:
+            return False
+
+        data = self.source.load()
+        digest = _data_digest(data)
+        if digest == self._digest:
+            self._token = token
+            return False
+
+        self.publish(data)
+        # 網站發布成功後才記錄版本標記並通知，建置失敗時下次輪詢會重試，
+        # 重試時也不會重複通知同一份資料
+        self._token = token
+        self._digest = digest
+        if self.on_change is not None:
+            self.on_change(data)
+        return True
+
+    def publish(self, data: SheetData) -> str:
+        """
+        將網站產生到新的建置目錄，再原子地切換輸出目錄
+
+        Args:
+            data: 表格資料
+
+        Returns:
+            新的建置目錄路徑
+        """
+        self._build_count += 1
+        build_name = (
+            f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{self._build_count:04d}"
+        )
+        build_dir = os.path.join(self.builds_dir, build_name)
+
+        self.html_generator.generate_site(data, build_dir)
+        swap_directory(build_dir, self.output_dir)
+        self._remove_old_builds()
+        return build_dir
+
+    def _remove_old_builds(self) -> None:
+        """只保留最近的幾個建置目錄，其餘刪除"""
+        builds = sorted(os.listdir(self.builds_dir))
+        for name in builds[: -self.keep_builds]:
+            shutil.rmtree(os.path.join(self.builds_dir, name), ignore_errors=True)
+
+    def next_interval(self, current: float, changed: bool) -> float:
+        """
+        計算下一次輪詢前的等待時間
+
+        有變更時回到基本間隔；沒有變更時加倍，直到上限。
+
+        Args:
+            current: 目前的等待時間
+            changed: 本次輪詢是否有變更
+
+        Returns:
+            下一次的等待時間（秒）
+        """
+        if changed:
+            return self.interval
+        return min(current * 2, self.max_interval)
+
+    def run(self) -> None:
+        """持續輪詢直到呼叫 stop()"""
+        delay = self.interval
+        while not self._stop_event.is_set():
+            try:
+                changed = self.poll_once()
+            except Exception as e:
+                # 網路錯誤等暫時性問題不應終止常駐程式，退避後重試
+                print(f"輪詢失敗: {e}")
+                changed = False
+            else:
+                if changed:
+                    print(f"資料已變更，網站已重新產生於 {self.output_dir}")
+
+            delay = self.next_interval(delay, changed)
+            self._stop_event.wait(delay)
+
+    def stop(self) -> None:
+        """要求 run() 在目前的輪詢結束後停止"""
+        self._stop_event.set()
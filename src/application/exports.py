@@ -0,0 +1,211 @@
+"""
+資料匯出 - 將公開的表格資料輸出為 CSV、NDJSON 與 JSON 下載檔
+
+匯出內容為已過濾敏感欄位並遮蔽個人資料後的資料。各格式都直接從 SheetData 的
+資料行逐行寫出，不先建立整份資料的字典列表，記憶體用量與資料行數無關；
+可選擇以 gzip 壓縮輸出。
+"""
+
+import csv
+import gzip
+import io
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, Callable, Dict, Iterator, List, Sequence, TextIO, Tuple, Union
+
+from src.domain.models import SheetData
+from src.infrastructure.output_sink import OutputSink
+
+# 支援的格式 -> (副檔名, 顯示名稱)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "csv": (".csv", "CSV"),
+    "ndjson": (".ndjson", "NDJSON"),
+    "json": (".json", "JSON"),
+}
+
+# 匯出檔的檔名（不含副檔名）
+EXPORT_BASENAME = "works"
+
+# 以這些字元開頭的儲存格在試算表軟體中會被當作公式
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+@dataclass(frozen=True)
+class ExportFile:
+    """一個匯出檔"""
+
+    path: str
+    format: str
+    label: str
+
+
+def unique_headers(headers: Sequence[str]) -> List[str]:
+    """
+    取得 NDJSON / JSON 物件使用的欄位名稱，空白或重複的表頭會另外命名
+
+    Args:
+        headers: 表頭列表
+
+    Returns:
+        不重複的欄位名稱
+    """
+    names: List[str] = []
+    seen = set()
+    for i, header in enumerate(headers):
+        name = header.strip() or f"欄位{i + 1}"
+        candidate = name
+        suffix = 2
+        while candidate in seen:
+            candidate = f"{name} ({suffix})"
+            suffix += 1
+        seen.add(candidate)
+        names.append(candidate)
+    return names
+
+
+def _iter_rows(data: SheetData) -> Iterator[List[str]]:
+    """逐行產生與表頭等寬的資料行"""
+    width = len(data.headers)
+    for row in data.rows:
+        if len(row) == width:
+            yield row
+        elif len(row) < width:
+            yield row + [""] * (width - len(row))
+        else:
+            yield row[:width]
+
+
+def _escape_formula(value: str) -> str:
+    """在可能被當作公式的儲存格前加上 '，讓試算表軟體視為文字"""
+    return f"'{value}" if value.startswith(_FORMULA_PREFIXES) else value
+
+
+def write_csv(data: SheetData, f: TextIO) -> None:
+    """
+    以 CSV 格式逐行寫出資料
+
+    CSV 通常以 Excel 或 Google 試算表開啟，開頭為 =、+、-、@ 的儲存格會加上 '
+    以免被執行為公式；NDJSON 與 JSON 保留原始內容。
+    """
+    writer = csv.writer(f)
+    writer.writerow([_escape_formula(header) for header in data.headers])
+    writer.writerows(
+        [_escape_formula(value) for value in row] for row in _iter_rows(data)
+    )
+
+
+def write_ndjson(data: SheetData, f: TextIO) -> None:
+    """以 NDJSON 格式逐行寫出資料，每行一個物件"""
+    names = unique_headers(data.headers)
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    f.writelines(
+        encode(dict(zip(names, row, strict=True))) + "\n" for row in _iter_rows(data)
+    )
+
+
+def write_json(data: SheetData, f: TextIO) -> None:
+    """以 JSON 陣列格式逐項寫出資料，每個項目一個物件"""
+    names = unique_headers(data.headers)
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    f.write("[")
+    for i, row in enumerate(_iter_rows(data)):
+        f.write(",\n" if i else "\n")
+        f.write(encode(dict(zip(names, row, strict=True))))
+    f.write("\n]\n")
+
+
+_WRITERS: Dict[str, Callable[[SheetData, TextIO], None]] = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+    "json": write_json,
+}
+
+
+class DataExporter:
+    """公開資料的匯出器"""
+
+    def __init__(
+        self,
+        formats: Sequence[str] = tuple(EXPORT_FORMATS),
+        compress: bool = False,
+        basename: str = EXPORT_BASENAME,
+    ) -> None:
+        """
+        初始化匯出器
+
+        Args:
+            formats: 要輸出的格式（csv、ndjson、json）
+            compress: 是否以 gzip 壓縮，檔名會加上 .gz
+            basename: 匯出檔的檔名（不含副檔名）
+        """
+        unknown = [name for name in formats if name not in EXPORT_FORMATS]
+        if unknown:
+            raise ValueError(
+                f"不支援的匯出格式: {', '.join(unknown)}，"
+                f"可用的格式: {', '.join(EXPORT_FORMATS)}"
+            )
+        self.formats = list(dict.fromkeys(formats))
+        self.compress = compress
+        self.basename = basename
+
+    def files(self) -> List[ExportFile]:
+        """
+        取得所有匯出檔
+
+        Returns:
+            匯出檔列表，依格式設定的順序
+        """
+        files = []
+        for name in self.formats:
+            extension, label = EXPORT_FORMATS[name]
+            path = self.basename + extension
+            if self.compress:
+                path += ".gz"
+                label += " (gzip)"
+            files.append(ExportFile(path=path, format=name, label=label))
+        return files
+
+    def export(self, data: SheetData, sink: OutputSink) -> List[str]:
+        """
+        將資料寫出為所有格式
+
+        Args:
+            data: 已過濾敏感資料的表格資料
+            sink: 輸出目標
+
+        Returns:
+            寫出的檔案路徑（相對於網站根目錄）
+        """
+        for export_file in self.files():
+            # CSV 加上 BOM，Excel 才會以 UTF-8 開啟中文內容
+            encoding = "utf-8-sig" if export_file.format == "csv" else "utf-8"
+            with self._open(sink, export_file.path, encoding) as f:
+                _WRITERS[export_file.format](data, f)
+        return [export_file.path for export_file in self.files()]
+
+    @contextmanager
+    def _open(self, sink: OutputSink, path: str, encoding: str) -> Iterator[TextIO]:
+        """開啟匯出檔，壓縮時在寫入輸出目標的同時以 gzip 壓縮"""
+        with sink.open(path) as raw:
+            if self.compress:
+                # mtime 固定為 0，內容相同時壓縮檔也相同
+                with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as compressed:
+                    with _text_stream(compressed, encoding) as f:
+                        yield f
+            else:
+                with _text_stream(raw, encoding) as f:
+                    yield f
+
+
+@contextmanager
+def _text_stream(
+    raw: Union[IO[bytes], gzip.GzipFile], encoding: str
+) -> Iterator[TextIO]:
+    """以文字方式寫入二進位檔案，不轉換換行字元（CSV 依 RFC 4180 使用 CRLF）"""
+    text = io.TextIOWrapper(raw, encoding=encoding, newline="")
+    try:
+        yield text
+    finally:
+        # 寫出緩衝的內容，但不關閉底層的檔案
+        text.detach()
@@ -0,0 +1,365 @@
+"""
+訂閱源生成器 - 產生 Atom、JSON Feed 與 sitemap.xml
+
+訂閱源只保留最新的若干筆項目，並將它們連同已處理的資料行數保存在一個小型狀態檔中。
+之後的建置只需要處理新增的資料行，把新項目加到最前面；只有在資料被刪除或重新排序時
+才會從頭重建。XML 以 XMLGenerator 串流寫出。
+"""
+
+import hashlib
+import io
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from xml.sax.saxutils import XMLGenerator
+from xml.sax.xmlreader import AttributesImpl
+
+import pytz
+
+from src.domain.models import SheetData, work_title
+from src.domain.timestamps import TimestampParser
+from src.infrastructure.output_sink import OutputSink, as_output_sink
+
+# 狀態檔格式版本，格式變更時遞增以強制重建
+STATE_VERSION = 2
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+@dataclass
+class FeedEntry:
+    """訂閱源項目"""
+
+    id: str
+    title: str
+    url: str
+    author: str
+    category: str
+    published: str
+
+
+class FeedGenerator:
+    """Atom / JSON Feed / sitemap 生成器"""
+
+    def __init__(
+        self,
+        site_url: str,
+        title: str,
+        state_path: Optional[str] = None,
+        max_items: int = 50,
+        timezone: str = "Asia/Taipei",
+    ) -> None:
+        """
+        初始化生成器
+
+        Args:
+            site_url: 網站網址
+            title: 訂閱源標題
+            state_path: 狀態檔路徑，未設定時每次都從頭產生
+            max_items: 訂閱源保留的最大項目數
+            timezone: 時間戳記所在的時區
+        """
+        self.site_url = site_url.rstrip("/")
+        self.title = title
+        self.state_path = state_path
+        self.max_items = max_items
+        self.tz = pytz.timezone(timezone)
+        self.timestamp_parser = TimestampParser(timezone)
+
+    def generate(
+        self,
+        data: SheetData,
+        indices: Dict[str, int],
+        output_dir: Union[str, OutputSink],
+        pages: Sequence[str] = ("",),
+        image_for: Optional[Callable[[FeedEntry], Optional[str]]] = None,
+    ) -> List[FeedEntry]:
+        """
+        產生 feed.xml、feed.json 與 sitemap.xml
+
+        Args:
+            data: 已過濾敏感資料的表格資料
+            indices: 重要欄位索引
+            output_dir: 輸出目錄路徑，或輸出目標
+            pages: 要列入 sitemap 的頁面路徑（相對於網站根目錄）
+            image_for: 取得項目圖片路徑（相對於網站根目錄）的函式，
+                圖片會寫入 JSON Feed 項目的 image 欄位
+
+        Returns:
+            訂閱源中的項目（由新到舊）
+        """
+        entries = self._update_entries(data, indices)
+        sink = as_output_sink(output_dir)
+
+        updated = entries[0].published if entries else self._now()
+        with sink.open_text("feed.xml") as f:
+            self._write_atom(entries, updated, f)
+        with sink.open_text("feed.json") as f:
+            self._write_json_feed(entries, f, image_for)
+        with sink.open_text("sitemap.xml") as f:
+            self._write_sitemap(pages, updated, f)
+
+        return entries
+
+    def _update_entries(
+        self, data: SheetData, indices: Dict[str, int]
+    ) -> List[FeedEntry]:
+        """
+        依狀態檔增量更新項目列表
+
+        Args:
+            data: 表格資料
+            indices: 重要欄位索引
+
+        Returns:
+            最新的項目列表（由新到舊）
+        """
+        # 網址與標題會寫入項目 ID 與訂閱源，變更時需要從頭產生
+        signature = hashlib.sha1(
+            json.dumps(
+                [data.headers, self.max_items, self.site_url, self.title],
+                ensure_ascii=False,
+            ).encode("utf-8")
+        ).hexdigest()
+        state = self._load_state()
+
+        row_count = state.get("row_count", 0) if state else 0
+        window = state.get("window", []) if state else []
+        incremental = (
+            state is not None
+            and state.get("signature") == signature
+            and 0 < row_count <= data.row_count
+            and len(window) == len(state.get("entries", []))
+            and all(isinstance(i, int) and 0 <= i < row_count for i in window)
+            # 保留項目對應的資料行被修改時，沿用的項目會過時
+            and self._window_hash(data, window) == state.get("window_hash")
+        )
+
+        if incremental and state is not None:
+            # 只處理上次之後新增的資料行，並加到最前面
+            retained = [
+                (FeedEntry(**entry), i)
+                for entry, i in zip(state["entries"], window, strict=True)
+            ]
+            start = row_count
+        else:
+            retained = []
+            start = 0
+        new_rows = data.rows[start:]
+
+        timestamp_index = indices.get("timestamp", -1)
+        if timestamp_index >= 0:
+            self.timestamp_parser.detect(
+                row[timestamp_index] for row in new_rows if timestamp_index < len(row)
+            )
+        new_entries = [
+            (self._to_entry(row, indices), i) for i, row in enumerate(new_rows, start)
+        ]
+        new_entries.sort(key=lambda pair: pair[0].published, reverse=True)
+        retained = (new_entries + retained)[: self.max_items]
+        entries = [entry for entry, _ in retained]
+        window = [i for _, i in retained]
+
+        self._save_state(
+            {
+                "version": STATE_VERSION,
+                "signature": signature,
+                "row_count": data.row_count,
+                "window": window,
+                "window_hash": self._window_hash(data, window),
+                "entries": [asdict(entry) for entry in entries],
+            }
+        )
+
+        return entries
+
+    def _load_state(self) -> Optional[dict]:
+        """讀取狀態檔，不存在或格式不符時回傳 None"""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return None
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return None
+        return state
+
+    def _save_state(self, state: dict) -> None:
+        """寫入狀態檔"""
+        if not self.state_path:
+            return
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _cell(row: List[str], indices: Dict[str, int], key: str) -> str:
+        index = indices.get(key, -1)
+        return row[index] if 0 <= index < len(row) else ""
+
+    @staticmethod
+    def _window_hash(data: SheetData, window: List[int]) -> str:
+        """計算保留項目對應資料行的雜湊值"""
+        rows = [data.rows[i] for i in window]
+        return hashlib.sha1(
+            json.dumps(rows, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    def _row_key(self, row: List[str], indices: Dict[str, int]) -> str:
+        """以時間戳記與連結作為資料行的識別鍵"""
+        timestamp = self._cell(row, indices, "timestamp")
+        link = self._cell(row, indices, "link")
+        if timestamp or link:
+            return f"{timestamp}\x1f{link}"
+        return "\x1f".join(row)
+
+    def _to_entry(self, row: List[str], indices: Dict[str, int]) -> FeedEntry:
+        """
+        將資料行轉換為訂閱源項目
+
+        Args:
+            row: 資料行
+            indices: 重要欄位索引
+
+        Returns:
+            FeedEntry: 訂閱源項目
+        """
+        author = self._cell(row, indices, "author")
+        title = work_title(self._cell(row, indices, "title"), author)
+
+        url = self._cell(row, indices, "link")
+        if url and not (url.startswith("http://") or url.startswith("https://")):
+            url = "https://" + url
+
+        digest = hashlib.sha1(self._row_key(row, indices).encode("utf-8")).hexdigest()
+        return FeedEntry(
+            id=f"{self.site_url}/#entry-{digest[:16]}",
+            title=title,
+            url=url or f"{self.site_url}/",
+            author=author,
+            category=self._cell(row, indices, "category"),
+            published=self._parse_timestamp(self._cell(row, indices, "timestamp")),
+        )
+
+    def _parse_timestamp(self, value: str) -> str:
+        """
+        將時間戳記轉換為 RFC 3339 格式
+
+        Args:
+            value: 時間戳記字串
+
+        Returns:
+            RFC 3339 格式的時間，無法解析時為 1970-01-01
+        """
+        moment = self.timestamp_parser.parse(value)
+        if moment is None:
+            return "1970-01-01T00:00:00+00:00"
+        return moment.isoformat()
+
+    def _now(self) -> str:
+        return datetime.now(self.tz).replace(microsecond=0).isoformat()
+
+    def _write_atom(
+        self, entries: List[FeedEntry], updated: str, f: io.TextIOWrapper
+    ) -> None:
+        """以串流方式寫出 Atom 訂閱源"""
+        xml = XMLGenerator(f, encoding="utf-8", short_empty_elements=True)
+        xml.startDocument()
+        xml.startElement("feed", AttributesImpl({"xmlns": _ATOM_NS}))
+        _text_element(xml, "title", self.title)
+        _text_element(xml, "id", f"{self.site_url}/")
+        _text_element(xml, "updated", updated)
+        _empty_element(xml, "link", {"href": f"{self.site_url}/"})
+        _empty_element(
+            xml, "link", {"rel": "self", "href": f"{self.site_url}/feed.xml"}
+        )
+
+        for entry in entries:
+            xml.startElement("entry", AttributesImpl({}))
+            _text_element(xml, "id", entry.id)
+            _text_element(xml, "title", entry.title)
+            _empty_element(xml, "link", {"href": entry.url})
+            _text_element(xml, "published", entry.published)
+            _text_element(xml, "updated", entry.published)
+            if entry.author:
+                xml.startElement("author", AttributesImpl({}))
+                _text_element(xml, "name", entry.author)
+                xml.endElement("author")
+            if entry.category:
+                _empty_element(xml, "category", {"term": entry.category})
+            xml.endElement("entry")
+
+        xml.endElement("feed")
+        xml.endDocument()
+
+    def _write_json_feed(
+        self,
+        entries: List[FeedEntry],
+        f: io.TextIOWrapper,
+        image_for: Optional[Callable[[FeedEntry], Optional[str]]] = None,
+    ) -> None:
+        """以串流方式逐項寫出 JSON Feed 1.1"""
+        header = {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": self.title,
+            "home_page_url": f"{self.site_url}/",
+            "feed_url": f"{self.site_url}/feed.json",
+            "language": "zh-TW",
+        }
+        # 先寫出表頭欄位，再逐項寫出 items
+        f.write(json.dumps(header, ensure_ascii=False)[:-1])
+        f.write(', "items": [')
+        for i, entry in enumerate(entries):
+            item: dict = {
+                "id": entry.id,
+                "url": entry.url,
+                "title": entry.title,
+                "content_text": entry.title,
+                "date_published": entry.published,
+            }
+            if entry.author:
+                item["authors"] = [{"name": entry.author}]
+            if entry.category:
+                item["tags"] = [entry.category]
+            image = image_for(entry) if image_for else None
+            if image:
+                item["image"] = f"{self.site_url}/{image}"
+            if i:
+                f.write(", ")
+            f.write(json.dumps(item, ensure_ascii=False))
+        f.write("]}\n")
+
+    def _write_sitemap(
+        self, pages: Sequence[str], updated: str, f: io.TextIOWrapper
+    ) -> None:
+        """以串流方式寫出 sitemap.xml"""
+        xml = XMLGenerator(f, encoding="utf-8", short_empty_elements=True)
+        xml.startDocument()
+        xml.startElement("urlset", AttributesImpl({"xmlns": _SITEMAP_NS}))
+        for page in pages:
+            xml.startElement("url", AttributesImpl({}))
+            _text_element(xml, "loc", f"{self.site_url}/{page}")
+            _text_element(xml, "lastmod", updated)
+            xml.endElement("url")
+        xml.endElement("urlset")
+        xml.endDocument()
+
+
+def _text_element(xml: XMLGenerator, name: str, text: str) -> None:
+    xml.startElement(name, AttributesImpl({}))
+    xml.characters(text)
+    xml.endElement(name)
+
+
+def _empty_element(xml: XMLGenerator, name: str, attrs: Dict[str, str]) -> None:
+    xml.startElement(name, AttributesImpl(attrs))
+    xml.endElement(name)
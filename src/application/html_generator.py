@@ -2,43 +2,304 @@
 HTML 生成器 - 負責產生靜態網站檔案
 """
 
+import hashlib
+import json
 import os
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain
+from multiprocessing import get_all_start_methods, get_context
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import pytz
-from jinja2 import Environment, FileSystemLoader
-
-from src.domain.models import SheetData
+from jinja2 import Environment, Template
+
+from src.application.exports import DataExporter
+from src.application.feed_generator import FeedEntry, FeedGenerator
+from src.application.icons import IconSprite, IconTemplateLoader, icon_html
+from src.application.image_variants import ImageVariant, ImageVariantBuilder
+from src.application.og_images import OgCard, OgImageGenerator, cards_from_data
+from src.application.service_worker import (
+    MANIFEST_PATH,
+    PRECACHE_SUFFIXES,
+    SERVICE_WORKER_PATH,
+    PrecacheEntry,
+    build_precache_manifest,
+    render_service_worker,
+)
+from src.domain.dedupe import KEEP_EARLIEST, dedupe_submissions
+from src.domain.facets import FacetValue, build_facets, facets_to_json
+from src.domain.models import SheetData, map_important_indices
+from src.domain.pii import PiiScrubber
+from src.domain.sort_orders import build_sort_orders
+from src.domain.stats import WEEKDAY_LABELS, SiteStats, build_stats
+from src.domain.timestamps import TimestampParser
+from src.infrastructure.link_checker import normalize_link
+from src.infrastructure.output_sink import OutputSink, as_output_sink
+
+# 網站標題與副標題
+SITE_TITLE = "「筆桿接力罷免到底」創作接力"
+SITE_SUBTITLE = "作品連結目錄"
+
+# 預設的網站 URL
+DEFAULT_SITE_URL = "https://pen-power-recall-website-2025.pages.dev"
+
+
+# 分段渲染時表格列在頁面外框中的插入位置
+_ROWS_MARKER = "\x00rows\x00"
+
+# 分段渲染的狀態（表格列模板, 模板變數），在 fork 前設定，工作行程直接沿用
+_chunk_state: Optional[Tuple[Template, dict]] = None
+
+
+def _render_rows_chunk(start: int, stop: int) -> str:
+    """
+    在工作行程中渲染一段連續的表格列
+
+    Args:
+        start: 第一個資料行編號
+        stop: 最後一個資料行編號加一
+
+    Returns:
+        該區段的 HTML
+    """
+    if _chunk_state is None:
+        raise RuntimeError("分段渲染的狀態尚未設定")
+    template, row_context = _chunk_state
+    return template.render(
+        row_context, rows=row_context["rows"][start:stop], row_offset=start
+    )
+
+
+def _content_hash(content: str) -> str:
+    """計算文字內容的指紋"""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:10]
 
 
 class HtmlGenerator:
     """HTML 生成器類別"""
 
-    def __init__(self) -> None:
-        """初始化 Jinja2 模板環境"""
+    def __init__(
+        self,
+        feed_state_path: Optional[str] = None,
+        duplicate_policy: Optional[str] = KEEP_EARLIEST,
+    ) -> None:
+        """
+        初始化 Jinja2 模板環境
+
+        Args:
+            feed_state_path: 訂閱源狀態檔路徑，設定後訂閱源只會處理新增的資料
+            duplicate_policy: 合併重複投稿時的保留規則（"earliest" 或 "latest"），
+                None 表示不合併
+        """
         # 設定模板目錄
         template_dir = Path(__file__).parent.parent / "presentation" / "templates"
-        self.env = Environment(loader=FileSystemLoader(template_dir))
+        self.template_dir = template_dir
+        # 模板中的 Font Awesome 圖示在載入時改寫為引用頁面內嵌的 SVG sprite
+        self.template_loader = IconTemplateLoader(template_dir)
+        self.env = Environment(loader=self.template_loader)
+        self.icon_sprite = IconSprite()
+
+        # 個人資料遮蔽器，遮蔽結果會被快取
+        self.pii_scrubber = PiiScrubber()
+
+        # 時間戳記解析器，解析結果會被快取
+        self.timestamp_parser = TimestampParser()
 
         # 自定義過濾器 - 將連結轉換為 HTML 連結
-        self.env.filters["to_link"] = self._to_link
+        self.env.filters["to_link"] = self._to_checked_link
         self.env.filters["format_date"] = self._format_date
+        self.env.globals["asset_url"] = self.asset_url
+        self.env.globals["image_variant"] = self.image_variant
 
         # 靜態資源目錄
         self.static_dir = Path(__file__).parent.parent / "presentation" / "static"
 
-    def generate_site(self, data: SheetData, output_dir: str) -> None:
+        # 設定後會產生 service worker 與預先快取清單，重複造訪時直接從快取載入
+        self.service_worker = True
+        self.service_worker_source = (
+            Path(__file__).parent.parent / "presentation" / "sw.js"
+        )
+
+        self.feed_state_path = feed_state_path
+        self.duplicate_policy = duplicate_policy
+
+        # 網站標題、副標題與網址（網址未設定時使用 SITE_URL 環境變數）
+        self.title = SITE_TITLE
+        self.subtitle = SITE_SUBTITLE
+        self.site_url: Optional[str] = None
+
+        # 連結檢查確定失效的網址，頁面上會標示出來
+        self.broken_links: Set[str] = set()
+
+        # 公開資料的下載檔（CSV、NDJSON、JSON），None 表示不產生
+        self.data_exporter: Optional[DataExporter] = DataExporter()
+
+        # 設定後會為每件作品產生 Open Graph 分享卡片
+        self.og_image_generator: Optional[OgImageGenerator] = None
+
+        # 資料行數多時分段平行渲染表格列的行程數（None 表示不分段）
+        self.render_workers: Optional[int] = None
+        # 每個行程至少渲染的資料行數，資料較少時減少行程數
+        self.render_chunk_rows = 5000
+
+        # 設定後會為靜態資源中的圖片產生縮放與重新編碼的變體
+        self.image_variant_builder: Optional[ImageVariantBuilder] = None
+
+        # 靜態資源的內容指紋（相對於網站根目錄的路徑 -> 雜湊值）
+        self._asset_versions: Dict[str, str] = {}
+        # 渲染的頁面與資料檔的內容雜湊值（相對於網站根目錄的路徑 -> 雜湊值）
+        self._page_versions: Dict[str, str] = {}
+        # 靜態資源中的圖片變體（原圖相對於網站根目錄的路徑 -> 變體列表）
+        self._image_variants: Dict[str, List[ImageVariant]] = {}
+        # 已完成準備工作的輸出目標（OutputSink.key）
+        self._prepared_output: Optional[object] = None
+
+    def generate_site(
+        self,
+        data: SheetData,
+        output_dir: Union[str, OutputSink],
+        deduplicated: bool = False,
+    ) -> None:
         """
         生成完整的靜態網站
 
         Args:
             data: 包含表頭和資料的 SheetData 物件
-            output_dir: 輸出目錄路徑
+            output_dir: 輸出目錄路徑，或輸出目標（例如封存檔）
+            deduplicated: data 是否已經過 remove_duplicates 處理
+        """
+        # 過濾敏感資料並取得欄位索引
+        filtered_data, new_indices = self.prepare_data(data, deduplicated)
+        self.generate_prepared(filtered_data, output_dir, new_indices)
+
+    def generate_prepared(
+        self,
+        filtered_data: SheetData,
+        output_dir: Union[str, OutputSink],
+        new_indices: dict,
+    ) -> None:
+        """
+        以 prepare_data 的結果生成完整的靜態網站，不再重新過濾資料
+
+        Args:
+            filtered_data: prepare_data 回傳的過濾後資料
+            output_dir: 輸出目錄路徑，或輸出目標（例如封存檔）
+            new_indices: prepare_data 回傳的欄位索引
+        """
+        sink = as_output_sink(output_dir)
+
+        # 尚未準備輸出目錄時（未事先呼叫 prepare_output）在此完成
+        if self._prepared_output != sink.key:
+            self.prepare_output(sink)
+
+        # 產生由模板渲染的頁面
+        self.render_pages(filtered_data, sink, new_indices)
+
+        # 產生資料下載檔
+        if self.data_exporter is not None:
+            self.data_exporter.export(filtered_data, sink)
+
+        # 產生訂閱源與 sitemap
+        self._generate_feeds(filtered_data, sink, new_indices)
+
+        # 最後產生 service worker，預先快取清單需要所有頁面的內容雜湊值
+        if self.service_worker:
+            self._generate_service_worker(sink)
+
+    def prepare_output(self, output_dir: Union[str, OutputSink]) -> None:
+        """
+        完成與資料無關的準備工作：編譯模板、複製靜態資源並計算內容指紋
+
+        這些工作不需要等待資料擷取，可以在擷取資料的同時於其他執行緒中執行。
+
+        Args:
+            output_dir: 輸出目錄路徑，或輸出目標
+        """
+        # 輸出目錄不存在時會被建立
+        sink = as_output_sink(output_dir)
+
+        # 預先編譯所有模板，之後的 get_template 會直接使用快取
+        for name in self.env.list_templates():
+            self.env.get_template(name)
+
+        # 複製靜態資源到輸出目錄
+        self._copy_static_files(sink)
+
+        self._prepared_output = sink.key
+
+    def asset_url(self, path: str) -> str:
+        """
+        為靜態資源網址加上內容指紋，內容改變時網址也會改變
+
+        Args:
+            path: 相對於網站根目錄的路徑，例如 static/css/style.css
+
+        Returns:
+            加上 ?v=<指紋> 的網址，沒有指紋時回傳原路徑
+        """
+        version = self._asset_versions.get(path)
+        return f"{path}?v={version}" if version else path
+
+    def remove_duplicates(self, data: SheetData) -> SheetData:
+        """
+        依 duplicate_policy 合併作品連結相同的重複投稿
+
+        Args:
+            data: 原始資料
+
+        Returns:
+            合併後的資料
+        """
+        if self.duplicate_policy is None:
+            return data
+        indices = self._map_important_indices(data)
+        return dedupe_submissions(
+            data,
+            indices["link"],
+            indices["timestamp"],
+            keep=self.duplicate_policy,
+            timestamp_parser=self.timestamp_parser,
+        )
+
+    def image_variant(
+        self, path: str, width: int, image_format: Optional[str] = None
+    ) -> Optional[ImageVariant]:
+        """
+        取得圖片寬度不小於指定寬度的最小變體，供模板使用
+
+        Args:
+            path: 原圖路徑（相對於網站根目錄）
+            width: 需要的寬度
+            image_format: 格式，預設為原圖的格式
+
+        Returns:
+            ImageVariant，沒有產生變體時為 None
+        """
+        variants = self._image_variants.get(path, [])
+        image_format = image_format or (variants[0].format if variants else None)
+        candidates = [v for v in variants if v.format == image_format]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda v: (v.width < width, abs(v.width - width)))
+
+    def prepare_data(
+        self, data: SheetData, deduplicated: bool = False
+    ) -> Tuple[SheetData, dict]:
+        """
+        合併重複投稿、過濾敏感資料並映射重要欄位索引
+
+        Args:
+            data: 原始資料
+            deduplicated: data 是否已經過 remove_duplicates 處理，是則不再合併
+
+        Returns:
+            (過濾後的資料, 過濾後的欄位索引)
         """
-        # 確保輸出目錄存在
-        os.makedirs(output_dir, exist_ok=True)
+        # 合併重複投稿，之後每一行的處理量都隨之減少
+        if not deduplicated:
+            data = self.remove_duplicates(data)
 
         # 記錄原始欄位索引，用於在過濾後恢復欄位對應關係
         orig_indices = self._map_important_indices(data)
@@ -51,11 +312,56 @@ class HtmlGenerator:
             orig_indices, data, filtered_data
         )
 
-        # 產生主頁
-        self._generate_index_page(filtered_data, output_dir, new_indices)
+        return filtered_data, new_indices
 
-        # 複製靜態資源到輸出目錄
-        self._copy_static_files(output_dir)
+    def render_pages(
+        self, data: SheetData, output_dir: Union[str, OutputSink], indices: dict
+    ) -> List[str]:
+        """
+        渲染所有由模板產生的頁面
+
+        只依賴模板與資料，修改模板後只需重新執行這一步。
+
+        Args:
+            data: 已過濾的 SheetData 物件
+            output_dir: 輸出目錄路徑，或輸出目標
+            indices: 欄位索引字典
+
+        Returns:
+            產生的頁面路徑（相對於輸出目錄）
+        """
+        sink = as_output_sink(output_dir)
+
+        # 偵測時間戳記欄位的格式，之後每一格都優先使用該格式解析
+        timestamp_index = indices["timestamp"]
+        if timestamp_index >= 0:
+            self.timestamp_parser.detect(
+                row[timestamp_index] for row in data.rows if timestamp_index < len(row)
+            )
+
+        # 一次掃描計算類別與作者分面，供頁面與瀏覽器端篩選使用
+        facets = build_facets(data, indices)
+        self._write_facets(facets, data.row_count, sink)
+
+        # 預先計算各重要欄位的排序排列，瀏覽器端切換排序時只需重新排列
+        sort_orders = build_sort_orders(data, indices, self.timestamp_parser)
+        self._write_json(sort_orders, sink, "sort_orders.json")
+
+        # 一次掃描計算投稿統計，統計頁面直接顯示預先計算的數列
+        stats = build_stats(data, indices, self.timestamp_parser)
+        self._write_json(stats.to_json(), sink, "stats.json")
+        self._generate_stats_page(stats, sink)
+
+        self._generate_index_page(
+            data, sink, indices, facets, self._sort_columns(indices, sort_orders)
+        )
+        return [
+            "index.html",
+            "facets.json",
+            "sort_orders.json",
+            "stats.html",
+            "stats.json",
+        ]
 
     def _map_important_indices(self, data: SheetData) -> dict:
         """
@@ -67,22 +373,7 @@ class HtmlGenerator:
         Returns:
             含有重要欄位索引的字典
         """
-        indices = {"link": -1, "timestamp": -1, "author": -1, "category": -1, "title": -1}
-
-        for i, header in enumerate(data.headers):
-            header_lower = header.lower()
-            if header_lower in ["作品連結", "連結", "link", "url"]:
-                indices["link"] = i
-            elif header_lower in ["時間戳記", "timestamp", "日期", "時間"]:
-                indices["timestamp"] = i
-            elif header_lower in ["作者名", "作者", "author", "name"]:
-                indices["author"] = i
-            elif header_lower in ["類別", "分類", "category", "type"]:
-                indices["category"] = i
-            elif header_lower in ["作品標題", "標題", "title"]:
-                indices["title"] = i
-
-        return indices
+        return map_important_indices(data.headers)
 
     def _update_indices_after_filter(
         self, orig_indices: dict, orig_data: SheetData, filtered_data: SheetData
@@ -99,7 +390,13 @@ class HtmlGenerator:
             更新後的索引字典
         """
         # 創建新索引字典
-        new_indices = {"link": -1, "timestamp": -1, "author": -1, "category": -1, "title": -1}
+        new_indices = {
+            "link": -1,
+            "timestamp": -1,
+            "author": -1,
+            "category": -1,
+            "title": -1,
+        }
 
         # 建立原始欄位名稱到過濾後索引的映射
         for key, orig_idx in orig_indices.items():
@@ -116,7 +413,7 @@ class HtmlGenerator:
 
     def _filter_sensitive_data(self, data: SheetData) -> SheetData:
         """
-        過濾敏感資料，如電子郵件地址
+        過濾敏感資料：移除電子郵件欄位，並遮蔽其他儲存格中的個人資料
 
         Args:
             data: 原始資料
@@ -135,9 +432,9 @@ class HtmlGenerator:
             ):
                 email_indices.append(i)
 
-        # 如果沒有找到電子郵件欄位，直接返回原始資料
+        # 如果沒有找到電子郵件欄位，只需遮蔽儲存格
         if not email_indices:
-            return data
+            return self._scrub_cells(data)
 
         # 過濾表頭和資料
         filtered_headers = []
@@ -153,75 +450,428 @@ class HtmlGenerator:
                     filtered_row.append(cell)
             filtered_rows.append(filtered_row)
 
-        # 創建並返回新的 SheetData 物件
-        return SheetData(headers=filtered_headers, rows=filtered_rows)
+        # 創建新的 SheetData 物件並遮蔽儲存格
+        return self._scrub_cells(
+            SheetData(headers=filtered_headers, rows=filtered_rows)
+        )
+
+    def _scrub_cells(self, data: SheetData) -> SheetData:
+        """
+        遮蔽自由填寫欄位中的電子郵件、電話與身分證字號
+
+        作品連結欄位不掃描，避免破壞網址。
+
+        Args:
+            data: 已移除電子郵件欄位的資料
+
+        Returns:
+            遮蔽後的資料
+        """
+        link_index = map_important_indices(data.headers)["link"]
+        skip_columns = [link_index] if link_index >= 0 else []
+        return self.pii_scrubber.scrub_data(data, skip_columns=skip_columns)
+
+    def _write_facets(
+        self, facets: Dict[str, List[FacetValue]], row_count: int, sink: OutputSink
+    ) -> None:
+        """
+        將分面寫入 facets.json
+
+        Args:
+            facets: 分面
+            row_count: 資料總行數
+            sink: 輸出目標
+        """
+        self._write_json(facets_to_json(facets, row_count), sink, "facets.json")
+
+    def _write_json(self, value: object, sink: OutputSink, filename: str) -> None:
+        """以緊湊格式將 JSON 資料寫入輸出目標，並記錄內容雜湊值"""
+        content = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        sink.write_text(filename, content)
+        self._page_versions[filename] = _content_hash(content)
+
+    @staticmethod
+    def _sort_columns(indices: dict, sort_orders: Dict[str, List[int]]) -> dict:
+        """
+        決定每個可排序的表頭對應的排序鍵
+
+        作品標題欄位不單獨顯示，而是作為連結文字，因此依標題排序的按鈕放在連結欄位上。
+
+        Args:
+            indices: 欄位索引字典
+            sort_orders: 排序排列
+
+        Returns:
+            欄位索引 -> 排序鍵
+        """
+        columns = {}
+        for key in sort_orders:
+            index = indices[key]
+            if key == "title":
+                if indices["link"] < 0:
+                    continue
+                index = indices["link"]
+            columns[index] = key
+        return columns
 
     def _generate_index_page(
-        self, data: SheetData, output_dir: str, indices: dict
+        self,
+        data: SheetData,
+        sink: OutputSink,
+        indices: dict,
+        facets: Optional[Dict[str, List[FacetValue]]] = None,
+        sort_columns: Optional[dict] = None,
     ) -> None:
         """
         生成首頁 HTML 檔案
 
         Args:
             data: 包含表頭和資料的 SheetData 物件
-            output_dir: 輸出目錄路徑
+            sink: 輸出目標
             indices: 欄位索引字典
+            facets: 類別與作者分面
+            sort_columns: 可排序的欄位索引 -> 排序鍵
         """
         # 獲取模板
         template = self.env.get_template("index.html")
 
-        # 獲取台灣時區的當前時間
-        tw_timezone = pytz.timezone('Asia/Taipei')
-        current_time = datetime.now(tw_timezone)
-        format_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
-
-        # 從環境變數中獲取網站 URL，如果沒有則使用默認值
-        site_url = os.getenv("SITE_URL", "https://pen-power-recall-website-2025.pages.dev")
+        row_context, context = self._index_context(
+            data, indices, facets, sort_columns, self._current_time()
+        )
+        workers = self._render_worker_count(data.row_count)
+        if workers > 1:
+            self._render_chunked(template, context, row_context, sink, workers)
+            return
 
         # 渲染模板
+        html_content = template.render(**context)
+
+        # 寫入檔案
+        sink.write_text("index.html", html_content)
+        self._page_versions["index.html"] = _content_hash(html_content)
+
+    def render_view(
+        self,
+        data: SheetData,
+        indices: dict,
+        facets: Dict[str, List[FacetValue]],
+        row_ids: List[int],
+        updated_at: datetime,
+        **view: object,
+    ) -> str:
+        """
+        以首頁模板渲染部分資料行（查詢伺服器使用）
+
+        Args:
+            data: 已過濾的 SheetData 物件
+            indices: 欄位索引字典
+            facets: 類別與作者分面
+            row_ids: 要渲染的資料行編號
+            updated_at: 資料更新時間
+            **view: 其他模板變數，例如查詢條件與分頁
+
+        Returns:
+            頁面 HTML
+        """
+        _, context = self._index_context(data, indices, facets, {}, updated_at)
+        context.update(
+            rows=[data.rows[row_id] for row_id in row_ids],
+            row_ids=row_ids,
+            service_worker=False,
+            **view,
+        )
+        return self.env.get_template("index.html").render(context)
+
+    def _index_context(
+        self,
+        data: SheetData,
+        indices: dict,
+        facets: Optional[Dict[str, List[FacetValue]]],
+        sort_columns: Optional[dict],
+        current_time: datetime,
+    ) -> Tuple[dict, dict]:
+        """
+        取得首頁模板的變數
+
+        Args:
+            data: 包含表頭和資料的 SheetData 物件
+            indices: 欄位索引字典
+            facets: 類別與作者分面
+            sort_columns: 可排序的欄位索引 -> 排序鍵
+            current_time: 顯示為資料最後更新時間的時間
+
+        Returns:
+            (表格列模板的變數, 頁面模板的變數)
+        """
+        # 表格列使用的變數，分段渲染時會傳給 _rows.html
+        row_context = {
+            "rows": data.rows,
+            "row_offset": 0,
+            "link_column_index": indices["link"],
+            "timestamp_column_index": indices["timestamp"],
+            "title_column_index": indices["title"],
+        }
+        context = {
+            **row_context,
+            "title": self.title,
+            "subtitle": self.subtitle,
+            "headers": data.headers,
+            "author_column_index": indices["author"],
+            "category_column_index": indices["category"],
+            "categories": (facets or {}).get("category", []),
+            "sort_columns": sort_columns or {},
+            "now": current_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "year": current_time.year,
+            "site_url": self._site_url(),
+            "service_worker": self.service_worker,
+            "exports": self.data_exporter.files() if self.data_exporter else [],
+            # 失效連結的標示由 _to_checked_link 產生，不在模板中
+            "icon_sprite": self._icon_sprite(
+                "index.html", ["unlink"] if self.broken_links else ()
+            ),
+        }
+        return row_context, context
+
+    def _generate_stats_page(self, stats: SiteStats, sink: OutputSink) -> None:
+        """
+        生成投稿統計頁面 stats.html
+
+        Args:
+            stats: 投稿統計
+            sink: 輸出目標
+        """
+        template = self.env.get_template("stats.html")
         html_content = template.render(
-            title="「筆桿接力罷免到底」創作接力",
-            subtitle="作品連結目錄",
-            headers=data.headers,
-            rows=data.rows,
-            items=data.to_dict_list(),
-            link_column_index=indices["link"],
-            timestamp_column_index=indices["timestamp"],
-            author_column_index=indices["author"],
-            category_column_index=indices["category"],
-            title_column_index=indices["title"],
-            now=format_time,
-            year=current_time.year,
-            site_url=site_url,
+            title=self.title,
+            stats=stats,
+            weekday_labels=WEEKDAY_LABELS,
+            now=self._current_time().strftime("%Y-%m-%d %H:%M:%S"),
+            icon_sprite=self._icon_sprite("stats.html"),
         )
+        sink.write_text("stats.html", html_content)
+        self._page_versions["stats.html"] = _content_hash(html_content)
 
-        # 寫入檔案
-        with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
-            f.write(html_content)
+    def _icon_sprite(self, template_name: str, extra_icons: Iterable[str] = ()) -> str:
+        """
+        頁面內嵌的 SVG sprite，只包含模板實際引用的圖示
+
+        Args:
+            template_name: 頁面模板名稱
+            extra_icons: 模板以外產生的 HTML 使用的圖示
+
+        Returns:
+            sprite 的 HTML
+        """
+        icons = self.template_loader.template_icons(self.env, template_name)
+        return self.icon_sprite.render(icons.union(extra_icons))
+
+    @staticmethod
+    def _current_time() -> datetime:
+        """獲取台灣時區的當前時間"""
+        return datetime.now(pytz.timezone("Asia/Taipei"))
+
+    def _render_worker_count(self, row_count: int) -> int:
+        """依資料行數決定分段渲染的行程數，1 表示直接渲染"""
+        if not self.render_workers or "fork" not in get_all_start_methods():
+            return 1
+        return max(1, min(self.render_workers, row_count // self.render_chunk_rows))
+
+    def _render_chunked(
+        self,
+        template: Template,
+        context: dict,
+        row_context: dict,
+        sink: OutputSink,
+        workers: int,
+    ) -> None:
+        """
+        將表格列分成連續的區段，在多個行程中平行渲染後依序串流寫入頁面
+
+        工作行程以 fork 建立，直接沿用目前的模板環境、過濾器狀態與資料，
+        只需傳送區段的起訖位置；輸出與直接渲染完全相同。
+
+        Args:
+            template: 頁面模板
+            context: 頁面模板的變數
+            row_context: 表格列模板的變數
+            sink: 輸出目標
+            workers: 行程數
+        """
+        global _chunk_state
+
+        # 先渲染不含表格列的頁面外框，再於標記位置插入各區段
+        head, tail = template.render(context, rows_html=_ROWS_MARKER).split(
+            _ROWS_MARKER
+        )
+
+        row_count = len(row_context["rows"])
+        chunk_count = workers * 4
+        bounds = [row_count * i // chunk_count for i in range(chunk_count + 1)]
+
+        _chunk_state = (self.env.get_template("_rows.html"), row_context)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=get_context("fork")
+            ) as executor:
+                chunks = [
+                    executor.submit(_render_rows_chunk, start, stop)
+                    for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+                    if start < stop
+                ]
+                digest = hashlib.sha1()
+                with sink.open_text("index.html") as f:
+                    parts = (chunk.result() for chunk in chunks)
+                    for part in chain([head], parts, [tail]):
+                        f.write(part)
+                        digest.update(part.encode("utf-8"))
+        finally:
+            _chunk_state = None
+        self._page_versions["index.html"] = digest.hexdigest()[:10]
+
+    def _site_url(self) -> str:
+        """取得網站網址，未設定時從環境變數中獲取，如果沒有則使用默認值"""
+        if self.site_url:
+            return self.site_url
+        return os.getenv("SITE_URL", DEFAULT_SITE_URL)
+
+    def _generate_feeds(self, data: SheetData, sink: OutputSink, indices: dict) -> None:
+        """
+        生成 Atom、JSON Feed 訂閱源與 sitemap.xml
 
-    def _copy_static_files(self, output_dir: str) -> None:
+        Args:
+            data: 包含表頭和資料的 SheetData 物件
+            sink: 輸出目標
+            indices: 欄位索引字典
         """
-        將靜態檔案複製到輸出目錄
+        feed_generator = FeedGenerator(
+            site_url=self._site_url(),
+            title=f"{self.title} - {self.subtitle}",
+            state_path=self.feed_state_path,
+            max_items=int(os.getenv("FEED_MAX_ITEMS", "50")),
+        )
+        images = self._generate_og_images(data, sink, indices)
+
+        def image_for(entry: FeedEntry) -> Optional[str]:
+            return images.get(OgCard(entry.title, entry.author, entry.category))
+
+        feed_generator.generate(
+            data, indices, sink, pages=("", "stats.html"), image_for=image_for
+        )
+
+    def _generate_og_images(
+        self, data: SheetData, sink: OutputSink, indices: dict
+    ) -> Dict[OgCard, str]:
+        """
+        為每件作品產生 Open Graph 分享卡片
 
         Args:
-            output_dir: 輸出目錄路徑
+            data: 包含表頭和資料的 SheetData 物件
+            sink: 輸出目標
+            indices: 欄位索引字典
+
+        Returns:
+            卡片內容 -> 圖片路徑，未設定 og_image_generator 時為空字典
         """
-        # 建立靜態資源目錄
-        static_output = os.path.join(output_dir, "static")
-        os.makedirs(static_output, exist_ok=True)
+        if self.og_image_generator is None:
+            return {}
+        return self.og_image_generator.generate(cards_from_data(data, indices), sink)
 
+    def _generate_service_worker(self, sink: OutputSink) -> None:
+        """
+        產生預先快取清單與 sw.js
+
+        清單包含渲染的頁面、資料檔與可預先快取的靜態資源，靜態資源使用頁面中
+        加上內容指紋的網址。
+
+        Args:
+            sink: 輸出目標
+        """
+        entries = [
+            PrecacheEntry(path, version)
+            for path, version in self._page_versions.items()
+        ]
+        entries.extend(
+            PrecacheEntry(self.asset_url(path), version)
+            for path, version in self._asset_versions.items()
+            if path.endswith(PRECACHE_SUFFIXES)
+        )
+        manifest = build_precache_manifest(entries)
+
+        with sink.open_text(MANIFEST_PATH) as f:
+            json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+        sink.write_text(
+            SERVICE_WORKER_PATH,
+            render_service_worker(self.service_worker_source, manifest, "index.html"),
+        )
+
+    def _copy_static_files(self, sink: OutputSink) -> None:
+        """
+        將靜態檔案複製到輸出目標
+
+        Args:
+            sink: 輸出目標
+        """
         # 複製所有靜態檔案
         if self.static_dir.exists():
             for item in self.static_dir.glob("**/*"):
                 if item.is_file():
                     # 建立相對路徑
                     rel_path = item.relative_to(self.static_dir)
-                    # 建立目標路徑
-                    dest_path = Path(static_output) / rel_path
-                    # 確保目標目錄存在
-                    os.makedirs(dest_path.parent, exist_ok=True)
                     # 複製檔案
-                    shutil.copy2(item, dest_path)
+                    sink.copy_file(str(item), (Path("static") / rel_path).as_posix())
+                    # 記錄內容指紋
+                    self._record_asset_version(item, rel_path)
+                    # 產生圖片變體
+                    self._build_image_variants(item, rel_path, sink)
+
+    def _build_image_variants(
+        self, source: Path, rel_path: Path, sink: OutputSink
+    ) -> None:
+        """為靜態資源中的圖片產生變體"""
+        if self.image_variant_builder is None:
+            return
+        site_path = (Path("static") / rel_path).as_posix()
+        variants = self.image_variant_builder.build(str(source), site_path, sink)
+        if variants:
+            self._image_variants[site_path] = variants
+
+    def _record_asset_version(self, source: Path, rel_path: Path) -> None:
+        """計算靜態檔案的內容指紋"""
+        with open(source, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:10]
+        self._asset_versions[(Path("static") / rel_path).as_posix()] = digest
+
+    def copy_static_file(
+        self, source: str, output_dir: Union[str, OutputSink]
+    ) -> Optional[str]:
+        """
+        複製（或移除）單一靜態檔案
+
+        Args:
+            source: 靜態資源目錄中的檔案路徑
+            output_dir: 輸出目錄路徑，或輸出目標
+
+        Returns:
+            輸出檔案的路徑（相對於輸出目錄），檔案不在靜態資源目錄中時為 None
+        """
+        try:
+            rel_path = Path(source).resolve().relative_to(self.static_dir.resolve())
+        except ValueError:
+            return None
+
+        sink = as_output_sink(output_dir)
+        output_path = (Path("static") / rel_path).as_posix()
+        if Path(source).is_file():
+            sink.copy_file(source, output_path)
+            self._record_asset_version(Path(source), rel_path)
+            self._build_image_variants(Path(source), rel_path, sink)
+        else:
+            # 來源檔案已刪除
+            sink.remove(output_path)
+            self._asset_versions.pop(output_path, None)
+            for variant in self._image_variants.pop(output_path, []):
+                sink.remove(variant.path)
+        return output_path
 
     @staticmethod
     def _to_link(value: str, title: str = "") -> str:
@@ -248,8 +898,26 @@ class HtmlGenerator:
 
         return f'<a href="{url}" target="_blank" rel="noopener noreferrer">{display_text}</a>'
 
-    @staticmethod
-    def _format_date(value: str) -> str:
+    def _to_checked_link(self, value: str, title: str = "") -> str:
+        """
+        將URL轉換為HTML連結，並標示連結檢查確定失效的連結
+
+        Args:
+            value: URL字串
+            title: 連結的顯示文字
+
+        Returns:
+            轉換後的HTML連結
+        """
+        html_link = self._to_link(value, title)
+        if html_link and normalize_link(value) in self.broken_links:
+            html_link += (
+                ' <span class="badge bg-warning text-dark" title="此連結可能已失效">'
+                f'{icon_html("unlink")} 連結可能失效</span>'
+            )
+        return html_link
+
+    def _format_date(self, value: str) -> str:
         """
         格式化時間戳記
 
@@ -257,20 +925,6 @@ class HtmlGenerator:
             value: 時間戳記字串
 
         Returns:
-            格式化後的日期字串
+            格式化後的日期字串，無法解析時返回原始值
         """
-        if not value:
-            return ""
-
-        try:
-            # 嘗試解析Google Forms的時間戳記格式 (2023/4/30 上午 10:30:45)
-            date_obj = datetime.strptime(value, "%Y/%m/%d %p %I:%M:%S")
-            return date_obj.strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            try:
-                # 嘗試ISO格式
-                date_obj = datetime.fromisoformat(value.replace("Z", "+00:00"))
-                return date_obj.strftime("%Y-%m-%d %H:%M")
-            except ValueError:
-                # 如果無法解析，返回原始值
-                return value
+        return self.timestamp_parser.format(value)
@@ -0,0 +1,172 @@
+"""
+SVG 圖示 - 以頁面內嵌的 SVG sprite 取代 Font Awesome 樣式表與字型
+
+模板載入時，<i class="fas fa-名稱"></i> 會改寫為引用 sprite 的
+<svg class="icon"><use href="#icon-名稱"></use></svg>，並記錄模板引用的圖示。
+每個頁面只內嵌該模板（含 include 的模板）實際引用的圖示，圖示來源為
+src/presentation/icons/<名稱>.svg。
+"""
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Set, Tuple, Union
+
+from jinja2 import Environment, FileSystemLoader, meta
+
+# 圖示來源目錄
+ICON_DIR = Path(__file__).parent.parent / "presentation" / "icons"
+
+# sprite 中圖示的 id 前綴
+ICON_ID_PREFIX = "icon-"
+
+# 模板中的 Font Awesome 圖示標籤，可帶有其他 class
+_ICON_TAG_RE = re.compile(
+    r'<i class="(?:fas|far|fa-solid|fa-regular) fa-([a-z0-9-]+)((?: [\w-]+)*)"'
+    r'(?: aria-hidden="true")?></i>'
+)
+
+# 對 sprite 中圖示的引用，包含腳本中切換圖示時使用的網址
+_ICON_REF_RE = re.compile(rf"#{ICON_ID_PREFIX}([a-z0-9-]+)")
+
+# 圖示來源的 viewBox 與內容
+_ICON_SOURCE_RE = re.compile(r'<svg[^>]*\sviewBox="([^"]+)"[^>]*>(.*)</svg>', re.S)
+
+
+def icon_html(name: str, extra_classes: str = "") -> str:
+    """
+    引用 sprite 中圖示的 HTML
+
+    Args:
+        name: 圖示名稱（與 Font Awesome 的名稱相同，例如 "search"）
+        extra_classes: 附加的 class，以空白分隔
+
+    Returns:
+        <svg> 標籤
+    """
+    classes = " ".join(["icon", *extra_classes.split()])
+    return (
+        f'<svg class="{classes}" aria-hidden="true">'
+        f'<use href="#{ICON_ID_PREFIX}{name}"></use></svg>'
+    )
+
+
+def rewrite_icons(source: str) -> str:
+    """將模板中的 Font Awesome 圖示標籤改寫為引用 sprite 的 <svg>"""
+    return _ICON_TAG_RE.sub(
+        lambda match: icon_html(match.group(1), match.group(2)), source
+    )
+
+
+def referenced_icons(source: str) -> Set[str]:
+    """模板或 HTML 中引用的圖示名稱"""
+    return set(_ICON_REF_RE.findall(source))
+
+
+class IconTemplateLoader(FileSystemLoader):
+    """載入模板時改寫圖示標籤，並記錄每個模板引用的圖示與 include 的模板"""
+
+    def __init__(self, searchpath: Union[str, Path]) -> None:
+        super().__init__(searchpath)
+        # 模板名稱 -> (引用的圖示, include 的模板)
+        self._references: Dict[str, Tuple[FrozenSet[str], Tuple[str, ...]]] = {}
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> Tuple[str, str, Callable[[], bool]]:
+        source, filename, uptodate = super().get_source(environment, template)
+        source = rewrite_icons(source)
+        included = meta.find_referenced_templates(environment.parse(source))
+        self._references[template] = (
+            frozenset(referenced_icons(source)),
+            tuple(name for name in included if name),
+        )
+        return source, filename, uptodate
+
+    def template_icons(self, environment: Environment, name: str) -> Set[str]:
+        """
+        模板與其 include 的模板引用的所有圖示
+
+        Args:
+            environment: 載入模板的 Jinja 環境
+            name: 模板名稱
+
+        Returns:
+            圖示名稱
+        """
+        icons: Set[str] = set()
+        pending, seen = [name], set()
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            # 載入（或確認已載入）模板，模板變更時會重新記錄
+            environment.get_template(current)
+            template_icons, included = self._references.get(current, (frozenset(), ()))
+            icons.update(template_icons)
+            pending.extend(included)
+        return icons
+
+
+class IconSprite:
+    """由圖示來源組成內嵌的 SVG sprite"""
+
+    def __init__(self, icon_dir: Union[str, Path] = ICON_DIR) -> None:
+        """
+        初始化
+
+        Args:
+            icon_dir: 圖示來源目錄，每個圖示一個 <名稱>.svg
+        """
+        self.icon_dir = Path(icon_dir)
+        self._symbols: Dict[str, str] = {}
+        self._sprites: Dict[FrozenSet[str], str] = {}
+
+    def symbol(self, name: str) -> str:
+        """
+        取得圖示的 <symbol>
+
+        Raises:
+            ValueError: 找不到圖示來源或格式不正確
+        """
+        symbol = self._symbols.get(name)
+        if symbol is None:
+            path = self.icon_dir / f"{name}.svg"
+            try:
+                source = path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise ValueError(
+                    f"找不到圖示 {name}，請將 SVG 加入 {self.icon_dir}"
+                ) from None
+            match = _ICON_SOURCE_RE.search(source)
+            if match is None:
+                raise ValueError(f"{path} 不是有 viewBox 的 SVG")
+            symbol = (
+                f'<symbol id="{ICON_ID_PREFIX}{name}" viewBox="{match.group(1)}">'
+                f"{match.group(2).strip()}</symbol>"
+            )
+            self._symbols[name] = symbol
+        return symbol
+
+    def render(self, names: Iterable[str]) -> str:
+        """
+        組成只包含指定圖示的 sprite
+
+        Args:
+            names: 圖示名稱
+
+        Returns:
+            隱藏的 <svg>，沒有圖示時為空字串
+        """
+        key = frozenset(names)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            symbols = "".join(self.symbol(name) for name in sorted(key))
+            sprite = (
+                '<svg xmlns="http://www.w3.org/2000/svg" style="display: none">'
+                f"{symbols}</svg>"
+                if symbols
+                else ""
+            )
+            self._sprites[key] = sprite
+        return sprite
@@ -0,0 +1,210 @@
+"""
+圖片變體生成器 - 將靜態資源中的圖片縮放並重新編碼為多種寬度與格式
+
+每張圖片會產生數個寬度的變體，格式為原始格式與 WebP（以及 Pillow 支援時的 AVIF），
+重新編碼時不保留 EXIF 等中繼資料。變體以 `<檔名>-<寬度>w.<副檔名>` 命名，
+可直接用於 srcset。產生的變體依來源圖片內容的雜湊值快取，圖片沒有變更時
+之後的建置只需要將快取的檔案放到輸出目錄。需要以 images extra 安裝的 Pillow。
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import PurePosixPath
+from typing import Dict, List, Optional, Sequence, Union
+
+from src.infrastructure.output_sink import OutputSink, as_output_sink
+
+try:
+    from PIL import Image, ImageOps, features  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - 依安裝環境而定
+    Image = ImageOps = features = None  # type: ignore[assignment]
+
+# 變體產生方式的版本，修改編碼設定時遞增以讓快取失效
+VARIANT_VERSION = 1
+
+# 預設產生的寬度（超過原圖寬度的不產生）
+DEFAULT_WIDTHS = (480, 960, 1200, 1800)
+
+# 可處理的來源圖片副檔名 -> 格式
+SOURCE_FORMATS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png"}
+
+# 格式 -> (副檔名, Pillow 格式名稱)
+_ENCODERS = {
+    "jpeg": (".jpg", "JPEG"),
+    "png": (".png", "PNG"),
+    "webp": (".webp", "WEBP"),
+    "avif": (".avif", "AVIF"),
+}
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """一個圖片變體"""
+
+    path: str
+    width: int
+    height: int
+    format: str
+
+
+def modern_formats() -> List[str]:
+    """
+    取得目前的 Pillow 可編碼的新式圖片格式
+
+    Returns:
+        格式名稱列表
+    """
+    if features is None:
+        return []
+    return [name for name in ("webp", "avif") if features.check(name)]
+
+
+class ImageVariantBuilder:
+    """帶快取的圖片變體生成器"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        widths: Sequence[int] = DEFAULT_WIDTHS,
+        formats: Optional[Sequence[str]] = None,
+        quality: int = 80,
+    ) -> None:
+        """
+        初始化生成器
+
+        Args:
+            cache_dir: 變體的快取目錄，未設定時每次都重新產生
+            widths: 要產生的寬度
+            formats: 除原始格式外要產生的格式，預設為 modern_formats()
+            quality: 有損格式的編碼品質
+        """
+        self.cache_dir = cache_dir
+        self.widths = sorted(set(widths))
+        self.formats = list(modern_formats() if formats is None else formats)
+        self.quality = quality
+
+    @staticmethod
+    def available() -> bool:
+        """是否已安裝 Pillow"""
+        return Image is not None
+
+    def build(
+        self, source: str, rel_path: str, output_dir: Union[str, OutputSink]
+    ) -> List[ImageVariant]:
+        """
+        產生一張圖片的所有變體，放在輸出目錄中原圖的旁邊
+
+        Args:
+            source: 來源圖片路徑
+            rel_path: 原圖在網站中的路徑（相對於網站根目錄，例如 static/img/a.jpg）
+            output_dir: 輸出目錄路徑，或輸出目標
+
+        Returns:
+            變體列表，依格式、寬度排序；不支援的圖片格式為空列表
+        """
+        suffix = PurePosixPath(rel_path).suffix.lower()
+        if suffix not in SOURCE_FORMATS:
+            return []
+
+        with open(source, "rb") as f:
+            content = f.read()
+        key = hashlib.sha1(
+            json.dumps(
+                [VARIANT_VERSION, rel_path, self.widths, self.formats, self.quality]
+            ).encode("utf-8")
+            + content
+        ).hexdigest()[:20]
+
+        sink = as_output_sink(output_dir)
+        if self.cache_dir is None:
+            # 沒有快取時直接編碼到輸出目錄，輸出不在檔案系統中時經由暫存目錄
+            target_dir = sink.local_dir(PurePosixPath(rel_path).parent.as_posix())
+            if target_dir is not None:
+                return self._encode(source, rel_path, target_dir)
+            with tempfile.TemporaryDirectory() as scratch:
+                variants = self._encode(source, rel_path, scratch)
+                _place(variants, scratch, sink)
+            return variants
+
+        entry_dir = os.path.join(self.cache_dir, key)
+        manifest_path = os.path.join(entry_dir, "variants.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                variants = [ImageVariant(**variant) for variant in json.load(f)]
+        else:
+            tmp_dir = f"{entry_dir}.tmp"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            os.makedirs(tmp_dir)
+            variants = self._encode(source, rel_path, tmp_dir)
+            with open(
+                os.path.join(tmp_dir, "variants.json"), "w", encoding="utf-8"
+            ) as f:
+                json.dump([asdict(variant) for variant in variants], f)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+
+        _place(variants, entry_dir, sink)
+        return variants
+
+    def _encode(self, source: str, rel_path: str, directory: str) -> List[ImageVariant]:
+        """將來源圖片縮放並編碼為所有變體，寫入指定目錄"""
+        if Image is None:
+            raise RuntimeError("產生圖片變體需要安裝 Pillow")
+
+        path = PurePosixPath(rel_path)
+        source_format = SOURCE_FORMATS[path.suffix.lower()]
+
+        with Image.open(source) as opened:
+            # 依 EXIF 方向轉正，之後重新編碼時不保留 EXIF
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+
+        # 超過原圖寬度的不產生，但一定包含不超過最大寬度的原圖寬度
+        largest = min(image.width, self.widths[-1])
+        widths = [width for width in self.widths if width < largest] + [largest]
+
+        variants = []
+        for image_format in [source_format] + self.formats:
+            extension, pillow_format = _ENCODERS[image_format]
+            for width in widths:
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                if image_format == "jpeg" and resized.mode not in ("RGB", "L"):
+                    resized = resized.convert("RGB")
+
+                name = f"{path.stem}-{width}w{extension}"
+                resized.save(
+                    os.path.join(directory, name),
+                    pillow_format,
+                    **self._save_options(image_format),
+                )
+                variants.append(
+                    ImageVariant(
+                        path=(path.parent / name).as_posix(),
+                        width=width,
+                        height=height,
+                        format=image_format,
+                    )
+                )
+        return variants
+
+    def _save_options(self, image_format: str) -> Dict[str, object]:
+        """各格式的編碼參數"""
+        if image_format == "jpeg":
+            return {"quality": self.quality, "optimize": True, "progressive": True}
+        if image_format == "png":
+            return {"optimize": True}
+        if image_format == "webp":
+            return {"quality": self.quality, "method": 6}
+        return {"quality": self.quality}
+
+
+def _place(variants: List[ImageVariant], directory: str, sink: OutputSink) -> None:
+    """將目錄中已編碼的變體放到輸出中，可行時使用硬連結以避免複製"""
+    for variant in variants:
+        name = PurePosixPath(variant.path).name
+        sink.copy_file(os.path.join(directory, name), variant.path, link=True)
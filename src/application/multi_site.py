@@ -0,0 +1,273 @@
+"""
+多網站建置 - 依設定檔在同一個程序中建置多個網站
+
+所有網站共用一次授權的資料來源服務，並以多個執行緒同時擷取資料。擷取完成後，
+網站分散到多個行程中產生：HtmlGenerator（含已編譯的 Jinja 模板）在父行程中建立，
+支援 fork 的平台上子行程會直接沿用，不需要重新編譯；每個工作行程依序產生多個網站，
+只在產生前切換網站的標題、網址與輸出目錄。
+"""
+
+import multiprocessing
+import os
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.application.html_generator import SITE_SUBTITLE, SITE_TITLE, HtmlGenerator
+from src.domain.models import SheetData
+from src.infrastructure.data_sources import DataSource
+from src.infrastructure.output_sink import create_output_sink
+
+
+@dataclass
+class SiteConfig:
+    """一個網站的設定"""
+
+    name: str
+    output_dir: str
+    title: str = SITE_TITLE
+    subtitle: str = SITE_SUBTITLE
+    site_url: Optional[str] = None
+    source: str = "sheets"
+    source_path: str = ""
+    spreadsheet_id: str = ""
+    sheet_name: str = "Sheet1"
+    feed_state_path: Optional[str] = None
+
+
+@dataclass
+class SiteResult:
+    """一個網站的建置結果"""
+
+    name: str
+    output_dir: str
+    rows: int = 0
+    fetch_seconds: float = 0.0
+    render_seconds: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """是否建置成功"""
+        return not self.error
+
+
+def load_site_configs(path: str) -> List[SiteConfig]:
+    """
+    讀取 TOML 格式的多網站設定檔
+
+    [defaults] 表格中的設定套用到每個網站，[[sites]] 中的設定優先。
+
+    Args:
+        path: 設定檔路徑
+
+    Returns:
+        網站設定列表
+
+    Raises:
+        ValueError: 設定檔內容不正確
+    """
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+
+    defaults = config.get("defaults", {})
+    known = {f.name for f in fields(SiteConfig)}
+    sites: List[SiteConfig] = []
+    for i, entry in enumerate(config.get("sites", [])):
+        values = {**defaults, **entry}
+        unknown = sorted(set(values) - known)
+        if unknown:
+            raise ValueError(f"第 {i + 1} 個網站有不支援的設定: {', '.join(unknown)}")
+        if not values.get("name") or not values.get("output_dir"):
+            raise ValueError(f"第 {i + 1} 個網站缺少 name 或 output_dir")
+        site = SiteConfig(**values)
+        if site.source == "sheets" and not site.spreadsheet_id:
+            raise ValueError(f"網站 {site.name} 缺少 spreadsheet_id")
+        sites.append(site)
+
+    if not sites:
+        raise ValueError(f"設定檔 {path} 中沒有任何網站")
+    names = [site.name for site in sites]
+    if len(set(names)) != len(names):
+        raise ValueError("網站名稱不可重複")
+    return sites
+
+
+# 工作行程中使用的生成器；在 fork 前於父行程中建立，子行程直接沿用
+_worker_generator: Optional[HtmlGenerator] = None
+
+
+def _create_generator(
+    configure: Optional[Callable[[HtmlGenerator], None]],
+) -> HtmlGenerator:
+    """建立生成器並預先編譯所有模板"""
+    generator = HtmlGenerator()
+    if configure is not None:
+        configure(generator)
+    for name in generator.env.list_templates():
+        generator.env.get_template(name)
+    return generator
+
+
+def _init_worker(configure: Optional[Callable[[HtmlGenerator], None]]) -> None:
+    """工作行程初始化：沒有沿用父行程的生成器時（非 fork 平台）才建立"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = _create_generator(configure)
+
+
+def _render_site(site: SiteConfig, data: SheetData) -> float:
+    """
+    在工作行程中產生一個網站
+
+    Args:
+        site: 網站設定
+        data: 網站資料
+
+    Returns:
+        花費秒數
+    """
+    generator = _worker_generator
+    if generator is None:
+        raise RuntimeError("工作行程尚未初始化")
+
+    started = time.perf_counter()
+    generator.title = site.title
+    generator.subtitle = site.subtitle
+    generator.site_url = site.site_url
+    generator.feed_state_path = site.feed_state_path
+    generator.broken_links = set()
+    if generator.og_image_generator is not None:
+        generator.og_image_generator.site_title = site.title
+
+    # output_dir 為 .zip、.tar.gz 等路徑時輸出為封存檔
+    with create_output_sink(site.output_dir) as sink:
+        generator.generate_site(data, sink)
+    return time.perf_counter() - started
+
+
+class MultiSiteBuilder:
+    """同時建置多個網站"""
+
+    def __init__(
+        self,
+        sites: List[SiteConfig],
+        create_source: Callable[[SiteConfig], DataSource],
+        configure: Optional[Callable[[HtmlGenerator], None]] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        初始化建置器
+
+        Args:
+            sites: 網站設定
+            create_source: 依網站設定建立資料來源的函式（在主行程的擷取執行緒中呼叫）
+            configure: 設定生成器選項的函式，會傳送到工作行程，必須可以被 pickle
+            max_workers: 產生網站的行程數，預設為 CPU 數量；1 表示在目前的行程中依序產生
+        """
+        self.sites = sites
+        self.create_source = create_source
+        self.configure = configure
+        self.max_workers = max_workers
+
+    def fetch_all(self) -> Tuple[Dict[str, SheetData], Dict[str, SiteResult]]:
+        """
+        以多個執行緒同時擷取所有網站的資料
+
+        Returns:
+            (網站名稱 -> 資料, 網站名稱 -> 建置結果)
+        """
+        results = {
+            site.name: SiteResult(site.name, site.output_dir) for site in self.sites
+        }
+
+        def fetch(site: SiteConfig) -> Tuple[str, Optional[SheetData]]:
+            started = time.perf_counter()
+            try:
+                data: Optional[SheetData] = self.create_source(site).load()
+            except Exception as e:
+                results[site.name].error = f"擷取失敗: {e}"
+                data = None
+            results[site.name].fetch_seconds = time.perf_counter() - started
+            return site.name, data
+
+        with ThreadPoolExecutor(max_workers=len(self.sites)) as executor:
+            fetched = dict(executor.map(fetch, self.sites))
+
+        datasets = {name: data for name, data in fetched.items() if data is not None}
+        for name, data in datasets.items():
+            results[name].rows = data.row_count
+        return datasets, results
+
+    def build(self) -> List[SiteResult]:
+        """
+        擷取所有網站的資料並產生網站
+
+        Returns:
+            各網站的建置結果，順序與設定相同
+        """
+        global _worker_generator
+
+        datasets, results = self.fetch_all()
+        pending = [site for site in self.sites if site.name in datasets]
+
+        # 在建立工作行程前編譯模板，fork 出的子行程直接沿用
+        _worker_generator = _create_generator(self.configure)
+
+        workers = min(self.max_workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1:
+            for site in pending:
+                self._record(
+                    results[site.name], partial(_render_site, site, datasets[site.name])
+                )
+            return [results[site.name] for site in self.sites]
+
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.configure,),
+        ) as executor:
+            futures = {
+                site.name: executor.submit(_render_site, site, datasets[site.name])
+                for site in pending
+            }
+            for name, future in futures.items():
+                self._record(results[name], future.result)
+
+        return [results[site.name] for site in self.sites]
+
+    @staticmethod
+    def _record(result: SiteResult, render: Callable[[], float]) -> None:
+        """執行產生網站的工作並記錄花費時間或錯誤"""
+        try:
+            result.render_seconds = render()
+        except Exception as e:
+            result.error = f"產生失敗: {e}"
+
+
+def format_results(results: List[SiteResult]) -> str:
+    """
+    將建置結果格式化為表格
+
+    Args:
+        results: 建置結果
+
+    Returns:
+        表格文字
+    """
+    lines = []
+    for result in results:
+        status = "成功" if result.ok else result.error
+        fetch_ms = result.fetch_seconds * 1000
+        render_ms = result.render_seconds * 1000
+        lines.append(
+            f"{result.name}: {result.rows} 行，擷取 {fetch_ms:.0f} ms，"
+            f"產生 {render_ms:.0f} ms，{status}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,314 @@
+"""
+Open Graph 圖片生成器 - 為每件作品繪製 1200×630 的分享卡片（標題、作者、類別）
+
+卡片以 Pillow 繪製，並以多個行程並行處理。每張卡片的檔名取自其內容（文字、格式、
+字型與卡片版本）的雜湊值，已繪製過的卡片保存在快取目錄中，之後的建置只需要繪製
+新增或修改過的作品。未安裝 Pillow 時無法使用。
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from src.domain.models import SheetData, work_title
+from src.infrastructure.output_sink import OutputSink, as_output_sink
+
+try:
+    from PIL import Image, ImageDraw, ImageFont  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - 依安裝環境而定
+    Image = ImageDraw = ImageFont = None  # type: ignore[assignment]
+
+# Pillow 載入的字型
+_Font = Union["ImageFont.FreeTypeFont", "ImageFont.ImageFont"]
+
+# 卡片尺寸，與模板中的 og:image:width / og:image:height 一致
+CARD_WIDTH = 1200
+CARD_HEIGHT = 630
+
+# 卡片版面版本，修改繪製方式時遞增以讓快取失效
+CARD_VERSION = 1
+
+# 支援的圖片格式 -> 副檔名
+IMAGE_FORMATS = {"jpeg": ".jpg", "webp": ".webp"}
+
+# 輸出目錄中存放卡片的子目錄
+OG_DIR = "og"
+
+# 常見的中日韓字型位置，依序嘗試
+_FONT_CANDIDATES = [
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc",
+    "/System/Library/Fonts/PingFang.ttc",
+    "C:\\Windows\\Fonts\\msjh.ttc",
+]
+
+# 配色（與網站表頭一致）
+_BACKGROUND = (33, 37, 41)
+_TEXT = (255, 255, 255)
+_MUTED = (173, 181, 189)
+_ACCENT = (13, 110, 253)
+
+_MARGIN = 72
+
+
+@dataclass(frozen=True)
+class OgCard:
+    """一張分享卡片的內容"""
+
+    title: str
+    author: str
+    category: str
+
+
+def cards_from_data(data: SheetData, indices: Dict[str, int]) -> List[OgCard]:
+    """
+    為每個資料行建立卡片內容
+
+    Args:
+        data: 表格資料
+        indices: 重要欄位索引
+
+    Returns:
+        與資料行順序相同的卡片列表
+    """
+
+    def cell(row: List[str], key: str) -> str:
+        index = indices.get(key, -1)
+        return row[index] if 0 <= index < len(row) else ""
+
+    cards = []
+    for row in data.rows:
+        author = cell(row, "author")
+        cards.append(
+            OgCard(
+                title=work_title(cell(row, "title"), author),
+                author=author,
+                category=cell(row, "category"),
+            )
+        )
+    return cards
+
+
+def find_font() -> Optional[str]:
+    """
+    尋找可顯示中文的字型
+
+    Returns:
+        字型檔路徑，找不到時為 None
+    """
+    for path in _FONT_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _load_font(font_path: Optional[str], size: int) -> "_Font":
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default(size)
+
+
+def _wrap(text: str, font: "_Font", width: int, max_lines: int) -> str:
+    """依寬度逐字換行（中文沒有空白可斷行），超過行數時以省略號結尾"""
+    lines: List[str] = []
+    line = ""
+    for char in text:
+        if font.getlength(line + char) <= width:
+            line += char
+            continue
+        lines.append(line)
+        line = char
+        if len(lines) == max_lines:
+            break
+    else:
+        lines.append(line)
+        return "\n".join(lines)
+
+    last = lines[-1]
+    while last and font.getlength(last + "…") > width:
+        last = last[:-1]
+    lines[-1] = last + "…"
+    return "\n".join(lines)
+
+
+def render_card(job: Tuple[OgCard, str, str, Optional[str], str]) -> str:
+    """
+    繪製一張卡片並寫入檔案（在子行程中執行，因此為模組層級函式）
+
+    Args:
+        job: (卡片內容, 網站標題, 輸出路徑, 字型檔路徑, 圖片格式)
+
+    Returns:
+        輸出路徑
+    """
+    card, site_title, path, font_path, image_format = job
+    if Image is None:
+        raise RuntimeError("繪製 Open Graph 圖片需要安裝 Pillow")
+
+    image = Image.new("RGB", (CARD_WIDTH, CARD_HEIGHT), _BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    content_width = CARD_WIDTH - 2 * _MARGIN
+
+    draw.text(
+        (_MARGIN, _MARGIN), site_title, font=_load_font(font_path, 32), fill=_MUTED
+    )
+
+    top: float = _MARGIN + 80
+    if card.category:
+        font = _load_font(font_path, 30)
+        _, _, right, lower = draw.textbbox(
+            (_MARGIN + 20, top + 8), card.category, font=font
+        )
+        draw.rounded_rectangle(
+            (_MARGIN, top, right + 20, lower + 12), radius=12, fill=_ACCENT
+        )
+        draw.text((_MARGIN + 20, top + 8), card.category, font=font, fill=_TEXT)
+        top = lower + 44
+
+    title_font = _load_font(font_path, 64)
+    draw.multiline_text(
+        (_MARGIN, top),
+        _wrap(card.title, title_font, content_width, 3),
+        font=title_font,
+        fill=_TEXT,
+        spacing=20,
+    )
+
+    if card.author:
+        author_font = _load_font(font_path, 36)
+        author = _wrap(card.author, author_font, content_width, 1)
+        draw.text(
+            (_MARGIN, CARD_HEIGHT - _MARGIN - 40), author, font=author_font, fill=_MUTED
+        )
+
+    tmp_path = f"{path}.tmp"
+    if image_format == "webp":
+        image.save(tmp_path, "WEBP", quality=80, method=4)
+    else:
+        image.save(tmp_path, "JPEG", quality=85, optimize=True, progressive=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+class OgImageGenerator:
+    """並行、帶快取的分享卡片生成器"""
+
+    def __init__(
+        self,
+        site_title: str,
+        cache_dir: Optional[str] = None,
+        image_format: str = "jpeg",
+        font_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        初始化生成器
+
+        Args:
+            site_title: 顯示在卡片上方的網站標題
+            cache_dir: 已繪製卡片的快取目錄，未設定時直接繪製到輸出目錄
+            image_format: 圖片格式，"jpeg" 或 "webp"
+            font_path: 字型檔路徑，預設使用 find_font() 找到的字型
+            max_workers: 並行繪製的行程數，預設為 CPU 數量
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"不支援的圖片格式: {image_format}")
+        self.site_title = site_title
+        self.cache_dir = cache_dir
+        self.image_format = image_format
+        self.font_path = font_path or find_font()
+        self.max_workers = max_workers
+
+    @staticmethod
+    def available() -> bool:
+        """是否已安裝 Pillow"""
+        return Image is not None
+
+    def filename(self, card: OgCard) -> str:
+        """
+        取得卡片的檔名（內容雜湊值），內容、格式、字型或版面改變時檔名也會改變
+
+        Args:
+            card: 卡片內容
+
+        Returns:
+            檔名
+        """
+        key = json.dumps(
+            [
+                CARD_VERSION,
+                self.image_format,
+                os.path.basename(self.font_path or ""),
+                self.site_title,
+                card.title,
+                card.author,
+                card.category,
+            ],
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return digest + IMAGE_FORMATS[self.image_format]
+
+    def generate(
+        self, cards: Iterable[OgCard], output_dir: Union[str, OutputSink]
+    ) -> Dict[OgCard, str]:
+        """
+        繪製卡片並放到輸出目錄的 og/ 子目錄中，只繪製快取中沒有的卡片
+
+        Args:
+            cards: 卡片內容（重複的卡片只繪製一次）
+            output_dir: 輸出目錄路徑，或輸出目標
+
+        Returns:
+            卡片內容 -> 圖片路徑（相對於網站根目錄）
+        """
+        sink = as_output_sink(output_dir)
+        target_dir = sink.local_dir(OG_DIR)
+        filenames = {card: self.filename(card) for card in dict.fromkeys(cards)}
+
+        # 沒有快取時直接繪製到輸出目錄，輸出不在檔案系統中時經由暫存目錄
+        with tempfile.TemporaryDirectory() as scratch:
+            render_dir = self.cache_dir or target_dir or scratch
+            os.makedirs(render_dir, exist_ok=True)
+
+            jobs = []
+            for card, name in filenames.items():
+                path = os.path.join(render_dir, name)
+                if not os.path.exists(path):
+                    jobs.append(
+                        (card, self.site_title, path, self.font_path, self.image_format)
+                    )
+            self._render(jobs)
+
+            if render_dir != target_dir:
+                for name in filenames.values():
+                    # 檔名為內容的雜湊值，已存在的檔案內容一定相同
+                    if target_dir and os.path.exists(os.path.join(target_dir, name)):
+                        continue
+                    sink.copy_file(
+                        os.path.join(render_dir, name), f"{OG_DIR}/{name}", link=True
+                    )
+
+        return {card: f"{OG_DIR}/{name}" for card, name in filenames.items()}
+
+    def _render(self, jobs: List[Tuple[OgCard, str, str, Optional[str], str]]) -> None:
+        """繪製卡片，數量多時分散到多個行程"""
+        if not jobs:
+            return
+        if len(jobs) == 1 or self.max_workers == 1:
+            for job in jobs:
+                render_card(job)
+            return
+        workers = min(self.max_workers or os.cpu_count() or 1, len(jobs))
+        # 分批送出，減少行程間通訊的次數
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(render_card, jobs, chunksize=chunksize):
+                pass
@@ -0,0 +1,449 @@
+"""
+效能預算檢查 - 量測產生的網站檔案並與設定的預算比較
+
+量測項目：
+- 每個檔案的大小與 gzip 壓縮後的大小（圖片等已壓縮的檔案不再壓縮）
+- HTML 頁面的 DOM 元素數、表格列 (<tr>) 數、平均每列的大小與元素數
+- 阻擋渲染的外部資源（外部樣式表，以及 <head> 中沒有 async/defer 的外部腳本）
+- 內嵌腳本的大小
+
+HTML 以正規表示式逐一掃描標籤，略過註解、腳本與樣式內容，不建立 DOM 樹，
+十萬列的首頁也能在建置時快速量測。
+"""
+
+import fnmatch
+import gzip
+import json
+import os
+import re
+import tarfile
+import tomllib
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 可設定預算的量測項目 -> 顯示名稱
+METRICS: Dict[str, str] = {
+    "bytes": "大小",
+    "gzip_bytes": "gzip 後大小",
+    "dom_nodes": "DOM 元素數",
+    "rows": "表格列數",
+    "bytes_per_row": "平均每列大小",
+    "nodes_per_row": "平均每列元素數",
+    "blocking_resources": "阻擋渲染的外部資源數",
+    "inline_script_bytes": "內嵌腳本大小",
+}
+
+# 整個網站的預算可設定的項目
+TOTAL_METRICS = ("bytes", "gzip_bytes")
+
+# 以 gzip 傳輸的檔案類型，其他類型（圖片、字型等）已經壓縮過
+_COMPRESSIBLE_SUFFIXES = (
+    ".html",
+    ".css",
+    ".js",
+    ".json",
+    ".ndjson",
+    ".csv",
+    ".xml",
+    ".svg",
+    ".txt",
+)
+
+# HTML 中的註解、腳本或樣式元素，以及一般的開始標籤
+_TOKEN_RE = re.compile(
+    rb"<!--.*?-->"
+    rb"|<(script|style)\b([^>]*)>(.*?)</\1\s*>"
+    rb"|<([a-zA-Z][\w:-]*)([^>]*)>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# 標籤屬性
+_ATTR_RE = re.compile(
+    rb"""([^\s"'=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?"""
+)
+
+_HEAD_END_RE = re.compile(rb"</head\s*>", re.IGNORECASE)
+
+
+@dataclass
+class FileMetrics:
+    """一個輸出檔案的量測結果，非 HTML 檔案只有大小"""
+
+    path: str
+    bytes: int
+    gzip_bytes: int
+    dom_nodes: Optional[int] = None
+    rows: Optional[int] = None
+    bytes_per_row: Optional[int] = None
+    nodes_per_row: Optional[int] = None
+    blocking_resources: Optional[int] = None
+    inline_script_bytes: Optional[int] = None
+    # 阻擋渲染的外部資源網址
+    blocking_urls: List[str] = field(default_factory=list)
+
+    def value(self, metric: str) -> Optional[int]:
+        """取得量測項目的值，不適用時為 None"""
+        value = getattr(self, metric)
+        return value if isinstance(value, int) else None
+
+
+@dataclass
+class Violation:
+    """超過預算的項目"""
+
+    target: str
+    metric: str
+    actual: int
+    limit: int
+    # 上次建置的值，沒有紀錄時為 None
+    previous: Optional[int] = None
+
+    def describe(self) -> str:
+        """以一行文字說明超過的幅度與和上次建置的差異"""
+        over = self.actual - self.limit
+        percent = f"，+{over / self.limit:.1%}" if self.limit else ""
+        line = (
+            f"{self.target} {METRICS[self.metric]} ({self.metric}): "
+            f"{self.actual:,} > 預算 {self.limit:,} (+{over:,}{percent})"
+        )
+        if self.previous is not None:
+            line += f"；上次建置 {self.previous:,} ({self.actual - self.previous:+,})"
+        return line
+
+
+@dataclass
+class PerfBudget:
+    """效能預算設定"""
+
+    # 整個網站的預算：量測項目 -> 上限
+    total: Dict[str, int] = field(default_factory=dict)
+    # 檔案的預算：(路徑模式, 量測項目 -> 上限)，依設定檔中的順序
+    files: List[Tuple[str, Dict[str, int]]] = field(default_factory=list)
+
+
+def _attributes(raw: bytes) -> Dict[bytes, bytes]:
+    """解析標籤屬性，名稱轉為小寫"""
+    attrs = {}
+    for match in _ATTR_RE.finditer(raw):
+        name, *values = match.groups()
+        attrs[name.lower()] = next((v for v in values if v is not None), b"")
+    return attrs
+
+
+def _is_external(url: bytes) -> bool:
+    return url.startswith((b"http://", b"https://", b"//"))
+
+
+def _blocking_url(
+    tag: bytes, attrs: Dict[bytes, bytes], in_head: bool
+) -> Optional[bytes]:
+    """
+    外部樣式表，或 <head> 中沒有 async/defer 的外部腳本會阻擋頁面渲染
+
+    Returns:
+        阻擋渲染的資源網址，不會阻擋時為 None
+    """
+    if tag == b"link":
+        href = attrs.get(b"href", b"")
+        if (
+            b"stylesheet" in attrs.get(b"rel", b"").lower().split()
+            and _is_external(href)
+            and attrs.get(b"media", b"all").lower() != b"print"
+        ):
+            return href
+        return None
+    src = attrs.get(b"src", b"")
+    if (
+        _is_external(src)
+        and in_head
+        and b"async" not in attrs
+        and b"defer" not in attrs
+        and attrs.get(b"type", b"").lower() != b"module"
+    ):
+        return src
+    return None
+
+
+def measure_html(content: bytes, metrics: FileMetrics) -> None:
+    """
+    量測 HTML 頁面的 DOM 規模、阻擋渲染的資源與內嵌腳本
+
+    Args:
+        content: 頁面內容
+        metrics: 寫入量測結果的物件
+    """
+    head_end = _HEAD_END_RE.search(content)
+    head_end_pos = head_end.start() if head_end else 0
+    # 平均每列的大小與元素數只計算第一個 <tr> 到最後一個 </tr> 之間，
+    # 不受頁面其他部分影響
+    rows_end = content.rfind(b"</tr>") + len(b"</tr>")
+    rows_start = -1
+    nodes = rows = row_nodes = inline_script = 0
+    blocking: List[str] = []
+
+    for match in _TOKEN_RE.finditer(content):
+        raw_tag = match.group(1) or match.group(4)
+        if raw_tag is None:
+            continue  # 註解
+        nodes += 1
+        tag = raw_tag.lower()
+        if tag == b"tr":
+            rows += 1
+            if rows_start < 0:
+                rows_start = match.start()
+        if rows_start >= 0 and match.start() < rows_end:
+            row_nodes += 1
+        if tag not in (b"link", b"script"):
+            continue
+        attrs = _attributes(match.group(2) or match.group(5) or b"")
+        if tag == b"script" and b"src" not in attrs:
+            inline_script += len(match.group(3))
+            continue
+        url = _blocking_url(tag, attrs, match.start() < head_end_pos)
+        if url is not None:
+            blocking.append(url.decode("utf-8", "replace"))
+
+    metrics.dom_nodes = nodes
+    metrics.rows = rows
+    metrics.blocking_resources = len(blocking)
+    metrics.blocking_urls = blocking
+    metrics.inline_script_bytes = inline_script
+    if rows:
+        metrics.bytes_per_row = (rows_end - rows_start) // rows
+        metrics.nodes_per_row = row_nodes // rows
+
+
+def measure_file(path: str, content: bytes) -> FileMetrics:
+    """
+    量測一個輸出檔案
+
+    Args:
+        path: 相對於網站根目錄的 POSIX 路徑
+        content: 檔案內容
+
+    Returns:
+        FileMetrics
+    """
+    suffix = PurePosixPath(path).suffix.lower()
+    gzip_bytes = len(content)
+    if suffix in _COMPRESSIBLE_SUFFIXES:
+        gzip_bytes = len(gzip.compress(content, compresslevel=6, mtime=0))
+    metrics = FileMetrics(path=path, bytes=len(content), gzip_bytes=gzip_bytes)
+    if suffix in (".html", ".htm"):
+        measure_html(content, metrics)
+    return metrics
+
+
+def iter_output_files(target: str) -> Iterator[Tuple[str, bytes]]:
+    """
+    逐一讀取輸出目錄或封存檔中的檔案
+
+    Args:
+        target: 輸出目錄，或 .zip、.tar、.tar.gz、.tgz 封存檔路徑
+
+    Returns:
+        (相對於網站根目錄的 POSIX 路徑, 檔案內容)，依路徑排序
+    """
+    if os.path.isdir(target):
+        paths = []
+        for root, _, names in os.walk(target):
+            for name in names:
+                full_path = os.path.join(root, name)
+                paths.append(os.path.relpath(full_path, target).replace(os.sep, "/"))
+        for path in sorted(paths):
+            with open(os.path.join(target, *path.split("/")), "rb") as f:
+                yield path, f.read()
+    elif zipfile.is_zipfile(target):
+        with zipfile.ZipFile(target) as archive:
+            for name in sorted(archive.namelist()):
+                if not name.endswith("/"):
+                    yield name, archive.read(name)
+    else:
+        with tarfile.open(target) as archive:
+            members = sorted(archive.getmembers(), key=lambda m: m.name)
+            for member in members:
+                extracted = archive.extractfile(member) if member.isfile() else None
+                if extracted is not None:
+                    yield member.name, extracted.read()
+
+
+def measure_output(files: Iterable[Tuple[str, bytes]]) -> List[FileMetrics]:
+    """
+    量測所有輸出檔案
+
+    Args:
+        files: (路徑, 內容)，例如 iter_output_files 的結果
+
+    Returns:
+        每個檔案的量測結果
+    """
+    return [measure_file(path, content) for path, content in files]
+
+
+def load_budget(path: str) -> PerfBudget:
+    """
+    讀取 TOML 格式的效能預算設定檔
+
+    [total] 表格設定整個網站的預算；[files."<路徑模式>"] 表格設定符合模式的
+    每個檔案的預算，模式使用 fnmatch 語法（例如 "*.json"）。
+
+    Args:
+        path: 設定檔路徑
+
+    Returns:
+        PerfBudget
+
+    Raises:
+        ValueError: 設定檔內容不正確
+    """
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+
+    unknown = sorted(set(config) - {"total", "files"})
+    if unknown:
+        raise ValueError(f"不支援的設定: {', '.join(unknown)}")
+
+    budget = PerfBudget(total=_limits("total", config.get("total", {}), TOTAL_METRICS))
+    for pattern, limits in config.get("files", {}).items():
+        budget.files.append((pattern, _limits(pattern, limits, tuple(METRICS))))
+    return budget
+
+
+def _limits(name: str, limits: object, allowed: Tuple[str, ...]) -> Dict[str, int]:
+    """檢查預算表格中的項目與數值"""
+    if not isinstance(limits, dict):
+        raise ValueError(f"{name} 必須是表格")
+    for metric, limit in limits.items():
+        if metric not in allowed:
+            raise ValueError(
+                f"{name} 有不支援的項目: {metric}（可用的項目: {', '.join(allowed)}）"
+            )
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+            raise ValueError(f"{name} 的 {metric} 必須是非負整數")
+    return dict(limits)
+
+
+def totals(metrics: List[FileMetrics]) -> Dict[str, int]:
+    """整個網站的總大小與 gzip 後總大小"""
+    return {
+        metric: sum(m.value(metric) or 0 for m in metrics) for metric in TOTAL_METRICS
+    }
+
+
+def check_budget(
+    metrics: List[FileMetrics],
+    budget: PerfBudget,
+    previous: Optional[Dict[str, Dict[str, int]]] = None,
+) -> List[Violation]:
+    """
+    比較量測結果與預算
+
+    Args:
+        metrics: 每個檔案的量測結果
+        budget: 效能預算
+        previous: 上次建置的量測值（snapshot_metrics 的結果），用於顯示差異
+
+    Returns:
+        超過預算的項目，依設定檔的順序
+    """
+    previous = previous or {}
+    violations = []
+    site_totals = totals(metrics)
+    for metric, limit in budget.total.items():
+        if site_totals[metric] > limit:
+            violations.append(
+                Violation(
+                    "全部檔案",
+                    metric,
+                    site_totals[metric],
+                    limit,
+                    previous.get("", {}).get(metric),
+                )
+            )
+    for pattern, limits in budget.files:
+        for file_metrics in metrics:
+            if not fnmatch.fnmatchcase(file_metrics.path, pattern):
+                continue
+            for metric, limit in limits.items():
+                actual = file_metrics.value(metric)
+                if actual is not None and actual > limit:
+                    violations.append(
+                        Violation(
+                            file_metrics.path,
+                            metric,
+                            actual,
+                            limit,
+                            previous.get(file_metrics.path, {}).get(metric),
+                        )
+                    )
+    return violations
+
+
+def snapshot_metrics(metrics: List[FileMetrics]) -> Dict[str, Dict[str, int]]:
+    """
+    將量測結果轉換為可保存的格式，下次建置時用來比較差異
+
+    Returns:
+        路徑 -> 量測項目 -> 值；整個網站的總計使用空字串作為路徑
+    """
+    result = {"": totals(metrics)}
+    for file_metrics in metrics:
+        values = asdict(file_metrics)
+        result[file_metrics.path] = {
+            metric: values[metric] for metric in METRICS if values[metric] is not None
+        }
+    return result
+
+
+def format_report(metrics: List[FileMetrics], violations: List[Violation]) -> str:
+    """
+    產生量測摘要與超過預算的項目報告
+
+    Args:
+        metrics: 每個檔案的量測結果
+        violations: 超過預算的項目
+
+    Returns:
+        報告文字
+    """
+    site_totals = totals(metrics)
+    lines = [
+        f"效能預算：{len(metrics)} 個檔案，共 {site_totals['bytes']:,} bytes"
+        f"（gzip 後 {site_totals['gzip_bytes']:,} bytes）"
+    ]
+    for file_metrics in metrics:
+        if file_metrics.dom_nodes is None:
+            continue
+        lines.append(
+            f"  {file_metrics.path}: gzip 後 {file_metrics.gzip_bytes:,} bytes，"
+            f"{file_metrics.dom_nodes:,} 個元素，{file_metrics.rows:,} 列，"
+            f"阻擋渲染的外部資源 {file_metrics.blocking_resources}，"
+            f"內嵌腳本 {file_metrics.inline_script_bytes:,} bytes"
+        )
+    if violations:
+        lines.append(f"超過預算的項目（{len(violations)}）：")
+        lines.extend(f"  {violation.describe()}" for violation in violations)
+    else:
+        lines.append("所有項目都在預算內")
+    return "\n".join(lines)
+
+
+def load_previous_metrics(path: str) -> Optional[Dict[str, Dict[str, int]]]:
+    """讀取上次建置的量測值，檔案不存在或損壞時為 None"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return previous if isinstance(previous, dict) else None
+
+
+def save_metrics(path: str, metrics: List[FileMetrics]) -> None:
+    """保存本次建置的量測值"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot_metrics(metrics), f, ensure_ascii=False, indent=1)
@@ -0,0 +1,348 @@
+"""
+查詢伺服器 - 在記憶體中保存資料與查詢索引，依查詢條件在伺服器端渲染首頁
+
+資料量很大時，靜態首頁需要一次下載並在瀏覽器端篩選所有資料行。查詢伺服器改為依
+?category=&author=&q=&page= 在伺服器端篩選，並以首頁模板只渲染一頁的資料行。
+渲染結果（含 gzip 壓縮版本與 ETag）以 LRU 快取保存，快取鍵為資料版本與查詢條件，
+資料更新後舊的結果不會再被使用。首頁以外的路徑（樣式表、統計頁面、下載檔等）
+直接由建置好的輸出目錄提供。
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache, partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from src.application.html_generator import HtmlGenerator
+from src.domain.facets import FacetValue, build_facets
+from src.domain.models import SheetData
+from src.domain.search_index import SearchIndex
+
+# 每頁的資料行數
+DEFAULT_PAGE_SIZE = 100
+
+# 快取的渲染結果數量
+DEFAULT_CACHE_SIZE = 1024
+
+# 由查詢伺服器渲染的路徑
+VIEW_PATHS = ("/", "/index.html")
+
+# 關鍵字的最大長度
+MAX_QUERY_LENGTH = 100
+
+# 作者選單列出的作者數（依作品數，目前篩選的作者一定會列出）
+AUTHOR_OPTIONS = 50
+
+# 小於此大小的回應不壓縮
+_MIN_COMPRESS_SIZE = 512
+
+
+@dataclass(frozen=True)
+class ViewQuery:
+    """首頁的查詢條件"""
+
+    category: str = ""
+    author: str = ""
+    q: str = ""
+    page: int = 1
+
+    @classmethod
+    def parse(cls, query_string: str) -> "ViewQuery":
+        """
+        解析網址中的查詢字串，無效的頁碼視為第 1 頁
+
+        Args:
+            query_string: 查詢字串（不含 ?）
+
+        Returns:
+            ViewQuery
+        """
+        params = parse_qs(query_string)
+
+        def first(name: str) -> str:
+            return params.get(name, [""])[0].strip()
+
+        try:
+            page = int(first("page") or 1)
+        except ValueError:
+            page = 1
+        return cls(
+            category=first("category"),
+            author=first("author"),
+            q=first("q")[:MAX_QUERY_LENGTH],
+            page=max(1, page),
+        )
+
+    def url(self, **changes: Any) -> str:
+        """
+        取得修改部分條件後的查詢網址，供模板產生連結
+
+        Args:
+            **changes: 要修改的條件
+
+        Returns:
+            以 ? 開頭的相對網址
+        """
+        query = replace(self, **changes)
+        params = [
+            (name, value)
+            for name, value in (
+                ("category", query.category),
+                ("author", query.author),
+                ("q", query.q),
+            )
+            if value
+        ]
+        if query.page > 1:
+            params.append(("page", str(query.page)))
+        return "?" + urlencode(params)
+
+
+@dataclass(frozen=True)
+class ViewResponse:
+    """渲染好的回應"""
+
+    body: bytes
+    etag: str
+    # gzip 壓縮的內容，回應太小時為 None
+    gzipped: Optional[bytes]
+
+
+class _ViewState:
+    """某個版本的資料與其索引，資料更新時整個替換"""
+
+    def __init__(
+        self, generator: HtmlGenerator, data: SheetData, updated_at: datetime
+    ) -> None:
+        self.data, self.indices = generator.prepare_data(data)
+        self.facets: Dict[str, List[FacetValue]] = build_facets(self.data, self.indices)
+        self.index = SearchIndex(self.data, self.indices, self.facets)
+        self.updated_at = updated_at
+        content = json.dumps([self.data.headers, self.data.rows], ensure_ascii=False)
+        self.version = hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+
+
+class QueryViews:
+    """依查詢條件渲染首頁，並快取渲染結果"""
+
+    def __init__(
+        self,
+        html_generator: HtmlGenerator,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """
+        初始化
+
+        Args:
+            html_generator: HTML 生成器（使用其模板與資料處理設定）
+            page_size: 每頁的資料行數
+            cache_size: 快取的渲染結果數量
+        """
+        self.html_generator = html_generator
+        self.page_size = page_size
+        self._state: Optional[_ViewState] = None
+        # 快取鍵包含資料狀態，因此不會使用到舊版本資料的渲染結果
+        self._render_cached = lru_cache(maxsize=cache_size)(self._render_uncached)
+
+    @property
+    def version(self) -> Optional[str]:
+        """目前資料的版本，尚未載入資料時為 None"""
+        return self._state.version if self._state is not None else None
+
+    def update(self, data: SheetData) -> None:
+        """
+        載入新的資料：合併重複投稿、過濾敏感資料並建立查詢索引
+
+        Args:
+            data: 原始資料
+        """
+        updated_at = datetime.now(self.html_generator.timestamp_parser.tz)
+        self._state = _ViewState(self.html_generator, data, updated_at)
+        # 舊版本的結果不會再被使用，釋放其記憶體
+        self._render_cached.cache_clear()
+
+    def response(self, query: ViewQuery) -> ViewResponse:
+        """
+        取得查詢條件對應的回應
+
+        Args:
+            query: 查詢條件
+
+        Returns:
+            ViewResponse
+
+        Raises:
+            RuntimeError: 尚未載入資料
+        """
+        state = self._state
+        if state is None:
+            raise RuntimeError("查詢伺服器尚未載入資料")
+        return self._render_cached(state, query)
+
+    def cache_info(self) -> Any:
+        """快取的命中統計"""
+        return self._render_cached.cache_info()
+
+    def _render_uncached(self, state: _ViewState, query: ViewQuery) -> ViewResponse:
+        """渲染查詢結果的其中一頁"""
+        row_ids = state.index.search(query.category, query.author, query.q)
+        pages = max(1, -(-len(row_ids) // self.page_size))
+        query = replace(query, page=min(query.page, pages))
+        start = (query.page - 1) * self.page_size
+
+        html = self.html_generator.render_view(
+            state.data,
+            state.indices,
+            state.facets,
+            row_ids[start : start + self.page_size],
+            state.updated_at,
+            query=query,
+            total=len(row_ids),
+            pages=pages,
+            row_count=state.data.row_count,
+            authors=self._author_options(state, query.author),
+        )
+        body = html.encode("utf-8")
+        etag = f'"{state.version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+        gzipped = None
+        if len(body) >= _MIN_COMPRESS_SIZE:
+            gzipped = gzip.compress(body, compresslevel=6, mtime=0)
+        return ViewResponse(body=body, etag=etag, gzipped=gzipped)
+
+    @staticmethod
+    def _author_options(state: _ViewState, selected: str) -> List[FacetValue]:
+        """作者選單的選項：作品最多的作者，以及目前篩選的作者"""
+        authors = state.facets.get("author", [])
+        options = authors[:AUTHOR_OPTIONS]
+        if selected and all(author.value != selected for author in options):
+            options += [author for author in authors if author.value == selected]
+        return options
+
+
+class QueryRequestHandler(SimpleHTTPRequestHandler):
+    """首頁由查詢結果渲染，其他路徑提供輸出目錄中的檔案"""
+
+    # 使用持續連線，避免每個請求都重新建立連線
+    protocol_version = "HTTP/1.1"
+    # 標頭與內容分開寫出，持續連線下 Nagle 演算法會讓每個回應
+    # 多等一次延遲確認（約 40 ms）
+    disable_nagle_algorithm = True
+
+    def __init__(self, *args: Any, views: QueryViews, **kwargs: Any) -> None:
+        self.views = views
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """不輸出每個請求的紀錄"""
+
+    def do_GET(self) -> None:
+        """處理 GET 請求"""
+        if urlsplit(self.path).path not in VIEW_PATHS:
+            super().do_GET()
+            return
+        body = self._prepare_view()
+        if body is not None:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        """處理 HEAD 請求"""
+        if urlsplit(self.path).path not in VIEW_PATHS:
+            super().do_HEAD()
+            return
+        self._prepare_view()
+
+    def _prepare_view(self) -> Optional[bytes]:
+        """
+        送出查詢結果的回應標頭
+
+        Returns:
+            回應內容，304 時為 None
+        """
+        response = self.views.response(ViewQuery.parse(urlsplit(self.path).query))
+
+        if response.etag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", response.etag)
+            self.end_headers()
+            return None
+
+        body = response.body
+        compressed = False
+        if response.gzipped is not None and "gzip" in self.headers.get(
+            "Accept-Encoding", ""
+        ):
+            body = response.gzipped
+            compressed = True
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", response.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        return body
+
+
+class _QueryHTTPServer(ThreadingHTTPServer):
+    """允許較多等待中的連線，大量同時連線時不會被拒絕"""
+
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class QueryServer:
+    """查詢伺服器"""
+
+    def __init__(
+        self,
+        views: QueryViews,
+        directory: str,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+    ) -> None:
+        """
+        初始化伺服器
+
+        Args:
+            views: 查詢結果渲染器（需已載入資料）
+            directory: 提供靜態檔案的輸出目錄
+            host: 監聽位址
+            port: 監聽埠號，0 表示自動選擇
+        """
+        self.views = views
+        handler = partial(QueryRequestHandler, directory=directory, views=views)
+        self.httpd = _QueryHTTPServer((host, port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """伺服器網址"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def start(self) -> None:
+        """在背景執行緒中啟動伺服器"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """在目前的執行緒中執行伺服器，直到呼叫 stop()"""
+        self.httpd.serve_forever()
+
+    def stop(self) -> None:
+        """停止伺服器"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
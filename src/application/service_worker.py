@@ -0,0 +1,76 @@
+"""
+Service worker 生成器 - 產生預先快取清單與 sw.js
+
+清單中的每個項目為網站中的網址與其內容的雜湊值，清單本身的版本是所有項目的雜湊值，
+並寫入 sw.js。網站內容改變時 sw.js 也會改變，瀏覽器因此安裝新的 service worker，
+並只下載雜湊值改變的檔案；內容不變的檔案（例如樣式表）直接沿用快取。
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable
+
+# 輸出的檔案路徑（service worker 必須位於網站根目錄才能控制整個網站）
+SERVICE_WORKER_PATH = "sw.js"
+MANIFEST_PATH = "precache-manifest.json"
+
+# 預先快取的靜態資源類型（圖片等較大的檔案不預先快取）
+PRECACHE_SUFFIXES = (".css", ".js", ".json", ".svg", ".woff2")
+
+# 頁面引用的 CDN，網址帶有版本號，第一次使用後快取
+CDN_ORIGINS = ("https://cdn.jsdelivr.net",)
+
+# sw.js 原始碼中代換為設定的位置
+_CONFIG_PLACEHOLDER = "__SERVICE_WORKER_CONFIG__"
+
+
+@dataclass(frozen=True)
+class PrecacheEntry:
+    """預先快取清單中的一個項目"""
+
+    url: str
+    revision: str
+
+
+def build_precache_manifest(entries: Iterable[PrecacheEntry]) -> dict:
+    """
+    建立預先快取清單
+
+    Args:
+        entries: 清單項目（網址相對於網站根目錄）
+
+    Returns:
+        {"version": 清單版本, "entries": 依網址排序的項目}
+    """
+    items = [asdict(entry) for entry in sorted(set(entries), key=lambda e: e.url)]
+    digest = hashlib.sha1(
+        json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()[:12]
+    return {"version": digest, "entries": items}
+
+
+def render_service_worker(source: Path, manifest: dict, index_path: str) -> str:
+    """
+    在 sw.js 原始碼中填入設定
+
+    Args:
+        source: sw.js 原始碼路徑
+        manifest: 預先快取清單
+        index_path: 首頁路徑
+
+    Returns:
+        sw.js 內容
+    """
+    config = {
+        "version": manifest["version"],
+        "manifest": MANIFEST_PATH,
+        "index": index_path,
+        "cdn_origins": list(CDN_ORIGINS),
+    }
+    with open(source, "r", encoding="utf-8") as f:
+        script = f.read()
+    if _CONFIG_PLACEHOLDER not in script:
+        raise ValueError(f"{source} 中沒有 {_CONFIG_PLACEHOLDER}")
+    return script.replace(_CONFIG_PLACEHOLDER, json.dumps(config, ensure_ascii=False))
@@ -4,18 +4,62 @@ Google Sheets 服務 - 負責從 Google Sheets 取得資料
 
 import json
 import os
+from typing import Any, Dict, Optional
 
 import gspread
+import requests
 from oauth2client.service_account import ServiceAccountCredentials
 
 from src.domain.models import SheetData
+from src.infrastructure.snapshot import write_snapshot
+
+# gspread 使用的 Google API 網址前綴，設定 api_base_url 時改寫為該位址
+GOOGLE_API_ORIGINS = ("https://sheets.googleapis.com", "https://www.googleapis.com")
+
+
+class _ApiBaseUrlSession(requests.Session):
+    """將 Google API 的請求改送到指定的位址（例如本機的模擬 API 伺服器）"""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+
+    def request(  # type: ignore[override]
+        self, method: str, url: str, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        for origin in GOOGLE_API_ORIGINS:
+            if url.startswith(origin + "/"):
+                url = self.base_url + url[len(origin) :]
+                break
+        return super().request(method, url, *args, **kwargs)
 
 
 class SheetService:
     """Google Sheets 服務類別"""
 
-    def __init__(self) -> None:
-        """初始化服務，設定 Google Sheets API 認證"""
+    def __init__(
+        self, snapshot_path: Optional[str] = None, api_base_url: Optional[str] = None
+    ) -> None:
+        """
+        初始化服務，設定 Google Sheets API 認證
+
+        Args:
+            snapshot_path: 快照檔路徑，設定後每次擷取的資料都會保存為快照
+            api_base_url: 改用此位址的 Sheets/Drive API（例如本機的模擬伺服器），
+                不需要憑證
+        """
+        self.snapshot_path = snapshot_path
+
+        # 已開啟的試算表，長時間執行時不必每次重新讀取中繼資料
+        self._spreadsheets: Dict[str, gspread.Spreadsheet] = {}
+
+        if api_base_url:
+            self.credentials = None
+            self.client = gspread.Client(
+                None, session=_ApiBaseUrlSession(api_base_url)  # type: ignore[arg-type]
+            )
+            return
+
         # 在CI環境中使用環境變數中的憑證
         credentials_json = os.getenv("GOOGLE_CREDENTIALS")
         if credentials_json:
@@ -41,6 +85,28 @@ class SheetService:
 
         self.client = gspread.authorize(self.credentials)
 
+    def _open(self, spreadsheet_id: str) -> gspread.Spreadsheet:
+        """開啟試算表，並快取開啟的結果"""
+        spreadsheet = self._spreadsheets.get(spreadsheet_id)
+        if spreadsheet is None:
+            spreadsheet = self.client.open_by_key(spreadsheet_id)
+            self._spreadsheets[spreadsheet_id] = spreadsheet
+        return spreadsheet
+
+    def get_last_updated(self, spreadsheet_id: str) -> str:
+        """
+        取得試算表最後修改的時間
+
+        只讀取 Drive 中繼資料，比擷取整個工作表便宜得多，可用來判斷資料是否變更。
+
+        Args:
+            spreadsheet_id: Google Sheets 的 ID
+
+        Returns:
+            RFC 3339 格式的最後修改時間
+        """
+        return self._open(spreadsheet_id).get_lastUpdateTime()
+
     def get_sheet_data(self, spreadsheet_id: str, sheet_name: str) -> SheetData:
         """
         從 Google Sheets 擷取資料
@@ -53,17 +119,20 @@ class SheetService:
             SheetData: 包含表頭和資料的物件
         """
         # 打開 Google Sheets
-        sheet = self.client.open_by_key(spreadsheet_id).worksheet(sheet_name)
+        sheet = self._open(spreadsheet_id).worksheet(sheet_name)
 
         # 獲取所有資料
         all_values = sheet.get_all_values()
 
         # 如果表格是空的，返回空資料
         if not all_values:
-            return SheetData(headers=[], rows=[])
+            data = SheetData(headers=[], rows=[])
+        else:
+            # 將第一行作為表頭，其餘為資料
+            data = SheetData(headers=all_values[0], rows=all_values[1:])
 
-        # 將第一行作為表頭，其餘為資料
-        headers = all_values[0]
-        rows = all_values[1:]
+        # 保存快照，之後可以不經過 API 直接重新產生網站
+        if self.snapshot_path:
+            write_snapshot(data, self.snapshot_path)
 
-        return SheetData(headers=headers, rows=rows)
+        return data
@@ -0,0 +1,132 @@
+"""
+監看模式 - 模板或靜態資源變更時，只重新產生受影響的輸出並通知瀏覽器重新載入
+"""
+
+import os
+import time
+from typing import List, Optional, Set
+
+from src.application.html_generator import HtmlGenerator
+from src.domain.models import SheetData
+from src.infrastructure.dev_server import DevServer
+from src.infrastructure.file_watcher import PollingWatcher
+
+
+class WatchBuilder:
+    """依變更的檔案增量重建網站"""
+
+    def __init__(
+        self, html_generator: HtmlGenerator, data: SheetData, output_dir: str
+    ) -> None:
+        """
+        初始化建置器
+
+        Args:
+            html_generator: HTML 生成器
+            data: 快取的表格資料，重建時不會重新擷取
+            output_dir: 輸出目錄路徑
+        """
+        self.html_generator = html_generator
+        self.output_dir = output_dir
+        # 過濾敏感資料只需要做一次
+        self.data, self.indices = html_generator.prepare_data(data)
+        self.template_dir = os.path.abspath(html_generator.template_dir)
+        self.static_dir = os.path.abspath(html_generator.static_dir)
+
+    def build_all(self) -> None:
+        """完整產生一次網站，沿用初始化時過濾過的資料"""
+        self.html_generator.generate_prepared(self.data, self.output_dir, self.indices)
+
+    def rebuild(self, changed: Set[str]) -> List[str]:
+        """
+        依變更的檔案重建受影響的輸出
+
+        模板變更時重新渲染頁面；靜態資源變更時只複製（或移除）變更的檔案。
+
+        Args:
+            changed: 變更的來源檔案路徑
+
+        Returns:
+            更新的輸出檔案路徑（相對於輸出目錄）
+        """
+        outputs: List[str] = []
+        if any(_is_within(path, self.template_dir) for path in changed):
+            outputs.extend(
+                self.html_generator.render_pages(
+                    self.data, self.output_dir, self.indices
+                )
+            )
+
+        for path in sorted(changed):
+            if _is_within(path, self.static_dir):
+                output = self.html_generator.copy_static_file(path, self.output_dir)
+                if output:
+                    outputs.append(output)
+
+        return outputs
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """判斷路徑是否位於目錄之下"""
+    return os.path.abspath(path).startswith(directory + os.sep)
+
+
+def run_watch(
+    html_generator: HtmlGenerator,
+    data: SheetData,
+    output_dir: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    interval: float = 0.2,
+    max_cycles: Optional[int] = None,
+) -> None:
+    """
+    產生網站、啟動開發伺服器，並持續監看模板與靜態資源
+
+    Args:
+        html_generator: HTML 生成器
+        data: 快取的表格資料
+        output_dir: 輸出目錄路徑
+        host: 伺服器監聽位址
+        port: 伺服器監聽埠號
+        interval: 檔案輪詢間隔（秒）
+        max_cycles: 最多處理的重建次數，None 表示持續執行直到中斷
+    """
+    # 開發時不產生 service worker，以免快取的頁面蓋過即時重新載入
+    html_generator.service_worker = False
+    builder = WatchBuilder(html_generator, data, output_dir)
+    builder.build_all()
+
+    server = DevServer(output_dir, host=host, port=port)
+    server.start()
+    print(f"開發伺服器已啟動：{server.url}（按 Ctrl+C 結束）")
+
+    watcher = PollingWatcher(
+        [builder.template_dir, builder.static_dir], interval=interval
+    )
+    cycles = 0
+
+    def on_change(changed: Set[str]) -> None:
+        nonlocal cycles
+        cycles += 1
+        start = time.perf_counter()
+        try:
+            outputs = builder.rebuild(changed)
+        except Exception as e:
+            # 模板語法錯誤等問題只顯示訊息，繼續監看
+            print(f"重建失敗: {e}")
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        if outputs:
+            print(f"已更新 {', '.join(outputs)}（{elapsed:.0f} ms）")
+            server.reload(outputs)
+
+    try:
+        watcher.watch(
+            on_change,
+            should_stop=lambda: max_cycles is not None and cycles >= max_cycles,
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
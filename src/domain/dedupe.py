@@ -0,0 +1,152 @@
+"""
+重複投稿合併 - 將作品連結正規化為標準網址，合併指向同一作品的重複投稿
+
+同一件作品常被重複投稿，或只差在 http/https、主機名稱大小寫、追蹤參數與結尾斜線。
+標準網址作為雜湊索引的鍵，一次掃描即可找出所有重複的資料行，
+並依設定保留時間最早或最晚的一筆。
+"""
+
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from src.domain.models import SheetData
+from src.domain.timestamps import TimestampParser
+
+# 合併重複投稿時可使用的保留規則
+KEEP_EARLIEST = "earliest"
+KEEP_LATEST = "latest"
+KEEP_POLICIES = (KEEP_EARLIEST, KEEP_LATEST)
+
+# 不影響內容的追蹤參數
+TRACKING_PARAMS = frozenset(
+    [
+        "fbclid",
+        "gclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "si",
+        "usp",
+        "yclid",
+    ]
+)
+
+# 預設連接埠
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(value: str) -> str:
+    """
+    將連結轉換為用於比對的標準網址
+
+    統一使用 https、主機名稱轉為小寫並省略預設連接埠、移除追蹤參數、
+    依名稱排序查詢參數，並去除路徑結尾的斜線。片段（#...）會保留：
+    使用雜湊路由的網站或同一篇長文中的不同錨點可能是不同的作品。
+
+    Args:
+        value: 儲存格中的連結
+
+    Returns:
+        標準網址，空白時為空字串；無法解析時回傳去除空白的原始值
+    """
+    url = value.strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "https://" + url
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return value.strip()
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname or " " in parts.netloc:
+        return value.strip()
+
+    host = parts.hostname
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    query = sorted(
+        (name, param)
+        for name, param in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    )
+    canonical = f"https://{host}{parts.path.rstrip('/')}"
+    if query:
+        canonical += "?" + urlencode(query)
+    if parts.fragment:
+        canonical += "#" + parts.fragment
+    return canonical
+
+
+def _prefer_current(
+    previous_time: Optional[float], current_time: Optional[float], keep: str
+) -> bool:
+    """判斷較後面的資料行是否應取代目前保留的資料行"""
+    if previous_time is None or current_time is None:
+        return keep == KEEP_LATEST
+    if keep == KEEP_EARLIEST:
+        return current_time < previous_time
+    return current_time >= previous_time
+
+
+def dedupe_submissions(
+    data: SheetData,
+    link_index: int,
+    timestamp_index: int = -1,
+    keep: str = KEEP_EARLIEST,
+    timestamp_parser: Optional[TimestampParser] = None,
+) -> SheetData:
+    """
+    合併作品連結相同的資料行
+
+    時間戳記無法比較時，"earliest" 保留較前面的資料行，"latest" 保留較後面的資料行。
+    沒有連結的資料行一律保留。
+
+    Args:
+        data: 表格資料
+        link_index: 作品連結欄位索引
+        timestamp_index: 時間戳記欄位索引，-1 表示沒有該欄位
+        keep: 保留規則，"earliest" 或 "latest"
+        timestamp_parser: 時間戳記解析器
+
+    Returns:
+        合併後的表格資料，保留的資料行維持原本的順序；沒有重複時回傳原資料
+    """
+    if keep not in KEEP_POLICIES:
+        raise ValueError(f"不支援的保留規則: {keep}")
+    if link_index < 0:
+        return data
+    timestamp_parser = timestamp_parser or TimestampParser()
+
+    def epoch(row: List[str]) -> Optional[float]:
+        if timestamp_index < 0 or timestamp_index >= len(row):
+            return None
+        return timestamp_parser.epoch(row[timestamp_index])
+
+    # 標準網址 -> 目前保留的資料行編號
+    kept: Dict[str, int] = {}
+    keep_rows = [True] * len(data.rows)
+    for row_id, row in enumerate(data.rows):
+        key = canonical_url(row[link_index]) if link_index < len(row) else ""
+        if not key:
+            continue
+        previous = kept.get(key)
+        if previous is None:
+            kept[key] = row_id
+            continue
+
+        if _prefer_current(epoch(data.rows[previous]), epoch(row), keep):
+            keep_rows[previous] = False
+            kept[key] = row_id
+        else:
+            keep_rows[row_id] = False
+
+    if all(keep_rows):
+        return data
+    return SheetData(
+        headers=data.headers,
+        rows=[row for row_id, row in enumerate(data.rows) if keep_rows[row_id]],
+    )
@@ -0,0 +1,124 @@
+"""
+分面索引 - 一次掃描資料，計算類別與作者的數量，以及每個值所屬資料行的位元集合
+
+瀏覽器端的篩選只需要將位元集合做交集，不必逐一檢查每個表格列。
+每個值的資料行集合會以較小的一種格式輸出：較密集時使用 base64 編碼的位元圖，
+較稀疏時（例如大多數作者只有一兩件作品）直接列出資料行編號。
+"""
+
+import base64
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from src.domain.models import SheetData
+
+# 要計算分面的重要欄位
+FACET_KEYS = ("category", "author")
+
+
+@dataclass
+class FacetValue:
+    """分面中的一個值"""
+
+    value: str
+    rows: List[int] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """符合的資料行數"""
+        return len(self.rows)
+
+    def to_bitmap(self, row_count: int) -> bytes:
+        """
+        轉換為位元圖，第 i 行對應第 i // 8 個位元組的第 i % 8 個位元
+
+        Args:
+            row_count: 資料總行數
+
+        Returns:
+            位元圖
+        """
+        bitmap = bytearray((row_count + 7) // 8)
+        for row in self.rows:
+            bitmap[row >> 3] |= 1 << (row & 7)
+        return bytes(bitmap)
+
+    def to_json(self, row_count: int) -> dict:
+        """
+        轉換為 JSON 物件，自動選擇較小的資料行集合格式
+
+        Args:
+            row_count: 資料總行數
+
+        Returns:
+            含 value、count，以及 bits（base64 位元圖）或 rows（資料行編號）的物件
+        """
+        result: dict = {"value": self.value, "count": self.count}
+        # 位元圖經 base64 編碼後約為 row_count / 6 個字元；資料行編號每個約需
+        # len(str(row_count)) + 1 個字元
+        bitmap_size = (row_count + 7) // 8 * 4 // 3
+        rows_size = self.count * (len(str(row_count)) + 1)
+        if bitmap_size < rows_size:
+            result["bits"] = base64.b64encode(self.to_bitmap(row_count)).decode("ascii")
+        else:
+            result["rows"] = self.rows
+        return result
+
+
+def build_facets(
+    data: SheetData, indices: Dict[str, int]
+) -> Dict[str, List[FacetValue]]:
+    """
+    一次掃描所有資料行，建立類別與作者的分面
+
+    Args:
+        data: 表格資料
+        indices: 重要欄位索引
+
+    Returns:
+        分面名稱 -> 值列表；類別依名稱排序，作者依數量由多到少排序
+    """
+    columns = {
+        key: indices.get(key, -1) for key in FACET_KEYS if indices.get(key, -1) >= 0
+    }
+    values: Dict[str, Dict[str, FacetValue]] = {key: {} for key in columns}
+
+    for row_id, row in enumerate(data.rows):
+        for key, index in columns.items():
+            if index >= len(row):
+                continue
+            value = row[index].strip()
+            if not value:
+                continue
+            facet_value = values[key].get(value)
+            if facet_value is None:
+                facet_value = values[key][value] = FacetValue(value)
+            facet_value.rows.append(row_id)
+
+    facets: Dict[str, List[FacetValue]] = {}
+    for key, by_value in values.items():
+        if key == "category":
+            facets[key] = sorted(by_value.values(), key=lambda v: v.value)
+        else:
+            facets[key] = sorted(by_value.values(), key=lambda v: (-v.count, v.value))
+    return facets
+
+
+def facets_to_json(facets: Dict[str, List[FacetValue]], row_count: int) -> dict:
+    """
+    將分面轉換為可輸出為靜態檔案的 JSON 物件
+
+    Args:
+        facets: build_facets 的結果
+        row_count: 資料總行數
+
+    Returns:
+        JSON 物件
+    """
+    return {
+        "row_count": row_count,
+        "facets": {
+            key: [value.to_json(row_count) for value in values]
+            for key, values in facets.items()
+        },
+    }
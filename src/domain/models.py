@@ -5,6 +5,51 @@
 from dataclasses import dataclass
 from typing import Dict, List
 
+# 重要欄位及其可能的表頭名稱（比對時不分大小寫）
+IMPORTANT_COLUMNS: Dict[str, List[str]] = {
+    "link": ["作品連結", "連結", "link", "url"],
+    "timestamp": ["時間戳記", "timestamp", "日期", "時間"],
+    "author": ["作者名", "作者", "author", "name"],
+    "category": ["類別", "分類", "category", "type"],
+    "title": ["作品標題", "標題", "title"],
+}
+
+
+def map_important_indices(headers: List[str]) -> Dict[str, int]:
+    """
+    映射表頭中重要欄位的索引
+
+    Args:
+        headers: 表頭列表
+
+    Returns:
+        含有重要欄位索引的字典，找不到的欄位為 -1
+    """
+    indices = dict.fromkeys(IMPORTANT_COLUMNS, -1)
+
+    for i, header in enumerate(headers):
+        header_lower = header.lower()
+        for key, aliases in IMPORTANT_COLUMNS.items():
+            if header_lower in aliases:
+                indices[key] = i
+                break
+
+    return indices
+
+
+def work_title(title: str, author: str) -> str:
+    """
+    取得作品的顯示標題，沒有標題時以作者名代替
+
+    Args:
+        title: 作品標題欄位的值
+        author: 作者名欄位的值
+
+    Returns:
+        顯示標題
+    """
+    return title or (f"{author} 的作品" if author else "新作品")
+
 
 @dataclass
 class SheetData:
@@ -0,0 +1,114 @@
+"""
+查詢索引 - 在伺服器端依類別、作者與關鍵字篩選資料行
+
+類別與作者使用分面中每個值的資料行列表；關鍵字使用字元二元組（bigram）的倒排索引：
+先取關鍵字中出現次數最少的二元組的資料行作為候選，再逐行確認包含整個關鍵字。
+比對方式與頁面上的搜尋相同（不分大小寫的子字串比對），中文不需要斷詞。
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from src.domain.facets import FacetValue, build_facets
+from src.domain.models import SheetData
+
+
+def normalize_text(value: str) -> str:
+    """搜尋比對使用的文字：去除前後空白並轉為小寫"""
+    return value.strip().lower()
+
+
+def _bigrams(text: str) -> List[str]:
+    """取得文字中所有相鄰兩個字元的組合"""
+    return [text[i : i + 2] for i in range(len(text) - 1)]
+
+
+class SearchIndex:
+    """依類別、作者與關鍵字查詢資料行的索引"""
+
+    def __init__(
+        self,
+        data: SheetData,
+        indices: Dict[str, int],
+        facets: Optional[Dict[str, List[FacetValue]]] = None,
+    ) -> None:
+        """
+        建立索引
+
+        Args:
+            data: 表格資料
+            indices: 重要欄位索引
+            facets: build_facets 的結果，未提供時重新計算
+        """
+        if facets is None:
+            facets = build_facets(data, indices)
+        self.row_count = data.row_count
+        self._facet_rows: Dict[str, Dict[str, List[int]]] = {
+            key: {value.value: value.rows for value in values}
+            for key, values in facets.items()
+        }
+
+        # 搜尋的對象是頁面上看得到的文字，因此略過作品連結的網址
+        link_index = indices.get("link", -1)
+        self._texts: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        for row_id, row in enumerate(data.rows):
+            text = "\n".join(
+                normalize_text(cell) for i, cell in enumerate(row) if i != link_index
+            )
+            self._texts.append(text)
+            for gram in set(_bigrams(text)):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    self._postings[gram] = [row_id]
+                else:
+                    postings.append(row_id)
+
+    def values(self, key: str) -> List[str]:
+        """
+        取得分面中的所有值
+
+        Args:
+            key: 分面名稱（category 或 author）
+
+        Returns:
+            值列表，依分面的順序
+        """
+        return list(self._facet_rows.get(key, {}))
+
+    def search(
+        self, category: str = "", author: str = "", query: str = ""
+    ) -> List[int]:
+        """
+        查詢符合所有條件的資料行
+
+        Args:
+            category: 類別，空字串表示不限
+            author: 作者名，空字串表示不限
+            query: 關鍵字，空字串表示不限
+
+        Returns:
+            符合的資料行編號，依資料順序
+        """
+        term = normalize_text(query)
+        candidates: List[Sequence[int]] = []
+        for key, value in (("category", category), ("author", author)):
+            if value:
+                candidates.append(self._facet_rows.get(key, {}).get(value, []))
+        if len(term) >= 2:
+            postings = [self._postings.get(gram, []) for gram in set(_bigrams(term))]
+            candidates.append(min(postings, key=len))
+
+        if not candidates:
+            result: Sequence[int] = range(self.row_count)
+        else:
+            # 從最少的候選開始，逐一以其他條件過濾
+            candidates.sort(key=len)
+            result = candidates[0]
+            for other in candidates[1:]:
+                allowed = set(other)
+                result = [row_id for row_id in result if row_id in allowed]
+
+        if term:
+            texts = self._texts
+            return [row_id for row_id in result if term in texts[row_id]]
+        return list(result)
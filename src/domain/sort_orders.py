@@ -0,0 +1,96 @@
+"""
+排序索引 - 預先計算各重要欄位的穩定排序排列，瀏覽器端只需依索引重新排列表格列
+
+時間戳記依解析後的時間排序；文字欄位使用適合中日韓文字的排序鍵：
+安裝 PyICU 時使用 ICU 的 zh_TW 定序（依筆畫），否則以 NFKC 正規化並忽略大小寫的
+Unicode 順序排序（中日韓統一表意文字大致依部首與筆畫排列），並將數字依數值比較。
+空白值一律排在最後。
+"""
+
+import re
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional
+
+from src.domain.models import SheetData
+from src.domain.timestamps import TimestampParser
+
+try:
+    import icu  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - 依安裝環境而定
+    icu = None
+
+# 要預先排序的重要欄位
+SORT_KEYS = ("timestamp", "author", "category", "title")
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def _natural_key(value: str) -> tuple:
+    """NFKC 正規化、忽略大小寫，並將連續數字依數值比較的排序鍵"""
+    parts = _DIGITS_RE.split(unicodedata.normalize("NFKC", value).casefold())
+    # split 的結果中，奇數位置一定是數字，因此同位置的元素型別一致
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+
+def text_sort_key_function(locale: str = "zh_TW") -> Callable[[str], Any]:
+    """
+    取得文字排序鍵函式
+
+    Args:
+        locale: ICU 定序使用的語系
+
+    Returns:
+        將字串轉換為排序鍵的函式
+    """
+    if icu is not None:
+        collator = icu.Collator.createInstance(icu.Locale(locale))
+        sort_key: Callable[[str], Any] = collator.getSortKey
+        return sort_key
+    return _natural_key
+
+
+def _permutation(keys: List[Any]) -> List[int]:
+    """依排序鍵產生穩定的排列，沒有排序鍵（None）的資料行排在最後"""
+    present = [i for i, key in enumerate(keys) if key is not None]
+    present.sort(key=lambda i: keys[i])
+    missing = [i for i, key in enumerate(keys) if key is None]
+    return present + missing
+
+
+def build_sort_orders(
+    data: SheetData,
+    indices: Dict[str, int],
+    timestamp_parser: Optional[TimestampParser] = None,
+    text_key: Optional[Callable[[str], Any]] = None,
+) -> Dict[str, List[int]]:
+    """
+    為每個存在的重要欄位產生遞增的穩定排序排列
+
+    Args:
+        data: 表格資料
+        indices: 重要欄位索引
+        timestamp_parser: 時間戳記解析器
+        text_key: 文字排序鍵函式，預設使用 text_sort_key_function()
+
+    Returns:
+        欄位名稱 -> 資料行編號列表（第 k 個元素是排序後第 k 列的原始資料行編號）
+    """
+    timestamp_parser = timestamp_parser or TimestampParser()
+    text_key = text_key or text_sort_key_function()
+
+    orders: Dict[str, List[int]] = {}
+    for key in SORT_KEYS:
+        index = indices.get(key, -1)
+        if index < 0:
+            continue
+
+        values = [row[index].strip() if index < len(row) else "" for row in data.rows]
+        if key == "timestamp":
+            keys: List[Any] = [
+                timestamp_parser.epoch(value) if value else None for value in values
+            ]
+        else:
+            keys = [text_key(value) if value else None for value in values]
+        orders[key] = _permutation(keys)
+
+    return orders
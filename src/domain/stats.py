@@ -0,0 +1,207 @@
+"""
+投稿統計 - 一次掃描資料，計算每日投稿數、各類別作品數與作者排行
+
+所有統計都在同一次掃描中累計，時間戳記使用 TimestampParser 解析（相同的值只解析
+一次），並換算為網站所在時區的日期與時段。結果為已整理好的數列，頁面直接顯示，
+瀏覽器端不需要再處理原始資料。
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.models import SheetData
+from src.domain.timestamps import TimestampParser
+
+# 排行榜列出的數量
+LEADERBOARD_SIZE = 10
+
+# 每日數列最多涵蓋的天數，避免打錯年份的時間戳記（例如 2205/4/1）產生
+# 數十萬天的數列
+DAILY_SERIES_MAX_DAYS = 731
+
+# 星期的顯示名稱，依 date.weekday() 的順序
+WEEKDAY_LABELS = ("一", "二", "三", "四", "五", "六", "日")
+
+
+@dataclass
+class AuthorStats:
+    """一位作者的投稿統計"""
+
+    name: str
+    count: int = 0
+    first: Optional[date] = None
+    latest: Optional[date] = None
+    categories: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, category: str, day: Optional[date]) -> None:
+        """
+        加入一件作品
+
+        Args:
+            category: 作品的類別，沒有時為空字串
+            day: 投稿日期，無法解析時為 None
+        """
+        self.count += 1
+        if category:
+            self.categories[category] = self.categories.get(category, 0) + 1
+        if day is not None:
+            if self.first is None or day < self.first:
+                self.first = day
+            if self.latest is None or day > self.latest:
+                self.latest = day
+
+    @property
+    def top_category(self) -> str:
+        """投稿最多的類別，數量相同時取名稱較前者"""
+        if not self.categories:
+            return ""
+        return min(self.categories.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+@dataclass
+class SiteStats:
+    """網站的投稿統計"""
+
+    total: int = 0
+    # 可以解析時間戳記的資料行數
+    dated: int = 0
+    # (日期, 投稿數)，從第一天到最後一天，沒有投稿的日期為 0；只涵蓋最後一天
+    # 之前 DAILY_SERIES_MAX_DAYS 天內、不晚於今天的日期
+    daily: List[Tuple[date, int]] = field(default_factory=list)
+    # 各時段（0-23 時）的投稿數
+    hourly: List[int] = field(default_factory=lambda: [0] * 24)
+    # 星期一到星期日的投稿數
+    weekdays: List[int] = field(default_factory=lambda: [0] * 7)
+    # (類別, 作品數)，依數量由多到少排序
+    categories: List[Tuple[str, int]] = field(default_factory=list)
+    # 投稿最多的作者
+    authors: List[AuthorStats] = field(default_factory=list)
+    author_count: int = 0
+
+    @property
+    def cumulative(self) -> List[int]:
+        """每日累計投稿數"""
+        result = []
+        running = 0
+        for _, count in self.daily:
+            running += count
+            result.append(running)
+        return result
+
+    @property
+    def busiest_days(self) -> List[Tuple[date, int]]:
+        """投稿最多的日期，數量相同時取較早的日期"""
+        days = [item for item in self.daily if item[1]]
+        return sorted(days, key=lambda item: (-item[1], item[0]))[:LEADERBOARD_SIZE]
+
+    def to_json(self) -> dict:
+        """
+        轉換為可輸出為靜態檔案的 JSON 物件
+
+        Returns:
+            JSON 物件，日期為 ISO 8601 格式
+        """
+        return {
+            "total": self.total,
+            "dated": self.dated,
+            "author_count": self.author_count,
+            "daily": {
+                "start": self.daily[0][0].isoformat() if self.daily else None,
+                "counts": [count for _, count in self.daily],
+                "cumulative": self.cumulative,
+            },
+            "hourly": self.hourly,
+            "weekdays": self.weekdays,
+            "categories": [
+                {"value": value, "count": count} for value, count in self.categories
+            ],
+            "authors": [
+                {
+                    "name": author.name,
+                    "count": author.count,
+                    "first": _isoformat(author.first),
+                    "latest": _isoformat(author.latest),
+                    "top_category": author.top_category,
+                }
+                for author in self.authors
+            ],
+        }
+
+
+def _isoformat(day: Optional[date]) -> Optional[str]:
+    return day.isoformat() if day is not None else None
+
+
+def _cell(row: List[str], index: int) -> str:
+    """取得欄位的值，欄位不存在時為空字串"""
+    return row[index].strip() if 0 <= index < len(row) else ""
+
+
+def build_stats(
+    data: SheetData,
+    indices: Dict[str, int],
+    timestamp_parser: TimestampParser,
+    leaderboard_size: int = LEADERBOARD_SIZE,
+    today: Optional[date] = None,
+) -> SiteStats:
+    """
+    一次掃描所有資料行，計算投稿統計
+
+    Args:
+        data: 表格資料
+        indices: 重要欄位索引
+        timestamp_parser: 時間戳記解析器，日期與時段以其時區計算
+        leaderboard_size: 作者排行列出的數量
+        today: 每日數列的最後期限，預設為時間戳記解析器時區的今天
+
+    Returns:
+        SiteStats
+    """
+    timestamp_index = indices.get("timestamp", -1)
+    author_index = indices.get("author", -1)
+    category_index = indices.get("category", -1)
+
+    stats = SiteStats(total=data.row_count)
+    days: Dict[date, int] = {}
+    categories: Dict[str, int] = {}
+    authors: Dict[str, AuthorStats] = {}
+    for row in data.rows:
+        day = None
+        moment = timestamp_parser.local(_cell(row, timestamp_index))
+        if moment is not None:
+            day = moment.date()
+            days[day] = days.get(day, 0) + 1
+            stats.hourly[moment.hour] += 1
+            stats.weekdays[day.weekday()] += 1
+            stats.dated += 1
+
+        category = _cell(row, category_index)
+        if category:
+            categories[category] = categories.get(category, 0) + 1
+
+        name = _cell(row, author_index)
+        if name:
+            author = authors.get(name)
+            if author is None:
+                author = authors[name] = AuthorStats(name)
+            author.add(category, day)
+
+    # 未來的日期與過早的日期只計入總數與分布，不列入每日數列
+    if today is None:
+        today = datetime.now(timestamp_parser.tz).date()
+    series_days = [day for day in days if day <= today]
+    if series_days:
+        last = max(series_days)
+        first = max(min(series_days), last - timedelta(days=DAILY_SERIES_MAX_DAYS - 1))
+        for offset in range((last - first).days + 1):
+            day = first + timedelta(days=offset)
+            stats.daily.append((day, days.get(day, 0)))
+    stats.categories = sorted(categories.items(), key=lambda item: (-item[1], item[0]))
+    # 數量相同時，較早開始投稿的作者排在前面
+    stats.authors = sorted(
+        authors.values(),
+        key=lambda a: (-a.count, a.first or date.max, a.name),
+    )[:leaderboard_size]
+    stats.author_count = len(authors)
+    return stats
@@ -0,0 +1,221 @@
+"""
+時間戳記解析 - 解析 Google Forms 等來源的時間戳記，並提供排序用的 epoch 值
+
+Google Forms 的時間戳記使用中文上午/下午標記 (2023/4/30 上午 10:30:45)，
+strptime 的 %p 無法解析，因此以預先編譯的正規表示式直接解析。同一欄位的
+時間戳記格式通常一致，偵測一次後會優先嘗試該格式；相同的值只會解析一次。
+"""
+
+import re
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import pytz
+
+# Google Forms 的時間戳記格式，也接受英文 AM/PM 標記
+_FORMS_RE = re.compile(
+    r"^(\d{4})[/-](\d{1,2})[/-](\d{1,2})\s+(上午|下午|AM|PM|am|pm)\s*"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?$"
+)
+
+# 24 小時制的斜線日期格式 (2023/4/30 22:30:45)，時間可省略
+_SLASH_RE = re.compile(
+    r"^(\d{4})/(\d{1,2})/(\d{1,2})(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?$"
+)
+
+# 表示下午的標記
+_PM_MARKERS = frozenset(["下午", "PM", "pm"])
+
+
+def _parse_forms(value: str) -> Optional[datetime]:
+    """解析含上午/下午標記的時間戳記"""
+    match = _FORMS_RE.match(value)
+    if match is None:
+        return None
+    year, month, day, marker, hour, minute, second = match.groups()
+    hour_24 = int(hour) % 12 + (12 if marker in _PM_MARKERS else 0)
+    try:
+        return datetime(
+            int(year), int(month), int(day), hour_24, int(minute), int(second or 0)
+        )
+    except ValueError:
+        return None
+
+
+def _parse_slash(value: str) -> Optional[datetime]:
+    """解析 24 小時制的斜線日期"""
+    match = _SLASH_RE.match(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second = match.groups()
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+        )
+    except ValueError:
+        return None
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    """解析 ISO 8601 格式"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+# 支援的格式：(名稱, 解析函式)
+_PARSERS: List[Tuple[str, Callable[[str], Optional[datetime]]]] = [
+    ("forms", _parse_forms),
+    ("slash", _parse_slash),
+    ("iso", _parse_iso),
+]
+
+
+class TimestampParser:
+    """帶有格式偵測與快取的時間戳記解析器"""
+
+    def __init__(self, timezone: str = "Asia/Taipei", cache_size: int = 65536) -> None:
+        """
+        初始化解析器
+
+        Args:
+            timezone: 沒有時區資訊的時間戳記所在的時區
+            cache_size: 快取的解析結果數量
+        """
+        self.tz = pytz.timezone(timezone)
+        self.format_name: Optional[str] = None
+        self._parsers = list(_PARSERS)
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse_uncached)
+        self._zone_cached = lru_cache(maxsize=cache_size)(self._zone_uncached)
+        self._format_cached = lru_cache(maxsize=cache_size)(self._format_uncached)
+
+    def detect(self, values: Iterable[str], sample_size: int = 20) -> Optional[str]:
+        """
+        依欄位中的前幾個值偵測時間戳記格式，之後優先使用該格式解析
+
+        Args:
+            values: 欄位中的值
+            sample_size: 最多檢查的非空值數量
+
+        Returns:
+            偵測到的格式名稱，無法判斷時為 None
+        """
+        samples = islice((v.strip() for v in values if v and v.strip()), sample_size)
+        for value in samples:
+            for index, (name, parser) in enumerate(self._parsers):
+                if parser(value) is not None:
+                    # 將偵測到的格式移到最前面
+                    self._parsers.insert(0, self._parsers.pop(index))
+                    self.format_name = name
+                    return name
+        return None
+
+    def _parse_uncached(self, value: str) -> Optional[datetime]:
+        """解析為當地時間，沒有時區資訊的值保持 naive"""
+        value = value.strip()
+        if not value:
+            return None
+        for _, parser in self._parsers:
+            moment = parser(value)
+            if moment is not None:
+                return moment
+        return None
+
+    def _zone_uncached(self, year: int, month: int, day: int, hour: int) -> tzinfo:
+        """取得指定時段的時區資訊（pytz 的 localize 很慢，以小時為單位快取）"""
+        zone: Optional[tzinfo] = self.tz.localize(
+            datetime(year, month, day, hour)
+        ).tzinfo
+        assert zone is not None
+        return zone
+
+    def parse(self, value: str) -> Optional[datetime]:
+        """
+        解析時間戳記
+
+        Args:
+            value: 時間戳記字串
+
+        Returns:
+            含時區的 datetime，無法解析時為 None
+        """
+        moment = self._parse_cached(value)
+        if moment is None or moment.tzinfo is not None:
+            return moment
+        return moment.replace(
+            tzinfo=self._zone_cached(moment.year, moment.month, moment.day, moment.hour)
+        )
+
+    def local(self, value: str) -> Optional[datetime]:
+        """
+        解析時間戳記並取得所在時區的當地時間（不含時區資訊），用於依日期或時段統計
+
+        沒有時區資訊的值直接視為當地時間，不需要經過時區換算。
+
+        Args:
+            value: 時間戳記字串
+
+        Returns:
+            naive datetime，無法解析時為 None
+        """
+        moment = self._parse_cached(value)
+        if moment is None or moment.tzinfo is None:
+            return moment
+        return moment.astimezone(self.tz).replace(tzinfo=None)
+
+    def epoch(self, value: str) -> Optional[float]:
+        """
+        取得時間戳記的 Unix epoch 秒數
+
+        Args:
+            value: 時間戳記字串
+
+        Returns:
+            epoch 秒數，無法解析時為 None
+        """
+        moment = self.parse(value)
+        return moment.timestamp() if moment is not None else None
+
+    def epochs(self, values: Iterable[str], default: float = 0.0) -> List[float]:
+        """
+        將一整欄時間戳記轉換為 epoch 秒數，用於排序
+
+        Args:
+            values: 時間戳記字串
+            default: 無法解析時使用的值
+
+        Returns:
+            epoch 秒數列表
+        """
+        result = []
+        for value in values:
+            moment = self.parse(value)
+            result.append(moment.timestamp() if moment is not None else default)
+        return result
+
+    def _format_uncached(self, value: str, fmt: str) -> str:
+        moment = self._parse_cached(value)
+        return moment.strftime(fmt) if moment is not None else value
+
+    def format(self, value: str, fmt: str = "%Y-%m-%d %H:%M") -> str:
+        """
+        格式化時間戳記
+
+        Args:
+            value: 時間戳記字串
+            fmt: strftime 格式
+
+        Returns:
+            格式化後的字串，無法解析時回傳原始值
+        """
+        if not value:
+            return ""
+        return self._format_cached(value, fmt)
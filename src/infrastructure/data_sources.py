@@ -0,0 +1,530 @@
+"""
+資料來源 - 以統一介面從不同來源產生 SheetData
+
+支援的後端：
+- Google Sheets（透過 SheetService）
+- CSV 匯出檔
+- NDJSON 匯出檔（每行一個 JSON 陣列或物件）
+- XLSX 匯出檔（以 zipfile + iterparse 串流解析，不需額外套件）
+"""
+
+import csv
+import json
+import os
+import posixpath
+import re
+import zipfile
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+from xml.etree.ElementTree import Element, iterparse
+
+from src.domain.models import SheetData
+
+if TYPE_CHECKING:
+    from src.application.sheet_service import SheetService
+
+
+class DataSource(ABC):
+    """資料來源抽象類別"""
+
+    @abstractmethod
+    def load(self) -> SheetData:
+        """
+        讀取資料
+
+        Returns:
+            SheetData: 包含表頭和資料的物件
+        """
+
+    def change_token(self) -> Optional[str]:
+        """
+        取得代表目前資料版本的標記
+
+        標記相同時資料一定沒有變更，可以不必重新讀取；不支援時回傳 None，
+        呼叫端需自行讀取資料並比對內容。
+
+        Returns:
+            版本標記，或 None
+        """
+        return None
+
+
+def _file_change_token(path: str) -> str:
+    """以檔案的修改時間與大小作為版本標記"""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _build_sheet_data(records: Iterable[List[str]]) -> SheetData:
+    """
+    將逐行產生的資料組成 SheetData
+
+    第一個非空行作為表頭，其餘為資料。與 gspread 的 get_all_values 相同，
+    所有資料行會補齊到相同寬度。
+
+    Args:
+        records: 逐行產生的儲存格列表
+
+    Returns:
+        SheetData: 包含表頭和資料的物件
+    """
+    headers: Optional[List[str]] = None
+    rows: List[List[str]] = []
+    width = 0
+
+    for record in records:
+        # 略過完全空白的行
+        if not any(record):
+            continue
+        if headers is None:
+            headers = record
+        else:
+            rows.append(record)
+        width = max(width, len(record))
+
+    if headers is None:
+        return SheetData(headers=[], rows=[])
+
+    # 補齊表頭與資料行的寬度
+    if len(headers) < width:
+        headers.extend([""] * (width - len(headers)))
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+
+    return SheetData(headers=headers, rows=rows)
+
+
+class GoogleSheetsDataSource(DataSource):
+    """Google Sheets 資料來源"""
+
+    def __init__(
+        self, service: "SheetService", spreadsheet_id: str, sheet_name: str
+    ) -> None:
+        """
+        初始化資料來源
+
+        Args:
+            service: 已授權的 SheetService
+            spreadsheet_id: Google Sheets 的 ID
+            sheet_name: 工作表名稱
+        """
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_name = sheet_name
+
+    def load(self) -> SheetData:
+        """從 Google Sheets 讀取資料"""
+        return self.service.get_sheet_data(self.spreadsheet_id, self.sheet_name)
+
+    def change_token(self) -> Optional[str]:
+        """以 Drive 中繼資料的最後修改時間作為版本標記"""
+        return self.service.get_last_updated(self.spreadsheet_id)
+
+
+class CsvDataSource(DataSource):
+    """CSV 匯出檔資料來源"""
+
+    def __init__(
+        self, path: str, encoding: str = "utf-8-sig", delimiter: str = ","
+    ) -> None:
+        """
+        初始化資料來源
+
+        Args:
+            path: CSV 檔案路徑
+            encoding: 檔案編碼，預設會略過 BOM
+            delimiter: 欄位分隔字元
+        """
+        self.path = path
+        self.encoding = encoding
+        self.delimiter = delimiter
+
+    def load(self) -> SheetData:
+        """逐行串流讀取 CSV 檔案"""
+        with open(self.path, "r", encoding=self.encoding, newline="") as f:
+            return _build_sheet_data(csv.reader(f, delimiter=self.delimiter))
+
+    def change_token(self) -> Optional[str]:
+        """以檔案的修改時間與大小作為版本標記"""
+        return _file_change_token(self.path)
+
+
+def _to_cell(value: Any) -> str:
+    """將 JSON 值轉換為儲存格字串"""
+    return "" if value is None else str(value)
+
+
+class NdjsonDataSource(DataSource):
+    """
+    NDJSON 匯出檔資料來源
+
+    每行可以是 JSON 陣列（第一行視為表頭）或 JSON 物件（以鍵作為表頭）。
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8") -> None:
+        """
+        初始化資料來源
+
+        Args:
+            path: NDJSON 檔案路徑
+            encoding: 檔案編碼
+        """
+        self.path = path
+        self.encoding = encoding
+
+    def load(self) -> SheetData:
+        """逐行串流讀取 NDJSON 檔案"""
+        with open(self.path, "r", encoding=self.encoding) as f:
+            return _build_sheet_data(self._iter_records(f))
+
+    def change_token(self) -> Optional[str]:
+        """以檔案的修改時間與大小作為版本標記"""
+        return _file_change_token(self.path)
+
+    @staticmethod
+    def _iter_records(lines: Iterable[str]) -> Iterator[List[str]]:
+        """
+        將 NDJSON 行轉換為儲存格列表
+
+        Args:
+            lines: 檔案中的每一行
+
+        Yields:
+            儲存格列表，第一個為表頭
+        """
+        headers: List[str] = []
+        positions: Dict[str, int] = {}
+
+        for line_no, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"第 {line_no} 行不是有效的 JSON: {e}") from e
+
+            if isinstance(value, list):
+                yield [_to_cell(cell) for cell in value]
+            elif isinstance(value, dict):
+                # 物件格式：以第一個物件的鍵決定欄位順序
+                if not headers:
+                    headers = list(value)
+                    positions = {key: i for i, key in enumerate(headers)}
+                    yield list(headers)
+
+                row = [""] * len(headers)
+                for key, cell in value.items():
+                    if key not in positions:
+                        raise ValueError(
+                            f"第 {line_no} 行出現新的欄位 {key!r}，"
+                            "請確保第一行包含所有欄位"
+                        )
+                    row[positions[key]] = _to_cell(cell)
+                yield row
+            else:
+                raise ValueError(f"第 {line_no} 行必須是 JSON 陣列或物件")
+
+
+# XLSX 相關的 XML 命名空間
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Excel 內建的日期時間格式編號
+_BUILTIN_DATE_FORMATS = frozenset(range(14, 23)) | frozenset(range(45, 48))
+
+# 移除格式字串中的引號文字與中括號區段後再判斷是否為日期格式
+_FORMAT_LITERAL_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+_DATE_TOKEN_RE = re.compile(r"[dmyhs]", re.IGNORECASE)
+
+# Excel 序列日期的起點（1900 日期系統，已包含 1900/2/29 的錯誤）
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def _column_index(cell_ref: str) -> int:
+    """
+    將儲存格參照（例如 "AB12"）轉換為從 0 開始的欄位索引
+
+    Args:
+        cell_ref: 儲存格參照
+
+    Returns:
+        欄位索引
+    """
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - ord("A") + 1)
+    return index - 1
+
+
+class XlsxDataSource(DataSource):
+    """XLSX 匯出檔資料來源"""
+
+    def __init__(self, path: str, sheet_name: Optional[str] = None) -> None:
+        """
+        初始化資料來源
+
+        Args:
+            path: XLSX 檔案路徑
+            sheet_name: 工作表名稱，未指定時讀取第一個工作表
+        """
+        self.path = path
+        self.sheet_name = sheet_name
+
+    def load(self) -> SheetData:
+        """以串流方式解析 XLSX 工作表"""
+        with zipfile.ZipFile(self.path) as archive:
+            sheet_path = self._resolve_sheet_path(archive)
+            shared_strings = self._read_shared_strings(archive)
+            date_styles = self._read_date_styles(archive)
+
+            with archive.open(sheet_path) as f:
+                return _build_sheet_data(
+                    self._iter_rows(f, shared_strings, date_styles)
+                )
+
+    def change_token(self) -> Optional[str]:
+        """以檔案的修改時間與大小作為版本標記"""
+        return _file_change_token(self.path)
+
+    def _resolve_sheet_path(self, archive: zipfile.ZipFile) -> str:
+        """
+        找出工作表在壓縮檔中的路徑
+
+        Args:
+            archive: XLSX 壓縮檔
+
+        Returns:
+            工作表 XML 的路徑
+        """
+        sheets = []
+        with archive.open("xl/workbook.xml") as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f"{_XLSX_NS}sheet":
+                    sheets.append((elem.get("name", ""), elem.get(f"{_REL_NS}id")))
+
+        if not sheets:
+            raise ValueError(f"{self.path} 中沒有任何工作表")
+
+        if self.sheet_name is None:
+            rel_id = sheets[0][1]
+        else:
+            matches = [rid for name, rid in sheets if name == self.sheet_name]
+            if not matches:
+                available = ", ".join(name for name, _ in sheets)
+                raise ValueError(
+                    f"找不到工作表 {self.sheet_name!r}，可用的工作表: {available}"
+                )
+            rel_id = matches[0]
+
+        with archive.open("xl/_rels/workbook.xml.rels") as f:
+            for _, elem in iterparse(f):
+                if (
+                    elem.tag == f"{_PKG_REL_NS}Relationship"
+                    and elem.get("Id") == rel_id
+                ):
+                    target = elem.get("Target", "")
+                    if target.startswith("/"):
+                        return target.lstrip("/")
+                    return posixpath.normpath(posixpath.join("xl", target))
+
+        raise ValueError(f"{self.path} 中找不到工作表關聯 {rel_id}")
+
+    @staticmethod
+    def _read_shared_strings(archive: zipfile.ZipFile) -> List[str]:
+        """
+        讀取共用字串表
+
+        Args:
+            archive: XLSX 壓縮檔
+
+        Returns:
+            共用字串列表
+        """
+        if "xl/sharedStrings.xml" not in archive.namelist():
+            return []
+
+        strings: List[str] = []
+        parts: List[str] = []
+        in_phonetic = False
+        with archive.open("xl/sharedStrings.xml") as f:
+            for event, elem in iterparse(f, events=("start", "end")):
+                if elem.tag == f"{_XLSX_NS}rPh":
+                    # 略過注音/拼音標示
+                    in_phonetic = event == "start"
+                elif event == "end" and elem.tag == f"{_XLSX_NS}t":
+                    if not in_phonetic:
+                        parts.append(elem.text or "")
+                elif event == "end" and elem.tag == f"{_XLSX_NS}si":
+                    strings.append("".join(parts))
+                    parts = []
+                    elem.clear()
+        return strings
+
+    @staticmethod
+    def _read_date_styles(archive: zipfile.ZipFile) -> frozenset:
+        """
+        找出使用日期格式的儲存格樣式索引
+
+        Args:
+            archive: XLSX 壓縮檔
+
+        Returns:
+            日期樣式索引集合
+        """
+        if "xl/styles.xml" not in archive.namelist():
+            return frozenset()
+
+        custom_formats: Dict[int, str] = {}
+        style_formats: List[int] = []
+        in_cell_xfs = False
+        with archive.open("xl/styles.xml") as f:
+            for event, elem in iterparse(f, events=("start", "end")):
+                if elem.tag == f"{_XLSX_NS}numFmt" and event == "end":
+                    custom_formats[int(elem.get("numFmtId", "0"))] = elem.get(
+                        "formatCode", ""
+                    )
+                elif elem.tag == f"{_XLSX_NS}cellXfs":
+                    in_cell_xfs = event == "start"
+                elif elem.tag == f"{_XLSX_NS}xf" and event == "start" and in_cell_xfs:
+                    style_formats.append(int(elem.get("numFmtId", "0")))
+
+        date_styles = set()
+        for style_index, format_id in enumerate(style_formats):
+            if format_id in _BUILTIN_DATE_FORMATS:
+                date_styles.add(style_index)
+            elif format_id in custom_formats:
+                code = _FORMAT_LITERAL_RE.sub("", custom_formats[format_id])
+                if _DATE_TOKEN_RE.search(code):
+                    date_styles.add(style_index)
+        return frozenset(date_styles)
+
+    @staticmethod
+    def _format_number(text: str, is_date: bool) -> str:
+        """
+        將數值儲存格轉換為字串
+
+        Args:
+            text: 儲存格中的原始數值
+            is_date: 儲存格是否套用日期格式
+
+        Returns:
+            格式化後的字串
+        """
+        try:
+            number = float(text)
+        except ValueError:
+            return text
+
+        if is_date:
+            moment = _EXCEL_EPOCH + timedelta(seconds=round(number * 86400))
+            if number.is_integer():
+                return moment.strftime("%Y-%m-%d")
+            return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+        if number.is_integer():
+            return str(int(number))
+        return repr(number)
+
+    def _iter_rows(
+        self, f: IO[bytes], shared_strings: List[str], date_styles: frozenset
+    ) -> Iterator[List[str]]:
+        """
+        逐行解析工作表 XML
+
+        每處理完一個 <row> 元素就清除它，記憶體用量與工作表大小無關。
+
+        Args:
+            f: 工作表 XML 檔案
+            shared_strings: 共用字串表
+            date_styles: 日期樣式索引集合
+
+        Yields:
+            每一行的儲存格列表
+        """
+        for _, elem in iterparse(f):
+            if elem.tag != f"{_XLSX_NS}row":
+                continue
+
+            row: List[str] = []
+            for cell in elem.iter(f"{_XLSX_NS}c"):
+                text = self._cell_text(cell, shared_strings, date_styles)
+
+                # 依儲存格參照放到正確欄位，中間缺少的儲存格補空字串
+                cell_ref = cell.get("r")
+                column = _column_index(cell_ref) if cell_ref else len(row)
+                if column > len(row):
+                    row.extend([""] * (column - len(row)))
+                row.append(text)
+
+            yield row
+            elem.clear()
+
+    def _cell_text(
+        self, cell: Element, shared_strings: List[str], date_styles: frozenset
+    ) -> str:
+        """
+        取得儲存格的文字內容
+
+        Args:
+            cell: <c> 元素
+            shared_strings: 共用字串表
+            date_styles: 日期樣式索引集合
+
+        Returns:
+            儲存格文字
+        """
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            return "".join(t.text or "" for t in cell.iter(f"{_XLSX_NS}t"))
+
+        value = cell.findtext(f"{_XLSX_NS}v") or ""
+        if not value:
+            return ""
+        if cell_type == "s":
+            return shared_strings[int(value)]
+        if cell_type == "b":
+            return "TRUE" if value == "1" else "FALSE"
+        if cell_type in ("str", "e", "d"):
+            return value
+        return self._format_number(value, int(cell.get("s", "0")) in date_styles)
+
+
+# 以本機檔案為來源的類型
+FILE_SOURCE_KINDS = ("csv", "ndjson", "xlsx")
+
+
+def create_data_source(
+    kind: str, path: Optional[str] = None, sheet_name: Optional[str] = None
+) -> DataSource:
+    """
+    依設定建立本機檔案資料來源
+
+    Args:
+        kind: 資料來源類型（csv、ndjson 或 xlsx）
+        path: 匯出檔案路徑
+        sheet_name: XLSX 工作表名稱
+
+    Returns:
+        DataSource: 對應的資料來源
+    """
+    kind = kind.lower()
+    if kind not in FILE_SOURCE_KINDS:
+        raise ValueError(
+            f"不支援的資料來源類型: {kind}，"
+            f"可用的類型: {', '.join(FILE_SOURCE_KINDS)}"
+        )
+    if not path:
+        raise ValueError(f"資料來源 {kind} 需要指定檔案路徑")
+
+    if kind == "csv":
+        return CsvDataSource(path)
+    if kind == "ndjson":
+        return NdjsonDataSource(path)
+    return XlsxDataSource(path, sheet_name=sheet_name)
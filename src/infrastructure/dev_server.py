@@ -0,0 +1,261 @@
+"""
+本機開發伺服器 - 提供 gzip、ETag/304 與即時重新載入（Server-Sent Events）
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# 即時重新載入的事件端點
+LIVE_RELOAD_PATH = "/__livereload"
+
+# 注入到 HTML 頁面的即時重新載入腳本；只有 CSS 變更時直接替換樣式表，不重新整理頁面
+LIVE_RELOAD_SCRIPT = (
+    "<script>(function(){"
+    f'var source=new EventSource("{LIVE_RELOAD_PATH}");'
+    'source.addEventListener("reload",function(event){'
+    "var paths=JSON.parse(event.data);"
+    "if(paths.length&&paths.every(function(p){return /\\.css$/.test(p);})){"
+    "document.querySelectorAll('link[rel=\"stylesheet\"]').forEach(function(link){"
+    'var url=new URL(link.href);url.searchParams.set("livereload",Date.now());'
+    "link.href=url.toString();});}"
+    "else{location.reload();}});"
+    "})();</script>"
+)
+
+# 會進行 gzip 壓縮的內容類型
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "application/atom+xml",
+    "application/feed+json",
+    "image/svg+xml",
+)
+
+# 小於此大小的檔案不壓縮
+_MIN_COMPRESS_SIZE = 512
+
+
+class LiveReloadHub:
+    """即時重新載入事件中心，讓多個瀏覽器連線等待下一次變更"""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._version = 0
+        self._paths: List[str] = []
+
+    @property
+    def version(self) -> int:
+        """目前的事件版本"""
+        with self._condition:
+            return self._version
+
+    def notify(self, paths: List[str]) -> None:
+        """
+        通知所有連線重新載入
+
+        Args:
+            paths: 變更的輸出檔案路徑（相對於網站根目錄）
+        """
+        with self._condition:
+            self._version += 1
+            self._paths = list(paths)
+            self._condition.notify_all()
+
+    def wait(self, version: int, timeout: float) -> Tuple[int, Optional[List[str]]]:
+        """
+        等待比指定版本更新的事件
+
+        Args:
+            version: 已處理的事件版本
+            timeout: 最長等待時間（秒）
+
+        Returns:
+            (最新版本, 變更的路徑)，逾時時路徑為 None
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._version > version, timeout)
+            if self._version > version:
+                return self._version, list(self._paths)
+            return self._version, None
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """支援 gzip、ETag 與即時重新載入的靜態檔案處理器"""
+
+    def __init__(
+        self,
+        *args: Any,
+        hub: LiveReloadHub,
+        cache: Dict[Tuple[str, bool], Tuple[Tuple[int, int], bytes, str, bool]],
+        **kwargs: Any,
+    ) -> None:
+        self.hub = hub
+        self.cache = cache
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """不輸出每個請求的紀錄"""
+
+    def do_GET(self) -> None:
+        """處理 GET 請求"""
+        if self.path.split("?", 1)[0] == LIVE_RELOAD_PATH:
+            self._serve_events()
+            return
+        body = self._prepare_response()
+        if body is not None:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        """處理 HEAD 請求"""
+        self._prepare_response()
+
+    def _prepare_response(self) -> Optional[bytes]:
+        """
+        送出回應標頭
+
+        Returns:
+            回應內容，不需要內容（304、錯誤或重新導向）時為 None
+        """
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split("?", 1)[0].endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", self.path.split("?", 1)[0] + "/")
+                self.end_headers()
+                return None
+            path = os.path.join(path, "index.html")
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        content_type = self.guess_type(path)
+        accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        use_gzip = accepts_gzip and content_type.startswith(_COMPRESSIBLE_TYPES)
+
+        # 依檔案修改時間與大小快取處理後的內容，未變更的檔案不必重新壓縮
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self.cache.get((path, use_gzip))
+        if cached is None or cached[0] != version:
+            with open(path, "rb") as f:
+                body = f.read()
+            if content_type == "text/html":
+                body = self._inject_live_reload(body)
+            etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            compressed = use_gzip and len(body) >= _MIN_COMPRESS_SIZE
+            if compressed:
+                body = gzip.compress(body, compresslevel=6)
+            cached = (version, body, etag, compressed)
+            self.cache[(path, use_gzip)] = cached
+        _, body, etag, compressed = cached
+
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        return body
+
+    @staticmethod
+    def _inject_live_reload(body: bytes) -> bytes:
+        """在 </body> 前插入即時重新載入腳本"""
+        script = LIVE_RELOAD_SCRIPT.encode("utf-8")
+        index = body.rfind(b"</body>")
+        if index == -1:
+            return body + script
+        return body[:index] + script + body[index:]
+
+    def _serve_events(self) -> None:
+        """以 Server-Sent Events 推送重新載入事件"""
+        # 在回應前記下版本，避免錯過連線建立期間發生的變更
+        version = self.hub.version
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+
+        try:
+            while True:
+                version, paths = self.hub.wait(version, timeout=15)
+                if paths is None:
+                    # 定期送出註解保持連線，也用來偵測已關閉的連線
+                    self.wfile.write(b": ping\n\n")
+                else:
+                    data = json.dumps(paths)
+                    self.wfile.write(f"event: reload\ndata: {data}\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+class DevServer:
+    """在背景執行緒中運行的開發伺服器"""
+
+    def __init__(
+        self, directory: str, host: str = "127.0.0.1", port: int = 8000
+    ) -> None:
+        """
+        初始化伺服器
+
+        Args:
+            directory: 要提供的目錄
+            host: 監聽位址
+            port: 監聽埠號，0 表示自動選擇
+        """
+        self.directory = os.path.abspath(directory)
+        self.hub = LiveReloadHub()
+        handler = partial(
+            DevRequestHandler, directory=self.directory, hub=self.hub, cache={}
+        )
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """伺服器網址"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def start(self) -> None:
+        """在背景執行緒中啟動伺服器"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止伺服器"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def reload(self, paths: List[str]) -> None:
+        """
+        通知瀏覽器重新載入
+
+        Args:
+            paths: 變更的輸出檔案路徑（相對於網站根目錄）
+        """
+        self.hub.notify(paths)
@@ -0,0 +1,570 @@
+"""
+模擬的 Google Sheets / Drive API 伺服器 - 在本機提供合成的試算表，
+用於量測擷取資料的效能與韌性
+
+實作 SheetService（gspread）使用的端點：
+- GET /v4/spreadsheets/<ID>                  試算表中繼資料
+- GET /v4/spreadsheets/<ID>/values/<範圍>     工作表的值（支援 A1 範圍，可分段擷取）
+- GET /v4/spreadsheets/<ID>/values:batchGet  一次擷取多個範圍
+- GET /drive/v3/files/<ID>                   Drive 中繼資料（最後修改時間）
+
+可注入固定或隨機的延遲、指定的錯誤回應（例如 429 配額錯誤）、每分鐘請求數上限，
+並可隨時新增資料行以產生新的修訂版本。錯誤回應使用與 Google API 相同的 JSON 格式，
+gspread 會拋出相同的 APIError。回應內容依修訂版本快取，大型試算表的序列化與壓縮
+不會成為量測的瓶頸。
+"""
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# 合成資料的表頭
+SYNTHETIC_HEADERS = ["時間戳記", "作者名", "作品標題", "作品連結", "類別"]
+
+# 合成資料的類別與標題用字
+_CATEGORIES = ["小說", "詩歌", "散文", "漫畫"]
+_WORDS = "罷免 到底 創作 接力 台灣 民主 自由 島嶼 春天 夜晚 海 山 風 雨 光 影".split()
+
+# 小於此大小的回應不壓縮
+_MIN_COMPRESS_SIZE = 512
+
+# A1 範圍中的儲存格（欄與列都可省略，例如 A、2、A2）
+_CELL_RE = re.compile(r"^([A-Za-z]*)(\d*)$")
+
+# Google API 錯誤狀態碼對應的 status 文字
+_ERROR_STATUS = {
+    400: "INVALID_ARGUMENT",
+    403: "PERMISSION_DENIED",
+    404: "NOT_FOUND",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+}
+
+
+def synthetic_values(row_count: int, seed: int = 0) -> List[List[str]]:
+    """
+    產生合成的投稿資料（含表頭），格式與 Google 表單的回應相同
+
+    Args:
+        row_count: 資料行數（不含表頭）
+        seed: 亂數種子，相同的種子產生相同的資料
+
+    Returns:
+        工作表的值
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 3, 1)
+    values = [list(SYNTHETIC_HEADERS)]
+    for i in range(row_count):
+        moment = start + timedelta(seconds=rng.randrange(90 * 86400))
+        period = "上午" if moment.hour < 12 else "下午"
+        values.append(
+            [
+                f"{moment.year}/{moment.month}/{moment.day} {period} "
+                f"{moment.hour % 12 or 12:02d}:{moment.minute:02d}:{moment.second:02d}",
+                f"作者{rng.randrange(1, 3000)}",
+                "".join(rng.sample(_WORDS, 3)) + f" {i}",
+                f"https://example.com/works/{i}",
+                rng.choice(_CATEGORIES),
+            ]
+        )
+    return values
+
+
+def _rfc3339(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+def _column_number(letters: str) -> int:
+    """欄位字母轉為從 1 開始的欄號"""
+    number = 0
+    for letter in letters.upper():
+        number = number * 26 + ord(letter) - ord("A") + 1
+    return number
+
+
+def _column_letters(number: int) -> str:
+    """從 1 開始的欄號轉為欄位字母"""
+    letters = ""
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def parse_range(range_name: str) -> Tuple[str, Optional[str]]:
+    """
+    將範圍拆為工作表名稱與 A1 範圍
+
+    Args:
+        range_name: 例如 'Sheet1'、Sheet1!A2:E100 或 'It''s'!A:B
+
+    Returns:
+        (工作表名稱, A1 範圍；沒有指定時為 None)
+    """
+    if range_name.startswith("'"):
+        end = 1
+        while True:
+            end = range_name.index("'", end)
+            if range_name[end + 1 : end + 2] != "'":
+                break
+            end += 2
+        title = range_name[1:end].replace("''", "'")
+        rest = range_name[end + 1 :]
+    else:
+        title, _, rest = range_name.partition("!")
+        rest = "!" + rest if rest else ""
+    return title, rest[1:] if rest.startswith("!") else None
+
+
+@dataclass
+class FakeSpreadsheet:
+    """模擬的試算表"""
+
+    spreadsheet_id: str
+    title: str
+    # 工作表名稱 -> 值（依工作表順序）
+    sheets: Dict[str, List[List[str]]]
+    created_time: datetime
+    modified_time: datetime
+    revision: int = 1
+
+
+@dataclass
+class FakeApiStats:
+    """模擬伺服器的請求統計"""
+
+    # 端點類型 -> 請求數
+    requests: Counter = field(default_factory=Counter)
+    # 狀態碼 -> 注入或產生的錯誤回應數
+    errors: Counter = field(default_factory=Counter)
+    # 實際送出的回應內容大小（壓縮後）
+    bytes_sent: int = 0
+    # 未壓縮的回應內容大小
+    raw_bytes: int = 0
+
+
+class FakeSheetsApi:
+    """模擬的 API 狀態：試算表、注入的延遲與錯誤，可在測試中隨時修改"""
+
+    def __init__(self, seed: int = 0) -> None:
+        """
+        初始化
+
+        Args:
+            seed: 延遲抖動與隨機錯誤使用的亂數種子
+        """
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.error_rate = 0.0
+        self.error_status = HTTPStatus.TOO_MANY_REQUESTS
+        self.requests_per_minute: Optional[int] = None
+        self.stats = FakeApiStats()
+        self._spreadsheets: Dict[str, FakeSpreadsheet] = {}
+        self._pending_errors: Deque[int] = deque()
+        self._request_times: Deque[float] = deque()
+        # (試算表 ID, 修訂版本, 網址, 是否壓縮) -> 回應內容
+        self._responses: Dict[Tuple[str, int, str, bool], bytes] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def add_spreadsheet(
+        self,
+        spreadsheet_id: str,
+        sheets: Dict[str, List[List[str]]],
+        title: str = "作品投稿（模擬）",
+    ) -> FakeSpreadsheet:
+        """
+        新增或取代試算表
+
+        Args:
+            spreadsheet_id: 試算表 ID
+            sheets: 工作表名稱 -> 值
+            title: 試算表標題
+
+        Returns:
+            FakeSpreadsheet
+        """
+        now = datetime.now(timezone.utc)
+        spreadsheet = FakeSpreadsheet(
+            spreadsheet_id=spreadsheet_id,
+            title=title,
+            sheets={name: [list(row) for row in rows] for name, rows in sheets.items()},
+            created_time=now,
+            modified_time=now,
+        )
+        with self._lock:
+            self._spreadsheets[spreadsheet_id] = spreadsheet
+            self._forget_responses(spreadsheet_id)
+        return spreadsheet
+
+    def append_rows(
+        self, spreadsheet_id: str, sheet_name: str, rows: List[List[str]]
+    ) -> int:
+        """
+        在工作表末端新增資料行，產生新的修訂版本（最後修改時間也會更新）
+
+        Args:
+            spreadsheet_id: 試算表 ID
+            sheet_name: 工作表名稱
+            rows: 新增的資料行
+
+        Returns:
+            新的修訂版本號
+        """
+        with self._lock:
+            spreadsheet = self._spreadsheets[spreadsheet_id]
+            spreadsheet.sheets[sheet_name].extend(list(row) for row in rows)
+            self._touch(spreadsheet)
+            return spreadsheet.revision
+
+    def fail_next(
+        self, count: int = 1, status: int = HTTPStatus.TOO_MANY_REQUESTS
+    ) -> None:
+        """
+        讓接下來的請求回應錯誤
+
+        Args:
+            count: 回應錯誤的請求數
+            status: 錯誤狀態碼（預設 429 配額錯誤）
+        """
+        with self._lock:
+            self._pending_errors.extend([int(status)] * count)
+
+    def reset_stats(self) -> None:
+        """清除請求統計"""
+        with self._lock:
+            self.stats = FakeApiStats()
+
+    def handle(
+        self, path: str, query: str, accept_gzip: bool = False
+    ) -> Tuple[int, bytes, bool]:
+        """
+        處理一個 GET 請求（不含延遲）
+
+        Args:
+            path: 請求路徑
+            query: 查詢字串（不含 ?）
+            accept_gzip: 用戶端是否接受 gzip
+
+        Returns:
+            (狀態碼, 回應內容, 內容是否經過 gzip 壓縮)
+        """
+        kind, spreadsheet_id, rest = self._route(path)
+        with self._lock:
+            self.stats.requests[kind] += 1
+            error = self._injected_error()
+            if error is not None:
+                return self._error(error, self._error_message(error))
+            spreadsheet = self._spreadsheets.get(spreadsheet_id)
+            if kind == "unknown":
+                return self._error(404, f"找不到路徑 {path}")
+            if spreadsheet is None:
+                return self._error(404, "Requested entity was not found.")
+            key = (spreadsheet_id, spreadsheet.revision, f"{path}?{query}", False)
+            body = self._responses.get(key)
+            if body is None:
+                try:
+                    payload = self._payload(kind, spreadsheet, rest, parse_qs(query))
+                except ValueError as e:
+                    return self._error(400, str(e))
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self._responses[key] = body
+            self.stats.raw_bytes += len(body)
+            compressed = accept_gzip and len(body) >= _MIN_COMPRESS_SIZE
+            if compressed:
+                gzip_key = key[:3] + (True,)
+                gzipped = self._responses.get(gzip_key)
+                if gzipped is None:
+                    gzipped = gzip.compress(body, compresslevel=6, mtime=0)
+                    self._responses[gzip_key] = gzipped
+                body = gzipped
+            self.stats.bytes_sent += len(body)
+            return HTTPStatus.OK, body, compressed
+
+    def delay(self) -> float:
+        """本次請求要注入的延遲秒數"""
+        with self._lock:
+            return self.latency + self._rng.uniform(0, self.jitter)
+
+    @staticmethod
+    def _route(path: str) -> Tuple[str, str, str]:
+        """
+        判斷請求的端點
+
+        Returns:
+            (端點類型, 試算表 ID, 剩餘的路徑)
+        """
+        if path.startswith("/drive/v3/files/"):
+            file_id = path[len("/drive/v3/files/") :]
+            return ("drive", file_id, "") if "/" not in file_id else ("unknown", "", "")
+        if path.startswith("/v4/spreadsheets/"):
+            spreadsheet_id, _, rest = path[len("/v4/spreadsheets/") :].partition("/")
+            if rest == "" and ":" not in spreadsheet_id:
+                return "metadata", spreadsheet_id, ""
+            if rest == "values:batchGet":
+                return "batch_get", spreadsheet_id, ""
+            if rest.startswith("values/"):
+                return "values", spreadsheet_id, unquote(rest[len("values/") :])
+        return "unknown", "", ""
+
+    def _payload(
+        self,
+        kind: str,
+        spreadsheet: FakeSpreadsheet,
+        range_name: str,
+        params: Dict[str, List[str]],
+    ) -> Dict[str, Any]:
+        """產生端點的回應內容"""
+        if kind == "drive":
+            return {
+                "kind": "drive#file",
+                "id": spreadsheet.spreadsheet_id,
+                "name": spreadsheet.title,
+                "mimeType": "application/vnd.google-apps.spreadsheet",
+                "createdTime": _rfc3339(spreadsheet.created_time),
+                "modifiedTime": _rfc3339(spreadsheet.modified_time),
+            }
+        if kind == "metadata":
+            return self._metadata(spreadsheet)
+        if kind == "values":
+            return self._value_range(spreadsheet, range_name)
+        return {
+            "spreadsheetId": spreadsheet.spreadsheet_id,
+            "valueRanges": [
+                self._value_range(spreadsheet, name)
+                for name in params.get("ranges", [])
+            ],
+        }
+
+    @staticmethod
+    def _metadata(spreadsheet: FakeSpreadsheet) -> Dict[str, Any]:
+        sheets = []
+        for index, (name, values) in enumerate(spreadsheet.sheets.items()):
+            sheets.append(
+                {
+                    "properties": {
+                        "sheetId": index,
+                        "title": name,
+                        "index": index,
+                        "sheetType": "GRID",
+                        "gridProperties": {
+                            "rowCount": max(len(values), 1000),
+                            "columnCount": max(
+                                max((len(row) for row in values), default=0), 26
+                            ),
+                        },
+                    }
+                }
+            )
+        return {
+            "spreadsheetId": spreadsheet.spreadsheet_id,
+            "properties": {
+                "title": spreadsheet.title,
+                "locale": "zh_TW",
+                "autoRecalc": "ON_CHANGE",
+                "timeZone": "Asia/Taipei",
+            },
+            "sheets": sheets,
+            "spreadsheetUrl": (
+                f"https://docs.google.com/spreadsheets/d/{spreadsheet.spreadsheet_id}"
+            ),
+        }
+
+    @staticmethod
+    def _value_range(spreadsheet: FakeSpreadsheet, range_name: str) -> Dict[str, Any]:
+        """
+        擷取範圍內的值，與 Sheets API 相同地省略末端的空白列
+
+        Raises:
+            ValueError: 範圍無法解析或工作表不存在
+        """
+        title, a1 = parse_range(range_name)
+        values = spreadsheet.sheets.get(title)
+        if values is None:
+            raise ValueError(f"Unable to parse range: {range_name}")
+
+        width = max((len(row) for row in values), default=0)
+        first_col, first_row, last_col, last_row = 1, 1, width, len(values)
+        if a1:
+            start, _, end = a1.partition(":")
+            start_match, end_match = _CELL_RE.match(start), _CELL_RE.match(end or start)
+            if start_match is None or end_match is None:
+                raise ValueError(f"Unable to parse range: {range_name}")
+            first_col = _column_number(start_match.group(1)) or 1
+            first_row = int(start_match.group(2) or 1)
+            last_col = _column_number(end_match.group(1)) or width
+            last_row = int(end_match.group(2) or len(values))
+
+        rows = [
+            row[first_col - 1 : last_col] for row in values[first_row - 1 : last_row]
+        ]
+        while rows and not any(rows[-1]):
+            rows.pop()
+        quoted = title.replace("'", "''")
+        response: Dict[str, Any] = {
+            "range": f"'{quoted}'!{_column_letters(first_col)}{first_row}:"
+            f"{_column_letters(max(last_col, first_col))}{max(last_row, first_row)}",
+            "majorDimension": "ROWS",
+        }
+        if rows:
+            response["values"] = rows
+        return response
+
+    def _injected_error(self) -> Optional[int]:
+        """本次請求要回應的錯誤狀態碼，呼叫時需持有鎖"""
+        if self._pending_errors:
+            return self._pending_errors.popleft()
+        if self.requests_per_minute is not None:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= 60:
+                self._request_times.popleft()
+            if len(self._request_times) >= self.requests_per_minute:
+                return HTTPStatus.TOO_MANY_REQUESTS
+            self._request_times.append(now)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return int(self.error_status)
+        return None
+
+    @staticmethod
+    def _error_message(status: int) -> str:
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            return (
+                "Quota exceeded for quota metric 'Read requests' and limit "
+                "'Read requests per minute per user' of service "
+                "'sheets.googleapis.com'."
+            )
+        return "模擬的錯誤回應"
+
+    def _error(self, status: int, message: str) -> Tuple[int, bytes, bool]:
+        """Google API 格式的錯誤回應，呼叫時需持有鎖"""
+        self.stats.errors[status] += 1
+        payload = {
+            "error": {
+                "code": status,
+                "message": message,
+                "status": _ERROR_STATUS.get(status, "UNKNOWN"),
+            }
+        }
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.stats.bytes_sent += len(body)
+        self.stats.raw_bytes += len(body)
+        return status, body, False
+
+    def _touch(self, spreadsheet: FakeSpreadsheet) -> None:
+        """更新修訂版本與最後修改時間，呼叫時需持有鎖"""
+        spreadsheet.revision += 1
+        now = datetime.now(timezone.utc)
+        # 同一毫秒內連續修改時，最後修改時間仍需不同
+        minimum = spreadsheet.modified_time + timedelta(milliseconds=1)
+        spreadsheet.modified_time = max(now, minimum)
+        self._forget_responses(spreadsheet.spreadsheet_id)
+
+    def _forget_responses(self, spreadsheet_id: str) -> None:
+        """捨棄試算表舊版本的快取回應，呼叫時需持有鎖"""
+        for key in [key for key in self._responses if key[0] == spreadsheet_id]:
+            del self._responses[key]
+
+
+class FakeSheetsRequestHandler(BaseHTTPRequestHandler):
+    """將請求交給 FakeSheetsApi 處理，並依設定延遲回應"""
+
+    # 與 Google API 相同使用持續連線
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def __init__(self, *args: Any, api: FakeSheetsApi, **kwargs: Any) -> None:
+        self.api = api
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """不輸出每個請求的紀錄"""
+
+    def do_GET(self) -> None:
+        """處理 GET 請求"""
+        delay = self.api.delay()
+        if delay > 0:
+            time.sleep(delay)
+        url = urlsplit(self.path)
+        status, body, compressed = self.api.handle(
+            url.path, url.query, "gzip" in self.headers.get("Accept-Encoding", "")
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _FakeSheetsHTTPServer(ThreadingHTTPServer):
+    """允許較多等待中的連線，量測並行擷取時不會被拒絕"""
+
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeSheetsServer:
+    """模擬的 Google Sheets / Drive API 伺服器"""
+
+    def __init__(
+        self,
+        api: Optional[FakeSheetsApi] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        初始化伺服器
+
+        Args:
+            api: 模擬的 API 狀態，未指定時建立空的狀態
+            host: 監聽位址
+            port: 監聽埠號，0 表示自動選擇
+        """
+        self.api = api or FakeSheetsApi()
+        handler = partial(FakeSheetsRequestHandler, api=self.api)
+        self.httpd = _FakeSheetsHTTPServer((host, port), handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """伺服器網址，可作為 SheetService 的 api_base_url"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """在背景執行緒中啟動伺服器"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """在目前的執行緒中執行伺服器，直到呼叫 stop()"""
+        self.httpd.serve_forever()
+
+    def stop(self) -> None:
+        """停止伺服器"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeSheetsServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
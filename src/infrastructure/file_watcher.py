@@ -0,0 +1,89 @@
+"""
+檔案監看 - 以輪詢檔案修改時間的方式偵測目錄變更，不需額外套件
+"""
+
+import os
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+# 檔案狀態：(修改時間, 檔案大小)
+FileState = Tuple[int, int]
+
+
+class PollingWatcher:
+    """輪詢式檔案監看器"""
+
+    def __init__(self, paths: Iterable[str], interval: float = 0.2) -> None:
+        """
+        初始化監看器並記錄目前的檔案狀態
+
+        Args:
+            paths: 要監看的目錄或檔案
+            interval: 輪詢間隔（秒）
+        """
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.interval = interval
+        self._states = self._scan()
+
+    def _scan(self) -> Dict[str, FileState]:
+        """掃描所有監看路徑下的檔案狀態"""
+        states: Dict[str, FileState] = {}
+        for path in self.paths:
+            if os.path.isfile(path):
+                self._record(path, states)
+                continue
+            for root, dirs, files in os.walk(path):
+                # 略過隱藏目錄與快取目錄
+                dirs[:] = [
+                    d for d in dirs if not d.startswith(".") and d != "__pycache__"
+                ]
+                for name in files:
+                    # 略過編輯器產生的暫存檔
+                    if name.startswith(".") or name.endswith(("~", ".swp", ".tmp")):
+                        continue
+                    self._record(os.path.join(root, name), states)
+        return states
+
+    @staticmethod
+    def _record(path: str, states: Dict[str, FileState]) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # 檔案在掃描期間被刪除
+            return
+        states[path] = (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self) -> Set[str]:
+        """
+        檢查一次變更
+
+        Returns:
+            自上次檢查以來新增、修改或刪除的檔案路徑
+        """
+        current = self._scan()
+        changed = {
+            path for path, state in current.items() if self._states.get(path) != state
+        }
+        changed.update(path for path in self._states if path not in current)
+        self._states = current
+        return changed
+
+    def watch(
+        self,
+        callback: Callable[[Set[str]], None],
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """
+        持續監看並在有變更時呼叫 callback
+
+        連續的變更（例如編輯器存檔時的多次寫入）會在下一次輪詢時合併處理。
+
+        Args:
+            callback: 接收變更檔案集合的函式
+            should_stop: 回傳 True 時停止監看
+        """
+        while not (should_stop and should_stop()):
+            time.sleep(self.interval)
+            changed = self.poll()
+            if changed:
+                callback(changed)
@@ -0,0 +1,299 @@
+"""
+投稿歷史紀錄 - 以 SQLite 保存每次擷取的資料，並查詢兩次執行之間的差異
+
+每一行以「時間戳記 + 作品連結」作為穩定的識別鍵。每筆紀錄保存它第一次出現、
+最後一次變更與被移除的執行編號，配合索引即可在 O(變更數量) 內查出任兩次執行
+之間新增、變更或移除的資料，不需要重新掃描整個表格。寫入時也只會寫入有變化
+的資料行。
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.domain.models import SheetData
+from src.domain.timestamps import TimestampParser
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fetched_at TEXT NOT NULL,
+    row_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS submissions (
+    row_key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    timestamp_epoch REAL,
+    author TEXT NOT NULL,
+    category TEXT NOT NULL,
+    link TEXT NOT NULL,
+    data TEXT NOT NULL,
+    first_seen_run INTEGER NOT NULL,
+    changed_run INTEGER NOT NULL,
+    removed_run INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_submissions_category ON submissions (category);
+CREATE INDEX IF NOT EXISTS idx_submissions_author ON submissions (author);
+CREATE INDEX IF NOT EXISTS idx_submissions_timestamp ON submissions (timestamp);
+CREATE INDEX IF NOT EXISTS idx_submissions_first_seen
+    ON submissions (first_seen_run);
+CREATE INDEX IF NOT EXISTS idx_submissions_timestamp_epoch
+    ON submissions (timestamp_epoch);
+CREATE INDEX IF NOT EXISTS idx_submissions_changed ON submissions (changed_run);
+CREATE INDEX IF NOT EXISTS idx_submissions_removed ON submissions (removed_run);
+"""
+
+_UPSERT = """
+INSERT INTO submissions (
+    row_key, content_hash, timestamp, timestamp_epoch, author, category, link,
+    data, first_seen_run, changed_run, removed_run
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+ON CONFLICT (row_key) DO UPDATE SET
+    content_hash = excluded.content_hash,
+    timestamp = excluded.timestamp,
+    timestamp_epoch = excluded.timestamp_epoch,
+    author = excluded.author,
+    category = excluded.category,
+    link = excluded.link,
+    data = excluded.data,
+    changed_run = excluded.changed_run,
+    removed_run = NULL
+"""
+
+
+@dataclass
+class HistoryDiff:
+    """兩次執行之間的資料差異"""
+
+    from_run: int
+    to_run: int
+    added: List[Dict[str, str]] = field(default_factory=list)
+    changed: List[Dict[str, str]] = field(default_factory=list)
+    removed: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """是否沒有任何差異"""
+        return not (self.added or self.changed or self.removed)
+
+
+class HistoryStore:
+    """以 SQLite 保存的投稿歷史紀錄"""
+
+    def __init__(
+        self, path: str, timestamp_parser: Optional[TimestampParser] = None
+    ) -> None:
+        """
+        開啟（或建立）歷史紀錄資料庫
+
+        Args:
+            path: SQLite 資料庫路徑，可使用 ":memory:"
+            timestamp_parser: 計算排序用 epoch 值的時間戳記解析器
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.timestamp_parser = timestamp_parser or TimestampParser()
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """關閉資料庫連線"""
+        self.conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _iter_records(
+        self, data: SheetData, indices: Dict[str, int]
+    ) -> Iterator[Tuple[str, str, str, Optional[float], str, str, str, str]]:
+        """
+        將資料行轉換為資料庫紀錄
+
+        Args:
+            data: 表格資料
+            indices: 重要欄位索引
+
+        Yields:
+            (識別鍵, 內容雜湊, 時間戳記, 時間戳記 epoch, 作者, 類別, 連結, JSON 資料)
+        """
+
+        def cell(row: List[str], key: str) -> str:
+            index = indices.get(key, -1)
+            return row[index] if 0 <= index < len(row) else ""
+
+        seen: Dict[str, int] = {}
+        for row in data.rows:
+            content = json.dumps(
+                dict(zip(data.headers, row, strict=False)), ensure_ascii=False
+            )
+            content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+            timestamp = cell(row, "timestamp")
+            link = cell(row, "link")
+            if timestamp or link:
+                base_key = f"{timestamp}\x1f{link}"
+            else:
+                # 沒有識別欄位時只能以內容作為識別
+                base_key = content_hash
+
+            # 同一次擷取中重複的識別鍵依出現順序編號
+            occurrence = seen.get(base_key, 0)
+            seen[base_key] = occurrence + 1
+            row_key = base_key if occurrence == 0 else f"{base_key}\x1f{occurrence}"
+
+            yield (
+                row_key,
+                content_hash,
+                timestamp,
+                self.timestamp_parser.epoch(timestamp),
+                cell(row, "author"),
+                cell(row, "category"),
+                link,
+                content,
+            )
+
+    def record_run(
+        self,
+        data: SheetData,
+        indices: Dict[str, int],
+        fetched_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        保存一次擷取的資料
+
+        Args:
+            data: 表格資料
+            indices: 重要欄位索引
+            fetched_at: 擷取時間，預設為現在
+
+        Returns:
+            本次執行的編號
+        """
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+
+        # 目前仍存在的資料及其內容雜湊
+        existing = dict(
+            self.conn.execute(
+                "SELECT row_key, content_hash FROM submissions "
+                "WHERE removed_run IS NULL"
+            )
+        )
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (fetched_at, row_count) VALUES (?, ?)",
+                (fetched_at.astimezone(timezone.utc).isoformat(), data.row_count),
+            )
+            run_id = int(cursor.lastrowid or 0)
+
+            # 只寫入新增或內容有變化的資料行
+            upserts = []
+            for record in self._iter_records(data, indices):
+                row_key, content_hash = record[0], record[1]
+                if existing.pop(row_key, None) != content_hash:
+                    upserts.append(record + (run_id, run_id))
+            self.conn.executemany(_UPSERT, upserts)
+
+            # 本次沒有出現的資料標記為已移除
+            self.conn.executemany(
+                "UPDATE submissions SET removed_run = ? WHERE row_key = ?",
+                ((run_id, row_key) for row_key in existing),
+            )
+
+        return run_id
+
+    def latest_run(self) -> Optional[int]:
+        """
+        取得最近一次執行的編號
+
+        Returns:
+            執行編號，沒有任何紀錄時為 None
+        """
+        row = self.conn.execute("SELECT MAX(id) FROM runs").fetchone()
+        return None if row[0] is None else int(row[0])
+
+    def run_before(self, moment: datetime) -> Optional[int]:
+        """
+        取得指定時間（含）之前最後一次執行的編號
+
+        Args:
+            moment: 時間點（需包含時區）
+
+        Returns:
+            執行編號，沒有更早的紀錄時為 None
+        """
+        row = self.conn.execute(
+            "SELECT MAX(id) FROM runs WHERE fetched_at <= ?",
+            (moment.astimezone(timezone.utc).isoformat(),),
+        ).fetchone()
+        return None if row[0] is None else int(row[0])
+
+    def diff(self, from_run: int, to_run: Optional[int] = None) -> HistoryDiff:
+        """
+        查詢兩次執行之間的差異
+
+        每筆資料只保存最新內容與最後一次變更、移除的執行編號，不保存每次的轉變，
+        因此有以下限制：
+        - 變更的資料回傳的是目前的內容，兩次執行之間的中間版本不會列出
+        - 移除後又重新出現的資料列為「變更」而非「新增」，其間的移除也不會列出
+
+        Args:
+            from_run: 起始執行編號（不含），0 表示從頭開始
+            to_run: 結束執行編號（含），預設為最近一次執行
+
+        Returns:
+            HistoryDiff: 新增、變更與移除的資料
+        """
+        if to_run is None:
+            to_run = self.latest_run() or 0
+
+        def query(condition: str) -> List[Dict[str, str]]:
+            rows = self.conn.execute(
+                f"SELECT data FROM submissions WHERE {condition} "
+                # 依解析後的時間排序，無法解析的時間戳記排在最後
+                "ORDER BY timestamp_epoch IS NULL, timestamp_epoch, row_key",
+                {"from_run": from_run, "to_run": to_run},
+            )
+            return [json.loads(data) for (data,) in rows]
+
+        still_present = "(removed_run IS NULL OR removed_run > :to_run)"
+        return HistoryDiff(
+            from_run=from_run,
+            to_run=to_run,
+            added=query(
+                "first_seen_run > :from_run AND first_seen_run <= :to_run "
+                f"AND {still_present}"
+            ),
+            changed=query(
+                "changed_run > :from_run AND changed_run <= :to_run "
+                f"AND first_seen_run <= :from_run AND {still_present}"
+            ),
+            removed=query(
+                "removed_run > :from_run AND removed_run <= :to_run "
+                "AND first_seen_run <= :from_run"
+            ),
+        )
+
+    def diff_since(self, moment: datetime) -> HistoryDiff:
+        """
+        查詢指定時間之後的差異，例如「本週新增」
+
+        Args:
+            moment: 起始時間（需包含時區）
+
+        Returns:
+            HistoryDiff: 新增、變更與移除的資料
+        """
+        return self.diff(self.run_before(moment) or 0)
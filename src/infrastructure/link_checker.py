@@ -0,0 +1,299 @@
+"""
+連結健康檢查 - 以 asyncio 並行檢查作品連結，並將結果快取在磁碟上
+
+使用標準函式庫的 asyncio.open_connection 直接送出 HTTP/1.1 請求，不需額外套件。
+同時連線數有整體上限，並限制每個主機的連線數，避免對同一個網站送出過多請求。
+每個網址的檢查結果連同檢查時間保存在 JSON 快取檔中，未過期的結果不會重新檢查。
+"""
+
+import asyncio
+import json
+import os
+import socket
+import ssl
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+# 快取檔格式版本
+CACHE_VERSION = 1
+
+# 檢查結果狀態
+STATUS_OK = "ok"
+STATUS_BROKEN = "broken"
+STATUS_UNKNOWN = "unknown"
+
+# 明確表示資源不存在的 HTTP 狀態碼
+_BROKEN_STATUS_CODES = frozenset([404, 410])
+
+# HEAD 不被支援時改用 GET 重試的狀態碼
+_RETRY_WITH_GET_CODES = frozenset([400, 403, 405, 501])
+
+_REDIRECT_CODES = frozenset([301, 302, 303, 307, 308])
+
+_USER_AGENT = "pen-power-recall-link-checker/1.0"
+
+# 網址路徑與查詢字串中不需要編碼的字元
+_SAFE_URL_CHARS = "/%:@!$&'()*+,;=-._~?"
+
+
+@dataclass
+class LinkResult:
+    """單一網址的檢查結果"""
+
+    url: str
+    status: str
+    http_status: Optional[int]
+    checked_at: float
+    error: str = ""
+
+    @property
+    def is_broken(self) -> bool:
+        """連結是否確定失效"""
+        return self.status == STATUS_BROKEN
+
+
+def normalize_link(value: str) -> str:
+    """
+    將儲存格中的連結轉換為完整網址，與頁面上產生的連結一致
+
+    Args:
+        value: 儲存格內容
+
+    Returns:
+        網址，空白時為空字串
+    """
+    url = value.strip()
+    if url and not (url.startswith("http://") or url.startswith("https://")):
+        url = "https://" + url
+    return url
+
+
+class LinkChecker:
+    """並行連結檢查器"""
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl: float = 3 * 24 * 3600,
+        timeout: float = 10.0,
+        max_concurrency: int = 32,
+        per_host_limit: int = 2,
+        max_redirects: int = 5,
+    ) -> None:
+        """
+        初始化檢查器
+
+        Args:
+            cache_path: 快取檔路徑，未設定時不保存結果
+            ttl: 檢查結果的有效時間（秒）
+            timeout: 每個請求的逾時時間（秒）
+            max_concurrency: 整體同時連線數上限
+            per_host_limit: 每個主機的同時連線數上限
+            max_redirects: 最多跟隨的重新導向次數
+        """
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.max_redirects = max_redirects
+        self._ssl_context = ssl.create_default_context()
+
+    def check(
+        self, urls: Iterable[str], now: Optional[float] = None
+    ) -> Dict[str, LinkResult]:
+        """
+        檢查網址，只重新檢查新增或已過期的網址
+
+        Args:
+            urls: 要檢查的網址（重複的網址只檢查一次）
+            now: 目前時間，預設為 time.time()
+
+        Returns:
+            網址 -> 檢查結果
+        """
+        now = time.time() if now is None else now
+        cache = self._load_cache()
+
+        results: Dict[str, LinkResult] = {}
+        pending: List[str] = []
+        for url in dict.fromkeys(url for url in urls if url):
+            cached = cache.get(url)
+            if cached is not None and now - cached.checked_at < self.ttl:
+                results[url] = cached
+            else:
+                pending.append(url)
+
+        if pending:
+            checked = asyncio.run(self._check_all(pending, now))
+            results.update(checked)
+            cache.update(checked)
+            self._save_cache(cache)
+
+        return results
+
+    async def _check_all(self, urls: List[str], now: float) -> Dict[str, LinkResult]:
+        """並行檢查所有網址"""
+        limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def check_one(url: str) -> LinkResult:
+            host = (urlsplit(url).hostname or "").lower()
+            host_limit = host_limits.setdefault(
+                host, asyncio.Semaphore(self.per_host_limit)
+            )
+            # 先取得主機的名額：等待同一主機的工作不會佔住全域名額，
+            # 避免大量同主機網址讓其他主機的網址也只能排隊
+            async with host_limit, limit:
+                return await self._check_url(url, now)
+
+        results = await asyncio.gather(*(check_one(url) for url in urls))
+        return {result.url: result for result in results}
+
+    async def _check_url(self, url: str, now: float) -> LinkResult:
+        """
+        檢查單一網址，跟隨重新導向，HEAD 不被支援時改用 GET
+
+        Args:
+            url: 網址
+            now: 檢查時間
+
+        Returns:
+            LinkResult: 檢查結果
+        """
+        current = url
+        http_status: Optional[int] = None
+        try:
+            for _ in range(self.max_redirects + 1):
+                http_status, location = await self._request("HEAD", current)
+                if http_status in _RETRY_WITH_GET_CODES:
+                    http_status, location = await self._request("GET", current)
+                if http_status in _REDIRECT_CODES and location:
+                    current = urljoin(current, location)
+                    continue
+                break
+            else:
+                return LinkResult(
+                    url, STATUS_UNKNOWN, http_status, now, "重新導向次數過多"
+                )
+        except (OSError, asyncio.TimeoutError, ValueError) as e:
+            status, error = self._classify_error(e)
+            return LinkResult(url, status, None, now, error)
+
+        if http_status is not None and http_status < 400:
+            status = STATUS_OK
+        elif http_status in _BROKEN_STATUS_CODES:
+            status = STATUS_BROKEN
+        else:
+            # 403、429、5xx 等可能只是暫時拒絕自動化請求，不視為失效
+            status = STATUS_UNKNOWN
+        return LinkResult(url, status, http_status, now)
+
+    @staticmethod
+    def _classify_error(error: Exception) -> Tuple[str, str]:
+        """將連線錯誤分類為 (狀態, 錯誤訊息)"""
+        message = str(error) or type(error).__name__
+        # 網址無效、網域名稱無法解析或連線被拒時視為失效；逾時等其他錯誤可能是暫時的
+        if isinstance(error, (ValueError, socket.gaierror, ConnectionRefusedError)):
+            return STATUS_BROKEN, message
+        return STATUS_UNKNOWN, message
+
+    async def _request(self, method: str, url: str) -> Tuple[int, str]:
+        """
+        送出一個 HTTP/1.1 請求，只讀取狀態列與標頭
+
+        Args:
+            method: HTTP 方法
+            url: 網址
+
+        Returns:
+            (HTTP 狀態碼, Location 標頭)
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"無效的網址: {url}")
+
+        https = parts.scheme == "https"
+        host = parts.hostname.encode("idna").decode("ascii")
+        port = parts.port or (443 if https else 80)
+        target = quote(parts.path or "/", safe=_SAFE_URL_CHARS)
+        if parts.query:
+            target += "?" + quote(parts.query, safe=_SAFE_URL_CHARS)
+        host_header = host if parts.port is None else f"{host}:{port}"
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host,
+                port,
+                ssl=self._ssl_context if https else None,
+                server_hostname=host if https else None,
+            ),
+            self.timeout,
+        )
+        try:
+            writer.write(
+                (
+                    f"{method} {target} HTTP/1.1\r\n"
+                    f"Host: {host_header}\r\n"
+                    f"User-Agent: {_USER_AGENT}\r\n"
+                    "Accept: */*\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("ascii")
+            )
+            await writer.drain()
+            return await asyncio.wait_for(self._read_head(reader), self.timeout)
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Tuple[int, str]:
+        """讀取回應的狀態列與 Location 標頭"""
+        status_line = await reader.readline()
+        fields = status_line.decode("latin-1").split(None, 2)
+        if len(fields) < 2 or not fields[0].startswith("HTTP/"):
+            raise ValueError("無效的 HTTP 回應")
+        status = int(fields[1])
+
+        location = ""
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "location":
+                location = value.strip()
+        return status, location
+
+    def _load_cache(self) -> Dict[str, LinkResult]:
+        """讀取快取檔，不存在或格式不符時回傳空的快取"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") != CACHE_VERSION:
+                return {}
+            return {url: LinkResult(**entry) for url, entry in cache["links"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def _save_cache(self, results: Dict[str, LinkResult]) -> None:
+        """寫入快取檔"""
+        if not self.cache_path:
+            return
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "links": {url: asdict(result) for url, result in results.items()},
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.cache_path)
@@ -0,0 +1,385 @@
+"""
+輸出目標 - 以統一介面寫出網站檔案
+
+支援的後端：
+- 檔案系統目錄（預設）
+- 記憶體（測試或同時產生多種版本時使用）
+- tar / tar.gz 封存檔（串流寫入）
+- zip 封存檔（串流寫入，已壓縮的圖片等檔案不再壓縮）
+
+封存檔依寫入順序一次寫完，不需要先在輸出目錄中建立大量小檔案再打包；
+寫入過程中使用暫存檔，完成後才取代目標檔案。路徑一律為相對於網站根目錄的
+POSIX 路徑，例如 static/css/style.css。
+"""
+
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import PurePosixPath
+from typing import IO, ContextManager, Dict, Iterator, Optional, Set, Union
+
+# 封存檔副檔名
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+
+# 已經壓縮過的檔案，寫入 zip 時不再壓縮
+_STORED_SUFFIXES = {
+    ".avif",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".webp",
+    ".woff",
+    ".woff2",
+    ".zip",
+}
+
+# 寫入 tar 前在記憶體中緩衝的檔案大小上限，超過時改用暫存檔
+_SPOOL_SIZE = 16 * 1024 * 1024
+
+
+class OutputSink(ABC):
+    """輸出目標抽象類別"""
+
+    @property
+    def key(self) -> object:
+        """代表此輸出目標的值，用來判斷兩次輸出是否寫到同一個地方"""
+        return self
+
+    @abstractmethod
+    def open(self, path: str) -> ContextManager[IO[bytes]]:
+        """
+        開啟輸出檔案以寫入二進位內容
+
+        Args:
+            path: 相對於網站根目錄的路徑
+
+        Returns:
+            寫入完成時關閉的檔案物件（context manager）
+        """
+
+    @contextmanager
+    def open_text(self, path: str) -> Iterator[io.TextIOWrapper]:
+        """
+        開啟輸出檔案以寫入 UTF-8 文字
+
+        Args:
+            path: 相對於網站根目錄的路徑
+        """
+        with self.open(path) as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8")
+            try:
+                yield text
+            finally:
+                # 不關閉底層的檔案物件，由 open() 負責
+                text.detach()
+
+    def write_text(self, path: str, content: str) -> None:
+        """寫入整個文字檔案"""
+        with self.open_text(path) as f:
+            f.write(content)
+
+    def copy_file(self, source: str, path: str, link: bool = False) -> None:
+        """
+        將本機檔案放到輸出中
+
+        Args:
+            source: 本機檔案路徑
+            path: 相對於網站根目錄的路徑
+            link: 是否可以使用硬連結取代複製（來源檔案之後不會再修改時）
+        """
+        with open(source, "rb") as src, self.open(path) as dst:
+            shutil.copyfileobj(src, dst)
+
+    def local_dir(self, path: str) -> Optional[str]:
+        """
+        取得輸出中目錄的本機路徑，可以直接在其中寫入檔案
+
+        Args:
+            path: 相對於網站根目錄的目錄路徑
+
+        Returns:
+            本機目錄路徑，輸出不是寫到檔案系統時為 None
+        """
+        return None
+
+    def remove(self, path: str) -> None:
+        """
+        移除已寫入的檔案
+
+        Args:
+            path: 相對於網站根目錄的路徑
+
+        Raises:
+            ValueError: 輸出目標不支援移除檔案
+        """
+        raise ValueError(f"{type(self).__name__} 無法移除已寫入的檔案: {path}")
+
+    @abstractmethod
+    def close(self) -> None:
+        """完成輸出"""
+
+    def discard(self) -> None:
+        """放棄輸出（產生失敗時），預設與 close() 相同"""
+        self.close()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if exc_info[0] is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class FileSystemSink(OutputSink):
+    """寫入檔案系統目錄"""
+
+    def __init__(self, root: str) -> None:
+        """
+        初始化輸出目標，目錄不存在時建立
+
+        Args:
+            root: 輸出目錄路徑
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def key(self) -> object:
+        return os.path.abspath(self.root)
+
+    def path(self, path: str) -> str:
+        """取得輸出檔案的本機路徑"""
+        return os.path.join(self.root, *PurePosixPath(path).parts)
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[IO[bytes]]:
+        target = self._prepare(path)
+        with open(target, "wb") as f:
+            yield f
+
+    @contextmanager
+    def open_text(self, path: str) -> Iterator[io.TextIOWrapper]:
+        target = self._prepare(path)
+        with open(target, "w", encoding="utf-8") as f:
+            yield f
+
+    def copy_file(self, source: str, path: str, link: bool = False) -> None:
+        target = self._prepare(path)
+        if link:
+            if os.path.exists(target):
+                os.remove(target)
+            try:
+                os.link(source, target)
+                return
+            except OSError:
+                pass
+        shutil.copy2(source, target)
+
+    def local_dir(self, path: str) -> Optional[str]:
+        directory = self.path(path)
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def remove(self, path: str) -> None:
+        target = self.path(path)
+        if os.path.exists(target):
+            os.remove(target)
+
+    def close(self) -> None:
+        """檔案已直接寫入目錄，不需要收尾"""
+
+    def _prepare(self, path: str) -> str:
+        """取得輸出檔案的本機路徑並確保上層目錄存在"""
+        target = self.path(path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        return target
+
+
+class MemorySink(OutputSink):
+    """寫入記憶體，files 為路徑 -> 檔案內容"""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[IO[bytes]]:
+        buffer = io.BytesIO()
+        yield buffer
+        self.files[path] = buffer.getvalue()
+
+    def remove(self, path: str) -> None:
+        self.files.pop(path, None)
+
+    def close(self) -> None:
+        """內容保留在 files 中，不需要收尾"""
+
+
+class _ArchiveSink(OutputSink):
+    """封存檔輸出的共用部分：暫存檔、重複路徑檢查"""
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+        self._tmp_path = f"{target}.tmp"
+        self._names: Set[str] = set()
+        self._closed = False
+        # 封存檔中所有檔案使用相同的修改時間
+        self.mtime = int(time.time())
+        directory = os.path.dirname(os.path.abspath(target))
+        os.makedirs(directory, exist_ok=True)
+
+    def _claim(self, path: str) -> None:
+        """記錄寫入的路徑，封存檔中不能有重複的路徑"""
+        if path in self._names:
+            raise ValueError(f"封存檔中已有檔案: {path}")
+        self._names.add(path)
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """寫出封存檔結尾並關閉暫存檔"""
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._finish()
+        os.replace(self._tmp_path, self.target)
+
+    def discard(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._finish()
+        os.remove(self._tmp_path)
+
+
+class TarSink(_ArchiveSink):
+    """串流寫入 tar 封存檔"""
+
+    def __init__(self, target: str, compression: str = "") -> None:
+        """
+        初始化輸出目標
+
+        Args:
+            target: 封存檔路徑
+            compression: 壓縮方式，"" 或 "gz"
+        """
+        if compression not in ("", "gz"):
+            raise ValueError(f"不支援的壓縮方式: {compression}")
+        super().__init__(target)
+        if compression == "gz":
+            self._tar = tarfile.open(self._tmp_path, "w|gz")
+        else:
+            self._tar = tarfile.open(self._tmp_path, "w|")
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[IO[bytes]]:
+        self._claim(path)
+        # tar 的檔案標頭需要事先知道大小，因此先緩衝整個檔案
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as buffer:
+            yield buffer
+            info = tarfile.TarInfo(path)
+            info.size = buffer.tell()
+            info.mtime = self.mtime
+            info.mode = 0o644
+            buffer.seek(0)
+            self._tar.addfile(info, buffer)
+
+    def copy_file(self, source: str, path: str, link: bool = False) -> None:
+        self._claim(path)
+        info = self._tar.gettarinfo(source, arcname=path)
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        with open(source, "rb") as f:
+            self._tar.addfile(info, f)
+
+    def _finish(self) -> None:
+        self._tar.close()
+
+
+class ZipSink(_ArchiveSink):
+    """串流寫入 zip 封存檔"""
+
+    def __init__(self, target: str) -> None:
+        """
+        初始化輸出目標
+
+        Args:
+            target: 封存檔路徑
+        """
+        super().__init__(target)
+        self._zip = zipfile.ZipFile(
+            self._tmp_path, "w", compression=zipfile.ZIP_DEFLATED
+        )
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[IO[bytes]]:
+        self._claim(path)
+        info = zipfile.ZipInfo(path, date_time=time.localtime(self.mtime)[:6])
+        info.compress_type = _compress_type(path)
+        info.external_attr = 0o644 << 16
+        with self._zip.open(info, "w") as f:
+            yield f
+
+    def copy_file(self, source: str, path: str, link: bool = False) -> None:
+        self._claim(path)
+        self._zip.write(source, path, compress_type=_compress_type(path))
+
+    def _finish(self) -> None:
+        self._zip.close()
+
+
+def _compress_type(path: str) -> int:
+    """已壓縮過的檔案直接儲存，其他檔案以 deflate 壓縮"""
+    if PurePosixPath(path).suffix.lower() in _STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def is_archive_path(target: str) -> bool:
+    """輸出路徑是否為封存檔"""
+    return target.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def create_output_sink(target: str) -> OutputSink:
+    """
+    依輸出路徑的副檔名建立輸出目標
+
+    Args:
+        target: 輸出目錄，或 .zip、.tar、.tar.gz、.tgz 封存檔路徑
+
+    Returns:
+        OutputSink: 對應的輸出目標，封存檔需要呼叫 close() 才會寫出
+    """
+    lower = target.lower()
+    if lower.endswith(".zip"):
+        return ZipSink(target)
+    if lower.endswith((".tar.gz", ".tgz")):
+        return TarSink(target, "gz")
+    if lower.endswith(".tar"):
+        return TarSink(target)
+    return FileSystemSink(target)
+
+
+def as_output_sink(output: Union[str, OutputSink]) -> OutputSink:
+    """
+    將輸出目錄路徑轉換為輸出目標，已經是輸出目標時直接回傳
+
+    Args:
+        output: 輸出目錄路徑或輸出目標
+
+    Returns:
+        OutputSink: 輸出目標
+    """
+    if isinstance(output, OutputSink):
+        return output
+    return FileSystemSink(output)
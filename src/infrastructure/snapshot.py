@@ -0,0 +1,255 @@
+"""
+資料快照 - 以精簡的二進位格式保存 SheetData，並透過 mmap 快速重新載入
+
+檔案格式（所有整數皆為 little-endian）：
+
+    magic          8 bytes  b"PPRSNAP\\x01"
+    column_count   u32
+    row_count      u32
+    header_count   u32
+    column index   column_count × (u64 offset, u64 length)
+    headers        header_count × (u32 length + UTF-8 bytes)
+    row lengths    row_count × u32，保留每一行原本的儲存格數量
+    column blocks  每欄為 (row_count + 1) 個 u32 位移量，後接連續的 UTF-8 資料
+
+欄位索引讓讀取端可以只解碼需要的欄位或儲存格，不必解析整個檔案。
+"""
+
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple
+
+from src.domain.models import SheetData
+
+SNAPSHOT_MAGIC = b"PPRSNAP\x01"
+
+_PREAMBLE = struct.Struct("<8sIII")
+_INDEX_ENTRY = struct.Struct("<QQ")
+_U32 = struct.Struct("<I")
+
+
+def write_snapshot(data: SheetData, path: str) -> None:
+    """
+    將 SheetData 寫入快照檔
+
+    先寫入暫存檔再以 os.replace 取代，讀取端不會看到寫到一半的檔案。
+
+    Args:
+        data: 要保存的資料
+        path: 快照檔路徑
+    """
+    column_count = max([len(data.headers)] + [len(row) for row in data.rows])
+    row_count = len(data.rows)
+
+    # 依欄位編碼資料區塊
+    blocks = []
+    for column in range(column_count):
+        offsets = [0]
+        chunks = []
+        position = 0
+        for row in data.rows:
+            if column < len(row):
+                encoded = row[column].encode("utf-8")
+                chunks.append(encoded)
+                position += len(encoded)
+            offsets.append(position)
+        blocks.append(struct.pack(f"<{row_count + 1}I", *offsets) + b"".join(chunks))
+
+    header_bytes = b"".join(
+        _U32.pack(len(encoded)) + encoded
+        for encoded in (header.encode("utf-8") for header in data.headers)
+    )
+    row_lengths = struct.pack(f"<{row_count}I", *(len(row) for row in data.rows))
+
+    # 計算每個欄位區塊在檔案中的位置
+    offset = (
+        _PREAMBLE.size
+        + _INDEX_ENTRY.size * column_count
+        + len(header_bytes)
+        + len(row_lengths)
+    )
+    index = []
+    for block in blocks:
+        index.append(_INDEX_ENTRY.pack(offset, len(block)))
+        offset += len(block)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(
+            _PREAMBLE.pack(SNAPSHOT_MAGIC, column_count, row_count, len(data.headers))
+        )
+        f.write(b"".join(index))
+        f.write(header_bytes)
+        f.write(row_lengths)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, path)
+
+
+class Snapshot:
+    """以 mmap 開啟的唯讀快照"""
+
+    def __init__(self, path: str) -> None:
+        """
+        開啟快照檔並讀取表頭與索引
+
+        Args:
+            path: 快照檔路徑
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            # 空檔案無法 mmap，交由下方的格式檢查處理
+            size = os.fstat(f.fileno()).st_size
+            self._buffer: Optional[mmap.mmap] = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+
+        if self._buffer is None or size < _PREAMBLE.size:
+            self.close()
+            raise ValueError(f"{path} 不是有效的快照檔")
+
+        self.column_count: int
+        self.row_count: int
+        magic, self.column_count, self.row_count, header_count = _PREAMBLE.unpack_from(
+            self._buffer, 0
+        )
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} 不是有效的快照檔")
+
+        position = _PREAMBLE.size
+        # 每欄的 (區塊位移量, 區塊長度)
+        self._index: List[Tuple[int, int]] = [
+            _INDEX_ENTRY.unpack_from(self._buffer, position + i * _INDEX_ENTRY.size)
+            for i in range(self.column_count)
+        ]
+        position += _INDEX_ENTRY.size * self.column_count
+
+        self.headers: List[str] = []
+        for _ in range(header_count):
+            (length,) = _U32.unpack_from(self._buffer, position)
+            position += _U32.size
+            self.headers.append(
+                self._buffer[position : position + length].decode("utf-8")
+            )
+            position += length
+
+        self._row_lengths_offset = position
+        self._row_lengths: Optional[tuple] = None
+        self._column_offsets: dict = {}
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """關閉記憶體映射"""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    @property
+    def _mm(self) -> mmap.mmap:
+        if self._buffer is None:
+            raise ValueError("快照檔已關閉")
+        return self._buffer
+
+    @property
+    def row_lengths(self) -> tuple:
+        """每一行原本的儲存格數量"""
+        if self._row_lengths is None:
+            self._row_lengths = struct.unpack_from(
+                f"<{self.row_count}I", self._mm, self._row_lengths_offset
+            )
+        return self._row_lengths
+
+    def _offsets(self, column: int) -> tuple:
+        """讀取欄位區塊的位移量表（每欄只解碼一次）"""
+        offsets = self._column_offsets.get(column)
+        if offsets is None:
+            block_offset, _ = self._index[column]
+            offsets = struct.unpack_from(
+                f"<{self.row_count + 1}I", self._mm, block_offset
+            )
+            self._column_offsets[column] = offsets
+        return offsets
+
+    def _data_start(self, column: int) -> int:
+        block_offset, _ = self._index[column]
+        return block_offset + _U32.size * (self.row_count + 1)
+
+    def cell(self, row: int, column: int) -> str:
+        """
+        讀取單一儲存格
+
+        Args:
+            row: 資料行索引
+            column: 欄位索引
+
+        Returns:
+            儲存格內容
+        """
+        if not 0 <= row < self.row_count or not 0 <= column < self.column_count:
+            raise IndexError(f"儲存格 ({row}, {column}) 超出範圍")
+        offsets = self._offsets(column)
+        start = self._data_start(column)
+        return self._mm[start + offsets[row] : start + offsets[row + 1]].decode("utf-8")
+
+    def column(self, column: int) -> List[str]:
+        """
+        讀取整個欄位
+
+        Args:
+            column: 欄位索引
+
+        Returns:
+            欄位中每一行的內容
+        """
+        offsets = self._offsets(column)
+        start = self._data_start(column)
+        # 一次取出整個資料區，再依位移量切割
+        raw = self._mm[start : start + offsets[-1]]
+        return [
+            raw[offsets[i] : offsets[i + 1]].decode("utf-8")
+            for i in range(self.row_count)
+        ]
+
+    def to_sheet_data(self) -> SheetData:
+        """
+        將快照轉換為 SheetData
+
+        Returns:
+            SheetData: 包含表頭和資料的物件
+        """
+        columns = [self.column(i) for i in range(self.column_count)]
+        rows = [list(cells) for cells in zip(*columns, strict=True)] if columns else []
+        if not rows:
+            rows = [[] for _ in range(self.row_count)]
+
+        # 還原長度不一致的資料行
+        for row, length in zip(rows, self.row_lengths, strict=True):
+            if length < len(row):
+                del row[length:]
+
+        return SheetData(headers=list(self.headers), rows=rows)
+
+
+def load_snapshot(path: str) -> SheetData:
+    """
+    從快照檔載入 SheetData
+
+    Args:
+        path: 快照檔路徑
+
+    Returns:
+        SheetData: 包含表頭和資料的物件
+    """
+    with Snapshot(path) as snapshot:
+        return snapshot.to_sheet_data()
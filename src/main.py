@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 """
-主應用入口點 - 從Google Sheets讀取數據並產生靜態網站
+主應用入口點 - 從Google Sheets（或本機匯出檔）讀取數據並產生靜態網站
 """
 import argparse
 import os
+import signal
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Set
 
 # 確保項目根目錄在搜索路徑中
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -13,9 +18,67 @@ sys.path.insert(0, project_root)
 from dotenv import load_dotenv
 
 # 使用絕對導入，與測試代碼保持一致
-from src.application.html_generator import HtmlGenerator
+from src.application.build_daemon import BuildDaemon
+from src.application.exports import EXPORT_FORMATS, DataExporter
+from src.application.html_generator import SITE_TITLE, HtmlGenerator
+from src.application.image_variants import ImageVariantBuilder
+from src.application.multi_site import (
+    MultiSiteBuilder,
+    SiteConfig,
+    format_results,
+    load_site_configs,
+)
+from src.application.og_images import OgImageGenerator
+from src.application.perf_budget import (
+    check_budget,
+    format_report,
+    iter_output_files,
+    load_budget,
+    load_previous_metrics,
+    measure_output,
+    save_metrics,
+)
+from src.application.query_server import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_PAGE_SIZE,
+    QueryServer,
+    QueryViews,
+)
 from src.application.sheet_service import SheetService
-from src.domain.models import SheetData
+from src.application.watch_mode import run_watch
+from src.domain.dedupe import KEEP_EARLIEST, KEEP_POLICIES
+from src.domain.models import SheetData, map_important_indices
+from src.infrastructure.data_sources import (
+    FILE_SOURCE_KINDS,
+    DataSource,
+    GoogleSheetsDataSource,
+    create_data_source,
+)
+from src.infrastructure.history_store import HistoryStore
+from src.infrastructure.link_checker import LinkChecker, normalize_link
+from src.infrastructure.output_sink import create_output_sink, is_archive_path
+from src.infrastructure.snapshot import load_snapshot
+
+# 預設的快照檔路徑
+DEFAULT_SNAPSHOT_PATH = os.path.join(".cache", "sheet.snapshot")
+
+# 預設的歷史紀錄資料庫路徑
+DEFAULT_HISTORY_DB = os.path.join(".cache", "history.sqlite3")
+
+# 預設的訂閱源狀態檔路徑
+DEFAULT_FEED_STATE_PATH = os.path.join(".cache", "feed_state.json")
+
+# 預設的連結檢查快取檔路徑
+DEFAULT_LINK_CHECK_CACHE = os.path.join(".cache", "link_check.json")
+
+# 預設的 Open Graph 圖片快取目錄
+DEFAULT_OG_IMAGE_CACHE = os.path.join(".cache", "og")
+
+# 預設的圖片變體快取目錄
+DEFAULT_IMAGE_CACHE = os.path.join(".cache", "img")
+
+# 預設的效能量測紀錄檔路徑（用於和上次建置比較）
+DEFAULT_PERF_METRICS_PATH = os.path.join(".cache", "perf_metrics.json")
 
 
 def create_mock_data() -> SheetData:
@@ -75,6 +138,395 @@ def dry_run(output_dir: str) -> None:
     print("[DRY RUN] 測試通過!")
 
 
+def create_data_source_from_config(args: argparse.Namespace) -> DataSource:
+    """
+    依命令行參數與環境變數建立資料來源
+
+    Args:
+        args: 命令行參數
+
+    Returns:
+        DataSource: 設定的資料來源
+    """
+    # 命令行參數優先於環境變數
+    source_kind = (args.source or os.getenv("DATA_SOURCE", "sheets")).lower()
+
+    if source_kind == "sheets":
+        spreadsheet_id = os.getenv("SPREADSHEET_ID", "")
+        sheet_name = os.getenv("SHEET_NAME", "Sheet1")
+
+        # 檢查必要的環境變數
+        if not spreadsheet_id:
+            print("錯誤: 未設置 SPREADSHEET_ID 環境變數")
+            sys.exit(1)
+
+        sheet_service = SheetService(
+            snapshot_path=os.getenv("SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH),
+            api_base_url=os.getenv("SHEETS_API_BASE_URL") or None,
+        )
+        return GoogleSheetsDataSource(sheet_service, spreadsheet_id, sheet_name)
+
+    source_path = args.source_path or os.getenv("DATA_SOURCE_PATH", "")
+    try:
+        return create_data_source(
+            source_kind,
+            source_path,
+            sheet_name=os.getenv("XLSX_SHEET_NAME") or None,
+        )
+    except ValueError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+
+
+def record_history(data: SheetData) -> None:
+    """
+    將本次擷取的資料寫入歷史紀錄，並顯示與上次執行的差異
+
+    Args:
+        data: 本次擷取的資料
+    """
+    history_db = os.getenv("HISTORY_DB", DEFAULT_HISTORY_DB)
+    if not history_db:
+        return
+
+    with HistoryStore(history_db) as store:
+        previous_run = store.latest_run()
+        run_id = store.record_run(data, map_important_indices(data.headers))
+        if previous_run is None:
+            print(f"已建立歷史紀錄，共 {data.row_count} 筆資料")
+            return
+
+        diff = store.diff(previous_run, run_id)
+        print(
+            f"與上次執行相比：新增 {len(diff.added)} 筆、"
+            f"變更 {len(diff.changed)} 筆、移除 {len(diff.removed)} 筆"
+        )
+
+
+def get_duplicate_policy() -> Optional[str]:
+    """
+    取得合併重複投稿的保留規則
+
+    Returns:
+        "earliest"（預設）或 "latest"；DEDUPE_KEEP 設為 none 或空字串時為 None
+    """
+    policy = os.getenv("DEDUPE_KEEP", KEEP_EARLIEST).strip().lower()
+    if policy in ("", "none", "off"):
+        return None
+    if policy not in KEEP_POLICIES:
+        raise ValueError(f"DEDUPE_KEEP 必須是 {' 或 '.join(KEEP_POLICIES)}: {policy}")
+    return policy
+
+
+def og_images_enabled(args: argparse.Namespace) -> bool:
+    """是否產生 Open Graph 圖片（--og-images 或 OG_IMAGES=true）"""
+    return args.og_images or os.getenv("OG_IMAGES", "").lower() in ("1", "true")
+
+
+def create_og_image_generator() -> Optional[OgImageGenerator]:
+    """
+    依環境變數建立 Open Graph 圖片生成器
+
+    Returns:
+        OgImageGenerator，未安裝 Pillow 時為 None
+    """
+    if not OgImageGenerator.available():
+        print("未安裝 Pillow，略過 Open Graph 圖片")
+        return None
+    generator = OgImageGenerator(
+        SITE_TITLE,
+        cache_dir=os.getenv("OG_IMAGE_CACHE", DEFAULT_OG_IMAGE_CACHE) or None,
+        image_format=os.getenv("OG_IMAGE_FORMAT", "jpeg"),
+        font_path=os.getenv("OG_FONT") or None,
+    )
+    if generator.font_path is None:
+        print("找不到可顯示中文的字型，請以 OG_FONT 指定字型檔路徑")
+    return generator
+
+
+def create_image_variant_builder() -> Optional[ImageVariantBuilder]:
+    """
+    依環境變數建立圖片變體生成器
+
+    Returns:
+        ImageVariantBuilder，未安裝 Pillow 或 IMAGE_VARIANTS=false 時為 None
+    """
+    if os.getenv("IMAGE_VARIANTS", "").lower() in ("0", "false"):
+        return None
+    if not ImageVariantBuilder.available():
+        print("未安裝 Pillow（poetry install --extras images），靜態圖片將直接複製")
+        return None
+    return ImageVariantBuilder(
+        cache_dir=os.getenv("IMAGE_CACHE", DEFAULT_IMAGE_CACHE) or None
+    )
+
+
+def create_data_exporter() -> Optional[DataExporter]:
+    """
+    依環境變數建立資料匯出器
+
+    Returns:
+        DataExporter，EXPORT_FORMATS=none 時為 None
+    """
+    value = os.getenv("EXPORT_FORMATS", ",".join(EXPORT_FORMATS)).lower()
+    formats = [name.strip() for name in value.split(",") if name.strip()]
+    if not formats or formats in (["none"], ["off"]):
+        return None
+    compress = os.getenv("EXPORT_GZIP", "").lower() in ("1", "true")
+    return DataExporter(formats, compress=compress)
+
+
+def create_html_generator(args: argparse.Namespace) -> HtmlGenerator:
+    """
+    依命令行參數與環境變數建立產生網站用的 HtmlGenerator
+
+    Args:
+        args: 命令行參數
+
+    Returns:
+        HtmlGenerator
+    """
+    html_generator = HtmlGenerator(
+        feed_state_path=os.getenv("FEED_STATE_PATH", DEFAULT_FEED_STATE_PATH) or None
+    )
+    configure_html_generator(html_generator, og_images_enabled(args))
+    return html_generator
+
+
+def configure_html_generator(html_generator: HtmlGenerator, og_images: bool) -> None:
+    """
+    依環境變數設定 HtmlGenerator 的選用功能
+
+    Args:
+        html_generator: HTML 生成器
+        og_images: 是否產生 Open Graph 分享卡片
+    """
+    html_generator.duplicate_policy = get_duplicate_policy()
+    html_generator.image_variant_builder = create_image_variant_builder()
+    html_generator.data_exporter = create_data_exporter()
+    html_generator.render_workers = int(os.getenv("RENDER_WORKERS", "0")) or None
+    if og_images:
+        html_generator.og_image_generator = create_og_image_generator()
+
+
+def check_links(data: SheetData) -> Set[str]:
+    """
+    檢查作品連結，回傳確定失效的網址
+
+    Args:
+        data: 表格資料
+
+    Returns:
+        失效的網址集合
+    """
+    link_index = map_important_indices(data.headers)["link"]
+    if link_index < 0:
+        return set()
+
+    checker = LinkChecker(
+        cache_path=os.getenv("LINK_CHECK_CACHE", DEFAULT_LINK_CHECK_CACHE) or None,
+        ttl=float(os.getenv("LINK_CHECK_TTL", str(3 * 24 * 3600))),
+    )
+    results = checker.check(
+        normalize_link(row[link_index]) for row in data.rows if link_index < len(row)
+    )
+
+    broken = {url for url, result in results.items() if result.is_broken}
+    print(f"已檢查 {len(results)} 個連結，其中 {len(broken)} 個可能已失效")
+    for url in sorted(broken):
+        print(f"  失效連結: {url} ({results[url].http_status or results[url].error})")
+    return broken
+
+
+def load_watch_data(args: argparse.Namespace) -> SheetData:
+    """
+    取得監看模式使用的資料：優先使用快照，避免每次啟動都重新擷取
+
+    Args:
+        args: 命令行參數
+
+    Returns:
+        SheetData: 表格資料
+    """
+    if args.dry_run:
+        return create_mock_data()
+
+    snapshot_path = args.from_snapshot or os.getenv(
+        "SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH
+    )
+    if snapshot_path and os.path.exists(snapshot_path):
+        print(f"使用快照 {snapshot_path} 中的資料")
+        return load_snapshot(snapshot_path)
+
+    return create_data_source_from_config(args).load()
+
+
+def load_site_data(args: argparse.Namespace) -> SheetData:
+    """
+    依命令行參數從快照或資料來源取得資料
+
+    Args:
+        args: 命令行參數
+
+    Returns:
+        SheetData: 表格資料
+    """
+    if args.from_snapshot is not None:
+        # 從快照載入資料
+        snapshot_path = args.from_snapshot or os.getenv(
+            "SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH
+        )
+        if not os.path.exists(snapshot_path):
+            print(f"錯誤: 找不到快照檔 {snapshot_path}")
+            sys.exit(1)
+        return load_snapshot(snapshot_path)
+
+    # 依設定選擇資料來源，並從資料來源獲取資料
+    data = create_data_source_from_config(args).load()
+    record_history(data)
+    return data
+
+
+def run_multi_site(args: argparse.Namespace, config_path: str) -> None:
+    """
+    依設定檔建置多個網站：只授權一次，同時擷取資料並以多個行程產生網站
+
+    Args:
+        args: 命令行參數
+        config_path: 多網站設定檔路徑
+    """
+    try:
+        sites = load_site_configs(config_path)
+    except (OSError, ValueError) as e:
+        print(f"錯誤: 無法讀取多網站設定檔 {config_path}: {e}")
+        sys.exit(1)
+
+    # 所有 Google Sheets 網站共用同一次授權
+    sheet_service = (
+        SheetService(api_base_url=os.getenv("SHEETS_API_BASE_URL") or None)
+        if any(site.source == "sheets" for site in sites)
+        else None
+    )
+
+    def create_source(site: SiteConfig) -> DataSource:
+        if site.source == "sheets" and sheet_service is not None:
+            return GoogleSheetsDataSource(
+                sheet_service, site.spreadsheet_id, site.sheet_name
+            )
+        return create_data_source(
+            site.source, site.source_path, sheet_name=os.getenv("XLSX_SHEET_NAME")
+        )
+
+    builder = MultiSiteBuilder(
+        sites,
+        create_source,
+        configure=partial(configure_html_generator, og_images=og_images_enabled(args)),
+        max_workers=int(os.getenv("SITES_WORKERS", "0")) or None,
+    )
+    started = time.perf_counter()
+    results = builder.build()
+
+    print(format_results(results))
+    print(
+        f"已建置 {sum(result.ok for result in results)}/{len(results)} 個網站"
+        f"（共 {(time.perf_counter() - started) * 1000:.0f} ms）"
+    )
+    if not all(result.ok for result in results):
+        sys.exit(1)
+
+
+def run_daemon(args: argparse.Namespace, output_dir: str) -> None:
+    """
+    以常駐模式執行：持續輪詢資料來源，資料變更時重新產生網站
+
+    Args:
+        args: 命令行參數
+        output_dir: 輸出目錄
+    """
+    daemon = BuildDaemon(
+        create_data_source_from_config(args),
+        create_html_generator(args),
+        output_dir,
+        interval=float(os.getenv("DAEMON_INTERVAL", "60")),
+        max_interval=float(os.getenv("DAEMON_MAX_INTERVAL", "600")),
+        on_change=record_history,
+    )
+
+    # 收到終止訊號時在目前的輪詢結束後停止
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+
+    print(f"常駐模式已啟動，輸出目錄：{output_dir}（按 Ctrl+C 結束）")
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        daemon.stop()
+
+
+def run_query_server(args: argparse.Namespace, output_dir: str) -> None:
+    """
+    產生網站後啟動查詢伺服器：首頁依查詢條件在伺服器端篩選與分頁，其他檔案由輸出目錄提供
+
+    Args:
+        args: 命令行參數
+        output_dir: 輸出目錄
+    """
+    html_generator = create_html_generator(args)
+    # 首頁內容依查詢條件而不同，不使用 service worker 預先快取
+    html_generator.service_worker = False
+    data = create_mock_data() if args.dry_run else load_site_data(args)
+    html_generator.generate_site(data, output_dir)
+
+    views = QueryViews(
+        html_generator,
+        page_size=int(os.getenv("QUERY_PAGE_SIZE", str(DEFAULT_PAGE_SIZE))),
+        cache_size=int(os.getenv("QUERY_CACHE_SIZE", str(DEFAULT_CACHE_SIZE))),
+    )
+    views.update(data)
+    server = QueryServer(views, output_dir, host=args.host, port=args.port)
+
+    print(f"查詢伺服器已啟動：{server.url}（按 Ctrl+C 結束）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+def budget_warn_only(args: argparse.Namespace) -> bool:
+    """超過預算時是否只顯示報告（--budget-warn-only 或 PERF_BUDGET_WARN_ONLY=true）"""
+    warn_only = os.getenv("PERF_BUDGET_WARN_ONLY", "").lower() in ("1", "true")
+    return args.budget_warn_only or warn_only
+
+
+def check_perf_budget(
+    output_dir: str, budget_path: str, warn_only: bool = False
+) -> None:
+    """
+    量測產生的網站並與效能預算比較，超過預算時以非零狀態結束
+
+    Args:
+        output_dir: 輸出目錄或封存檔路徑
+        budget_path: 效能預算設定檔路徑
+        warn_only: 超過預算時只列出報告，不以非零狀態結束
+    """
+    try:
+        budget = load_budget(budget_path)
+    except (OSError, ValueError) as e:
+        print(f"錯誤: 無法讀取效能預算設定檔 {budget_path}: {e}")
+        sys.exit(1)
+
+    metrics = measure_output(iter_output_files(output_dir))
+    metrics_path = os.getenv("PERF_METRICS_PATH", DEFAULT_PERF_METRICS_PATH)
+    previous = load_previous_metrics(metrics_path) if metrics_path else None
+    violations = check_budget(metrics, budget, previous)
+    print(format_report(metrics, violations))
+    if metrics_path:
+        save_metrics(metrics_path, metrics)
+    if violations and not warn_only:
+        sys.exit(1)
+
+
 def main() -> None:
     """主函數：讀取資料並產生靜態網站"""
     parser = argparse.ArgumentParser(
@@ -83,7 +535,77 @@ def main() -> None:
     parser.add_argument(
         "--dry-run", action="store_true", help="使用模擬數據運行，不需真實憑證"
     )
-    parser.add_argument("--output-dir", default=None, help="指定輸出目錄")
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="指定輸出目錄，路徑為 .zip、.tar、.tar.gz 或 .tgz 時輸出為封存檔",
+    )
+    parser.add_argument(
+        "--source",
+        choices=("sheets",) + FILE_SOURCE_KINDS,
+        default=None,
+        help="資料來源類型 (預設讀取 DATA_SOURCE 環境變數，否則為 sheets)",
+    )
+    parser.add_argument(
+        "--source-path",
+        default=None,
+        help="本機匯出檔路徑 (csv/ndjson/xlsx 來源使用)",
+    )
+    parser.add_argument(
+        "--from-snapshot",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="從上次擷取保存的快照重新產生網站，不連線 Google Sheets",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="監看模板與靜態資源，變更時增量重建並即時重新載入瀏覽器",
+    )
+    parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="檢查作品連結並在頁面上標示失效的連結 (也可設定 LINK_CHECK=true)",
+    )
+    parser.add_argument(
+        "--og-images",
+        action="store_true",
+        help="為每件作品產生分享卡片圖片 (需要 Pillow，也可設定 OG_IMAGES=true)",
+    )
+    parser.add_argument(
+        "--sites",
+        metavar="CONFIG",
+        help="依 TOML 設定檔在同一個程序中建置多個網站",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="常駐執行，定期檢查資料來源並在資料變更時重新產生網站",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="產生網站後啟動查詢伺服器，首頁的篩選、搜尋與分頁在伺服器端處理",
+    )
+    parser.add_argument(
+        "--budget",
+        metavar="PATH",
+        default=None,
+        help="產生網站後檢查效能預算，超過預算時以非零狀態結束 (也可設定 PERF_BUDGET)",
+    )
+    parser.add_argument(
+        "--budget-warn-only",
+        action="store_true",
+        help="超過效能預算時只顯示報告，不中止建置 (也可設定 PERF_BUDGET_WARN_ONLY)",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="開發伺服器與查詢伺服器的監聽位址"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="開發伺服器與查詢伺服器的埠號"
+    )
     args = parser.parse_args()
 
     # 載入環境變數
@@ -91,32 +613,67 @@ def main() -> None:
 
     # 確定輸出目錄 (命令行參數優先於環境變數)
     output_dir = args.output_dir or os.getenv("OUTPUT_DIR", "dist")
+    if is_archive_path(output_dir) and (
+        args.watch or args.daemon or args.serve or args.dry_run
+    ):
+        parser.error(
+            "監看模式、常駐模式、查詢伺服器與 --dry-run 需要輸出目錄，不能輸出為封存檔"
+        )
+
+    if args.watch:
+        run_watch(
+            HtmlGenerator(duplicate_policy=get_duplicate_policy()),
+            load_watch_data(args),
+            output_dir,
+            host=args.host,
+            port=args.port,
+        )
+        return
+
+    if args.sites:
+        run_multi_site(args, args.sites)
+        return
+
+    if args.daemon:
+        run_daemon(args, output_dir)
+        return
+
+    if args.serve:
+        run_query_server(args, output_dir)
+        return
+
+    budget_path = args.budget or os.getenv("PERF_BUDGET", "")
 
     if args.dry_run:
         dry_run(output_dir)
+        if budget_path:
+            check_perf_budget(output_dir, budget_path, budget_warn_only(args))
         return
 
-    # 取得環境變數
-    spreadsheet_id = os.getenv("SPREADSHEET_ID", "")
-    sheet_name = os.getenv("SHEET_NAME", "Sheet1")
+    # 產生HTML檔案
+    html_generator = create_html_generator(args)
 
-    # 檢查必要的環境變數
-    if not spreadsheet_id:
-        print("錯誤: 未設置 SPREADSHEET_ID 環境變數")
-        sys.exit(1)
+    # 輸出為封存檔時所有檔案依序寫入同一個檔案，成功後才取代舊的封存檔
+    with create_output_sink(output_dir) as sink:
+        # 與資料無關的準備工作（模板編譯、靜態資源複製）和資料擷取同時進行
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            preparing = executor.submit(html_generator.prepare_output, sink)
+            data = load_site_data(args)
+            preparing.result()
 
-    # 確保輸出目錄存在
-    os.makedirs(output_dir, exist_ok=True)
+        # 先合併重複投稿，重複的連結不會被再次檢查與渲染
+        data = html_generator.remove_duplicates(data)
 
-    # 從Google Sheets獲取資料
-    sheet_service = SheetService()
-    data = sheet_service.get_sheet_data(spreadsheet_id, sheet_name)
+        # 選用的連結檢查
+        if args.check_links or os.getenv("LINK_CHECK", "").lower() in ("1", "true"):
+            html_generator.broken_links = check_links(data)
 
-    # 產生HTML檔案
-    html_generator = HtmlGenerator()
-    html_generator.generate_site(data, output_dir)
+        html_generator.generate_site(data, sink, deduplicated=True)
+
+    print(f"網站已成功產生在 {output_dir} 中")
 
-    print(f"網站已成功產生在 {output_dir} 目錄中")
+    if budget_path:
+        check_perf_budget(output_dir, budget_path, budget_warn_only(args))
 
 
 if __name__ == "__main__":
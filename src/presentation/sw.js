@@ -0,0 +1,135 @@
+/*
+ * Service worker - 由 HtmlGenerator 在建置時填入設定後輸出為 sw.js
+ *
+ * 預先快取清單中的每個項目以「網址 + 內容雜湊值」作為快取鍵。網站重新建置後
+ * VERSION 改變，瀏覽器會安裝新的 service worker；安裝時只下載雜湊值改變的檔案，
+ * 其餘沿用舊的快取。CDN 上帶有版本號的函式庫在第一次使用後快取。
+ */
+const CONFIG = __SERVICE_WORKER_CONFIG__;
+
+const VERSION = CONFIG.version;
+const PRECACHE = 'precache';
+const RUNTIME = 'cdn';
+const MANIFEST_URL = new URL(CONFIG.manifest + '?v=' + VERSION, self.registration.scope).href;
+const INDEX_URL = new URL(CONFIG.index, self.registration.scope).href;
+
+// 取得項目的快取鍵：內容不變時快取鍵也不變
+function cacheKey(entry) {
+    const url = new URL(entry.url, self.registration.scope);
+    url.searchParams.set('__rev', entry.revision);
+    return url.href;
+}
+
+// 網址 -> 快取鍵，service worker 重新啟動後從快取的清單重建
+let lookup = null;
+
+function buildLookup(manifest) {
+    const map = new Map();
+    for (const entry of manifest.entries) {
+        map.set(new URL(entry.url, self.registration.scope).href, cacheKey(entry));
+    }
+    // 網站根目錄與 index.html 是同一個頁面
+    if (map.has(INDEX_URL)) {
+        map.set(self.registration.scope, map.get(INDEX_URL));
+    }
+    return map;
+}
+
+async function getLookup() {
+    if (!lookup) {
+        const cache = await caches.open(PRECACHE);
+        const response = await cache.match(MANIFEST_URL);
+        lookup = buildLookup(response ? await response.json() : { entries: [] });
+    }
+    return lookup;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error('無法下載預先快取清單: ' + response.status);
+        }
+        const manifest = await response.clone().json();
+        const cache = await caches.open(PRECACHE);
+
+        await Promise.all(manifest.entries.map(async entry => {
+            const key = cacheKey(entry);
+            // 內容沒有變更，沿用舊的快取
+            if (await cache.match(key)) {
+                return;
+            }
+            const url = new URL(entry.url, self.registration.scope).href;
+            const fresh = await fetch(url, { cache: 'no-cache' });
+            if (!fresh.ok) {
+                throw new Error('無法下載 ' + entry.url + ': ' + fresh.status);
+            }
+            await cache.put(key, fresh);
+        }));
+        await cache.put(MANIFEST_URL, response);
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        // 移除不在目前清單中的舊版本
+        const cache = await caches.open(PRECACHE);
+        const current = await getLookup();
+        const keep = new Set(current.values());
+        keep.add(MANIFEST_URL);
+        for (const request of await cache.keys()) {
+            if (!keep.has(request.url)) {
+                await cache.delete(request);
+            }
+        }
+        for (const name of await caches.keys()) {
+            if (name !== PRECACHE && name !== RUNTIME) {
+                await caches.delete(name);
+            }
+        }
+        await self.clients.claim();
+    })());
+});
+
+// CDN 上的網址帶有版本號，內容不會改變，優先使用快取
+async function cacheFirst(request) {
+    const cache = await caches.open(RUNTIME);
+    const cached = await cache.match(request);
+    if (cached) {
+        return cached;
+    }
+    const response = await fetch(request);
+    if (response.ok || response.type === 'opaque') {
+        await cache.put(request, response.clone());
+    }
+    return response;
+}
+
+async function precacheFirst(request, href) {
+    const key = (await getLookup()).get(href);
+    if (key) {
+        const cached = await caches.match(key);
+        if (cached) {
+            return cached;
+        }
+    }
+    return fetch(request);
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+    const url = new URL(request.url);
+    if (CONFIG.cdn_origins.includes(url.origin)) {
+        event.respondWith(cacheFirst(request));
+        return;
+    }
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+    url.hash = '';
+    event.respondWith(precacheFirst(request, url.href));
+});
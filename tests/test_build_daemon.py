@@ -0,0 +1,171 @@
+"""
+建置常駐程式單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.application.build_daemon import BuildDaemon, swap_directory
+from src.domain.models import SheetData
+
+
+class TestBuildDaemon(unittest.TestCase):
+    """BuildDaemon 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, "dist")
+        self.data = SheetData(headers=["作者名"], rows=[["測試作者1"]])
+
+        self.source = MagicMock()
+        self.source.change_token.return_value = "v1"
+        self.source.load.return_value = self.data
+
+        self.generator = MagicMock()
+        self.generator.generate_site.side_effect = self._fake_generate
+        self.on_change = MagicMock()
+
+        self.daemon = BuildDaemon(
+            self.source,
+            self.generator,
+            self.output_dir,
+            interval=10,
+            max_interval=60,
+            on_change=self.on_change,
+        )
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _fake_generate(data, output_dir):
+        os.makedirs(output_dir)
+        with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
+            f.write(data.rows[0][0])
+
+    def _read_index(self):
+        with open(os.path.join(self.output_dir, "index.html"), encoding="utf-8") as f:
+            return f.read()
+
+    def test_rebuild_only_on_change(self):
+        """測試只有版本標記與內容改變時才重新產生網站"""
+        self.assertTrue(self.daemon.poll_once())
+        self.assertTrue(os.path.islink(self.output_dir))
+        self.assertEqual(self._read_index(), "測試作者1")
+        self.on_change.assert_called_once_with(self.data)
+
+        # 版本標記相同時不會擷取資料
+        self.assertFalse(self.daemon.poll_once())
+        self.source.load.assert_called_once()
+
+        # 版本標記改變但內容相同時不會重新產生
+        self.source.change_token.return_value = "v2"
+        self.source.load.return_value = SheetData(
+            headers=["作者名"], rows=[["測試作者1"]]
+        )
+        self.assertFalse(self.daemon.poll_once())
+        self.assertEqual(self.generator.generate_site.call_count, 1)
+
+        # 內容改變時重新產生並切換輸出目錄
+        self.source.change_token.return_value = "v3"
+        self.source.load.return_value = SheetData(
+            headers=["作者名"], rows=[["測試作者2"]]
+        )
+        self.assertTrue(self.daemon.poll_once())
+        self.assertEqual(self._read_index(), "測試作者2")
+
+    def test_retry_failed_build(self):
+        """測試建置失敗後，版本標記相同時仍會在下次輪詢重試"""
+        self.generator.generate_site.side_effect = self._fail_once()
+
+        with self.assertRaises(RuntimeError):
+            self.daemon.poll_once()
+        # 發布失敗時不通知資料變更，重試成功後只通知一次
+        self.on_change.assert_not_called()
+        self.assertTrue(self.daemon.poll_once())
+        self.assertEqual(self._read_index(), "測試作者1")
+        self.assertFalse(self.daemon.poll_once())
+        self.on_change.assert_called_once_with(self.data)
+
+    def _fail_once(self):
+        calls = []
+
+        def generate(data, output_dir):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("建置失敗")
+            self._fake_generate(data, output_dir)
+
+        return generate
+
+    def test_source_without_change_token(self):
+        """測試不支援版本標記的資料來源以內容雜湊判斷"""
+        self.source.change_token.return_value = None
+
+        self.assertTrue(self.daemon.poll_once())
+        self.assertFalse(self.daemon.poll_once())
+        self.assertEqual(self.source.load.call_count, 2)
+
+    def test_keep_recent_builds(self):
+        """測試只保留最近的建置目錄"""
+        for i in range(4):
+            self.source.change_token.return_value = f"v{i}"
+            self.source.load.return_value = SheetData(
+                headers=["作者名"], rows=[[f"測試作者{i}"]]
+            )
+            self.daemon.poll_once()
+
+        self.assertEqual(len(os.listdir(self.daemon.builds_dir)), 2)
+        self.assertEqual(self._read_index(), "測試作者3")
+
+    def test_adaptive_backoff(self):
+        """測試沒有變更時加倍輪詢間隔，有變更時回到基本間隔"""
+        self.assertEqual(self.daemon.next_interval(10, changed=False), 20)
+        self.assertEqual(self.daemon.next_interval(40, changed=False), 60)
+        self.assertEqual(self.daemon.next_interval(60, changed=True), 10)
+
+    def test_run_until_stopped(self):
+        """測試 run 在輪詢失敗後繼續，直到呼叫 stop"""
+        daemon = BuildDaemon(
+            self.source, self.generator, self.output_dir, interval=0, max_interval=0
+        )
+        calls = []
+
+        def load():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ConnectionError("暫時無法連線")
+            daemon.stop()
+            return self.data
+
+        self.source.change_token.return_value = None
+        self.source.load.side_effect = load
+        daemon.run()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self._read_index(), "測試作者1")
+
+
+class TestSwapDirectory(unittest.TestCase):
+    """swap_directory 單元測試類"""
+
+    def test_replace_existing_directory(self):
+        """測試輸出目錄原本是一般目錄時替換為符號連結"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        output_dir = os.path.join(temp_dir, "dist")
+        build_dir = os.path.join(temp_dir, "builds", "1")
+        os.makedirs(output_dir)
+        os.makedirs(build_dir)
+
+        swap_directory(build_dir, output_dir)
+
+        self.assertTrue(os.path.islink(output_dir))
+        self.assertEqual(os.path.realpath(output_dir), os.path.realpath(build_dir))
+        # 舊目錄在連結就位後移除
+        self.assertEqual(sorted(os.listdir(temp_dir)), ["builds", "dist"])
@@ -0,0 +1,235 @@
+"""
+資料來源單元測試
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import MagicMock
+
+from src.domain.models import SheetData
+from src.infrastructure.data_sources import (
+    CsvDataSource,
+    GoogleSheetsDataSource,
+    NdjsonDataSource,
+    XlsxDataSource,
+    create_data_source,
+)
+
+_WORKBOOK = """<?xml version="1.0" encoding="UTF-8"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+ xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets>
+<sheet name="說明" sheetId="1" r:id="rId2"/>
+<sheet name="表單回應 1" sheetId="2" r:id="rId1"/>
+</sheets>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="worksheet" Target="/xl/worksheets/sheet2.xml"/>
+</Relationships>"""
+
+_SHARED_STRINGS = """<?xml version="1.0" encoding="UTF-8"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<si><t>時間戳記</t></si>
+<si><t>作者名</t></si>
+<si><t>作品連結</t></si>
+<si><r><t>測試</t></r><r><t>作者1</t></r></si>
+<si><t>https://example.com/1</t></si>
+</sst>"""
+
+_STYLES = """<?xml version="1.0" encoding="UTF-8"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy/m/d h:mm:ss"/></numFmts>
+<cellXfs count="2"><xf numFmtId="0"/><xf numFmtId="164"/></cellXfs>
+</styleSheet>"""
+
+_SHEET1 = """<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<sheetData>
+<row r="1">
+<c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c>
+<c r="D1" t="inlineStr"><is><t>字數</t></is></c>
+</row>
+<row r="2">
+<c r="A2" s="1"><v>45046.4375</v></c><c r="B2" t="s"><v>3</v></c>
+<c r="C2" t="s"><v>4</v></c><c r="D2"><v>1200</v></c>
+</row>
+<row r="4">
+<c r="B4" t="inlineStr"><is><t>測試作者2</t></is></c>
+</row>
+</sheetData>
+</worksheet>"""
+
+_SHEET2 = """<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<sheetData><row r="1"><c r="A1" t="inlineStr"><is><t>說明</t></is></c></row></sheetData>
+</worksheet>"""
+
+
+class TestFileDataSources(unittest.TestCase):
+    """本機檔案資料來源單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name: str, content: str, encoding: str = "utf-8") -> str:
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w", encoding=encoding, newline="") as f:
+            f.write(content)
+        return path
+
+    def _write_xlsx(self) -> str:
+        path = os.path.join(self.temp_dir, "export.xlsx")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("xl/workbook.xml", _WORKBOOK)
+            archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+            archive.writestr("xl/sharedStrings.xml", _SHARED_STRINGS)
+            archive.writestr("xl/styles.xml", _STYLES)
+            archive.writestr("xl/worksheets/sheet1.xml", _SHEET1)
+            archive.writestr("xl/worksheets/sheet2.xml", _SHEET2)
+        return path
+
+    def test_csv_source(self):
+        """測試讀取 CSV 檔案"""
+        path = self._write(
+            "export.csv",
+            "﻿時間戳記,作者名,作品連結\n"
+            '2023/4/30 上午 10:30:45,測試作者1,"https://example.com/1?a=1,2"\n'
+            "\n"
+            "2023/5/1 下午 02:45:12,測試作者2\n",
+        )
+
+        data = CsvDataSource(path).load()
+
+        self.assertEqual(data.headers, ["時間戳記", "作者名", "作品連結"])
+        self.assertEqual(data.row_count, 2)
+        self.assertEqual(data.rows[0][2], "https://example.com/1?a=1,2")
+        # 較短的行會補齊寬度
+        self.assertEqual(data.rows[1], ["2023/5/1 下午 02:45:12", "測試作者2", ""])
+
+    def test_file_change_token(self):
+        """測試檔案內容改變時版本標記隨之改變"""
+        path = self._write("export.csv", "作者名\n測試作者1\n")
+        source = CsvDataSource(path)
+        token = source.change_token()
+
+        self.assertEqual(source.change_token(), token)
+        self._write("export.csv", "作者名\n測試作者1\n測試作者2\n")
+        self.assertNotEqual(source.change_token(), token)
+
+    def test_ndjson_source_objects(self):
+        """測試讀取物件格式的 NDJSON 檔案"""
+        lines = [
+            {"作者名": "測試作者1", "作品連結": "https://example.com/1"},
+            {"作品連結": "https://example.com/2", "作者名": None},
+        ]
+        path = self._write(
+            "export.ndjson",
+            "\n".join(json.dumps(line, ensure_ascii=False) for line in lines) + "\n",
+        )
+
+        data = NdjsonDataSource(path).load()
+
+        self.assertEqual(data.headers, ["作者名", "作品連結"])
+        self.assertEqual(
+            data.rows,
+            [["測試作者1", "https://example.com/1"], ["", "https://example.com/2"]],
+        )
+
+    def test_ndjson_source_arrays(self):
+        """測試讀取陣列格式的 NDJSON 檔案"""
+        path = self._write("export.ndjson", '["作者名", "字數"]\n["測試作者1", 1200]\n')
+
+        data = NdjsonDataSource(path).load()
+
+        self.assertEqual(data.headers, ["作者名", "字數"])
+        self.assertEqual(data.rows, [["測試作者1", "1200"]])
+
+    def test_ndjson_source_invalid(self):
+        """測試 NDJSON 格式錯誤"""
+        path = self._write("export.ndjson", '{"作者名": "a"}\n{"新欄位": "b"}\n')
+        with self.assertRaises(ValueError):
+            NdjsonDataSource(path).load()
+
+        path = self._write("broken.ndjson", "{not json}\n")
+        with self.assertRaises(ValueError):
+            NdjsonDataSource(path).load()
+
+    def test_xlsx_source(self):
+        """測試讀取 XLSX 檔案"""
+        path = self._write_xlsx()
+
+        data = XlsxDataSource(path, sheet_name="表單回應 1").load()
+
+        self.assertEqual(data.headers, ["時間戳記", "作者名", "作品連結", "字數"])
+        self.assertEqual(
+            data.rows,
+            [
+                ["2023-04-30 10:30:00", "測試作者1", "https://example.com/1", "1200"],
+                ["", "測試作者2", "", ""],
+            ],
+        )
+
+    def test_xlsx_source_default_sheet(self):
+        """測試未指定工作表時讀取第一個工作表"""
+        path = self._write_xlsx()
+
+        data = XlsxDataSource(path).load()
+
+        self.assertEqual(data.headers, ["說明"])
+        self.assertEqual(data.rows, [])
+
+    def test_xlsx_source_missing_sheet(self):
+        """測試指定不存在的工作表"""
+        path = self._write_xlsx()
+        with self.assertRaises(ValueError):
+            XlsxDataSource(path, sheet_name="Sheet1").load()
+
+    def test_create_data_source(self):
+        """測試依設定建立資料來源"""
+        self.assertIsInstance(create_data_source("CSV", "a.csv"), CsvDataSource)
+        self.assertIsInstance(
+            create_data_source("ndjson", "a.ndjson"), NdjsonDataSource
+        )
+        self.assertIsInstance(create_data_source("xlsx", "a.xlsx"), XlsxDataSource)
+
+        with self.assertRaises(ValueError):
+            create_data_source("parquet", "a.parquet")
+        with self.assertRaises(ValueError):
+            create_data_source("csv", "")
+
+
+class TestGoogleSheetsDataSource(unittest.TestCase):
+    """Google Sheets 資料來源單元測試類"""
+
+    def test_load(self):
+        """測試透過 SheetService 讀取資料"""
+        expected = SheetData(headers=["標題"], rows=[["測試標題1"]])
+        service = MagicMock()
+        service.get_sheet_data.return_value = expected
+
+        source = GoogleSheetsDataSource(service, "test_spreadsheet_id", "Sheet1")
+
+        self.assertIs(source.load(), expected)
+        service.get_sheet_data.assert_called_once_with("test_spreadsheet_id", "Sheet1")
+
+    def test_change_token(self):
+        """測試以試算表的最後修改時間作為版本標記"""
+        service = MagicMock()
+        service.get_last_updated.return_value = "2023-05-02T01:15:30.000Z"
+
+        source = GoogleSheetsDataSource(service, "test_spreadsheet_id", "Sheet1")
+
+        self.assertEqual(source.change_token(), "2023-05-02T01:15:30.000Z")
+        service.get_last_updated.assert_called_once_with("test_spreadsheet_id")
@@ -0,0 +1,125 @@
+"""
+重複投稿合併單元測試
+"""
+
+import unittest
+
+from src.domain.dedupe import canonical_url, dedupe_submissions
+from src.domain.models import SheetData
+
+
+class TestCanonicalUrl(unittest.TestCase):
+    """canonical_url 單元測試類"""
+
+    def test_variants(self):
+        """測試同一網址的各種寫法得到相同的標準網址"""
+        expected = "https://example.com/works/1"
+        for value in [
+            "https://example.com/works/1",
+            "http://example.com/works/1/",
+            "HTTPS://Example.COM:443/works/1",
+            " example.com/works/1 ",
+            "https://example.com/works/1?utm_source=fb&fbclid=abc",
+            "https://example.com/works/1#",
+        ]:
+            self.assertEqual(canonical_url(value), expected, value)
+
+    def test_query(self):
+        """測試保留內容參數並排序"""
+        self.assertEqual(
+            canonical_url("https://example.com/p?b=2&utm_medium=x&a=1"),
+            "https://example.com/p?a=1&b=2",
+        )
+        self.assertEqual(
+            canonical_url("https://docs.google.com/document/d/x/edit?usp=sharing"),
+            "https://docs.google.com/document/d/x/edit",
+        )
+        self.assertNotEqual(
+            canonical_url("https://example.com/p?id=1"),
+            canonical_url("https://example.com/p?id=2"),
+        )
+
+    def test_keeps_distinct_urls(self):
+        """測試不同的路徑、連接埠與大小寫敏感的路徑不會被合併"""
+        self.assertNotEqual(
+            canonical_url("https://example.com/A"),
+            canonical_url("https://example.com/a"),
+        )
+        self.assertEqual(
+            canonical_url("http://example.com:8080/"), "https://example.com:8080"
+        )
+        self.assertEqual(canonical_url(""), "")
+
+    def test_keeps_fragment(self):
+        """測試只差在片段的網址（雜湊路由、錨點）不會被合併"""
+        self.assertEqual(
+            canonical_url("http://example.com/post/?utm_source=fb#part-2"),
+            "https://example.com/post#part-2",
+        )
+        self.assertNotEqual(
+            canonical_url("https://example.com/#/works/1"),
+            canonical_url("https://example.com/#/works/2"),
+        )
+        self.assertEqual(canonical_url("not a url"), "not a url")
+
+
+class TestDedupeSubmissions(unittest.TestCase):
+    """dedupe_submissions 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.data = SheetData(
+            headers=["時間戳記", "作品連結"],
+            rows=[
+                ["2024/5/2 上午 10:00:00", "https://example.com/1"],
+                ["2024/5/1 上午 10:00:00", "http://example.com/1/?utm_source=x"],
+                ["2024/5/3 上午 10:00:00", "https://example.com/2"],
+                ["2024/5/4 上午 10:00:00", ""],
+                ["2024/5/5 上午 10:00:00", "example.com/1"],
+                ["2024/5/6 上午 10:00:00", ""],
+            ],
+        )
+
+    def test_keep_earliest(self):
+        """測試保留時間最早的投稿並維持原本順序"""
+        result = dedupe_submissions(self.data, 1, 0, keep="earliest")
+        self.assertEqual(
+            result.rows,
+            [
+                self.data.rows[1],
+                self.data.rows[2],
+                self.data.rows[3],
+                self.data.rows[5],
+            ],
+        )
+
+    def test_keep_latest(self):
+        """測試保留時間最晚的投稿"""
+        result = dedupe_submissions(self.data, 1, 0, keep="latest")
+        self.assertEqual(
+            result.rows,
+            [
+                self.data.rows[2],
+                self.data.rows[3],
+                self.data.rows[4],
+                self.data.rows[5],
+            ],
+        )
+
+    def test_without_timestamps(self):
+        """測試沒有時間戳記時依資料行順序保留"""
+        earliest = dedupe_submissions(self.data, 1, keep="earliest")
+        self.assertEqual(earliest.rows[0], self.data.rows[0])
+        latest = dedupe_submissions(self.data, 1, keep="latest")
+        self.assertEqual(latest.rows[2], self.data.rows[4])
+
+    def test_no_duplicates(self):
+        """測試沒有重複或沒有連結欄位時回傳原資料"""
+        data = SheetData(headers=["作品連結"], rows=[["a.com"], ["b.com"]])
+        self.assertIs(dedupe_submissions(data, 0), data)
+        self.assertIs(dedupe_submissions(self.data, -1), self.data)
+
+    def test_invalid_policy(self):
+        """測試不支援的保留規則"""
+        with self.assertRaises(ValueError):
+            dedupe_submissions(self.data, 1, keep="random")
@@ -0,0 +1,100 @@
+"""
+開發伺服器單元測試
+"""
+
+import gzip
+import http.client
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.infrastructure.dev_server import LIVE_RELOAD_PATH, DevServer
+
+
+class TestDevServer(unittest.TestCase):
+    """DevServer 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.html = "<html><body>" + "測試內容" * 200 + "</body></html>"
+        with open(
+            os.path.join(self.temp_dir, "index.html"), "w", encoding="utf-8"
+        ) as f:
+            f.write(self.html)
+        self.server = DevServer(self.temp_dir, port=0)
+        self.server.start()
+        self.port = self.server.httpd.server_address[1]
+
+    def tearDown(self):
+        """清理測試環境"""
+        self.server.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _request(self, path, headers=None):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        conn.request("GET", path, headers=headers or {})
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        return response, body
+
+    def test_serve_html_with_live_reload(self):
+        """測試提供 HTML 並注入即時重新載入腳本"""
+        response, body = self._request("/")
+
+        self.assertEqual(response.status, 200)
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        text = body.decode("utf-8")
+        self.assertIn("測試內容", text)
+        self.assertIn(LIVE_RELOAD_PATH, text)
+        self.assertTrue(text.endswith("</script></body></html>"))
+
+    def test_gzip(self):
+        """測試支援 gzip 時壓縮回應"""
+        response, body = self._request("/index.html", {"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertIn("測試內容", gzip.decompress(body).decode("utf-8"))
+
+    def test_etag_not_modified(self):
+        """測試 If-None-Match 符合時回傳 304"""
+        response, _ = self._request("/index.html")
+        etag = response.getheader("ETag")
+
+        response, body = self._request("/index.html", {"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+        # 檔案變更後 ETag 隨之改變
+        with open(
+            os.path.join(self.temp_dir, "index.html"), "w", encoding="utf-8"
+        ) as f:
+            f.write(self.html + "\n")
+        response, _ = self._request("/index.html", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+        self.assertNotEqual(response.getheader("ETag"), etag)
+
+    def test_not_found(self):
+        """測試不存在的檔案回傳 404"""
+        response, _ = self._request("/missing.html")
+        self.assertEqual(response.status, 404)
+
+    def test_reload_event(self):
+        """測試透過 Server-Sent Events 推送重新載入事件"""
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        conn.request("GET", LIVE_RELOAD_PATH)
+        response = conn.getresponse()
+        self.assertEqual(response.getheader("Content-Type"), "text/event-stream")
+
+        # 等待連線開始等候事件後再通知
+        timer = threading.Timer(0.2, self.server.reload, [["static/css/style.css"]])
+        timer.start()
+        try:
+            self.assertEqual(response.readline(), b"event: reload\n")
+            self.assertEqual(response.readline(), b'data: ["static/css/style.css"]\n')
+        finally:
+            timer.cancel()
+            conn.close()
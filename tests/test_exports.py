@@ -0,0 +1,134 @@
+"""
+資料匯出單元測試
+"""
+
+import csv
+import gzip
+import io
+import json
+import unittest
+
+from src.application.exports import DataExporter, unique_headers
+from src.domain.models import SheetData
+from src.infrastructure.output_sink import MemorySink
+
+
+class TestDataExporter(unittest.TestCase):
+    """DataExporter 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.data = SheetData(
+            headers=["作者名", "作品連結", "類別", ""],
+            rows=[
+                ["測試作者1", "https://example.com/1", "小說", "備註"],
+                ['作者, "二"', "https://example.com/2", "詩歌\n散文"],
+            ],
+        )
+
+    def test_unique_headers(self):
+        """測試空白與重複的表頭另外命名"""
+        self.assertEqual(
+            unique_headers(["作者", "", "作者", "作者 (2)"]),
+            ["作者", "欄位2", "作者 (2)", "作者 (2) (2)"],
+        )
+
+    def test_export(self):
+        """測試三種格式的內容"""
+        sink = MemorySink()
+        paths = DataExporter().export(self.data, sink)
+
+        self.assertEqual(paths, ["works.csv", "works.ndjson", "works.json"])
+
+        content = sink.files["works.csv"]
+        self.assertTrue(content.startswith(b"\xef\xbb\xbf"))
+        rows = list(csv.reader(io.StringIO(content.decode("utf-8-sig"), newline="")))
+        self.assertEqual(rows[0], self.data.headers)
+        self.assertEqual(rows[1], self.data.rows[0])
+        # 較短的資料行補齊為表頭寬度，引號與換行原樣保留
+        self.assertEqual(
+            rows[2], ['作者, "二"', "https://example.com/2", "詩歌\n散文", ""]
+        )
+        self.assertIn(b"\r\n", content)
+
+        lines = sink.files["works.ndjson"].decode("utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            json.loads(lines[0]),
+            {
+                "作者名": "測試作者1",
+                "作品連結": "https://example.com/1",
+                "類別": "小說",
+                "欄位4": "備註",
+            },
+        )
+
+        records = json.loads(sink.files["works.json"])
+        self.assertEqual(records, [json.loads(line) for line in lines])
+        self.assertEqual(records[1]["類別"], "詩歌\n散文")
+
+    def test_csv_formula_cells(self):
+        """測試 CSV 中可能被當作公式的儲存格加上 '，NDJSON 保留原始內容"""
+        data = SheetData(
+            headers=["作者名", "=備註"],
+            rows=[
+                ['=HYPERLINK("https://evil.example")', "+1"],
+                ["-作者", "@SUM(A1)"],
+                ["作者 =1", "1-2"],
+            ],
+        )
+        sink = MemorySink()
+        DataExporter(formats=["csv", "ndjson"]).export(data, sink)
+
+        rows = list(
+            csv.reader(
+                io.StringIO(sink.files["works.csv"].decode("utf-8-sig"), newline="")
+            )
+        )
+        self.assertEqual(
+            rows,
+            [
+                ["作者名", "'=備註"],
+                ['\'=HYPERLINK("https://evil.example")', "'+1"],
+                ["'-作者", "'@SUM(A1)"],
+                ["作者 =1", "1-2"],
+            ],
+        )
+        first = json.loads(sink.files["works.ndjson"].decode("utf-8").splitlines()[0])
+        self.assertEqual(first["=備註"], "+1")
+
+    def test_export_empty(self):
+        """測試沒有資料行時輸出合法的空內容"""
+        sink = MemorySink()
+        DataExporter().export(SheetData(headers=["作者名"], rows=[]), sink)
+
+        self.assertEqual(json.loads(sink.files["works.json"]), [])
+        self.assertEqual(sink.files["works.ndjson"], b"")
+
+    def test_export_gzip(self):
+        """測試壓縮輸出，內容相同時壓縮檔也相同"""
+        exporter = DataExporter(["ndjson", "csv"], compress=True)
+        self.assertEqual(
+            [f.path for f in exporter.files()], ["works.ndjson.gz", "works.csv.gz"]
+        )
+        self.assertEqual(exporter.files()[0].label, "NDJSON (gzip)")
+
+        first, second = MemorySink(), MemorySink()
+        exporter.export(self.data, first)
+        exporter.export(self.data, second)
+
+        self.assertEqual(first.files, second.files)
+        plain = MemorySink()
+        DataExporter(["ndjson", "csv"]).export(self.data, plain)
+        self.assertEqual(
+            gzip.decompress(first.files["works.ndjson.gz"]),
+            plain.files["works.ndjson"],
+        )
+        self.assertEqual(
+            gzip.decompress(first.files["works.csv.gz"]), plain.files["works.csv"]
+        )
+
+    def test_invalid_format(self):
+        """測試不支援的格式"""
+        with self.assertRaises(ValueError):
+            DataExporter(["csv", "xml"])
@@ -0,0 +1,69 @@
+"""
+分面索引單元測試
+"""
+
+import base64
+import unittest
+
+from src.domain.facets import FacetValue, build_facets, facets_to_json
+from src.domain.models import SheetData, map_important_indices
+
+
+class TestFacets(unittest.TestCase):
+    """分面索引單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.headers = ["作者名", "作品連結", "類別"]
+        self.rows = [
+            ["測試作者1", "https://example.com/1", "詩歌"],
+            ["測試作者2", "https://example.com/2", "小說"],
+            ["測試作者1", "https://example.com/3", " 詩歌 "],
+            ["測試作者3", "https://example.com/4", ""],
+            ["測試作者3"],
+        ]
+        self.data = SheetData(headers=self.headers, rows=self.rows)
+        self.indices = map_important_indices(self.headers)
+
+    def test_build_facets(self):
+        """測試計算類別與作者的數量與資料行"""
+        facets = build_facets(self.data, self.indices)
+
+        # 類別依名稱排序，空白值不列入
+        self.assertEqual(
+            [(v.value, v.rows) for v in facets["category"]],
+            [("小說", [1]), ("詩歌", [0, 2])],
+        )
+        # 作者依數量由多到少排序
+        self.assertEqual(
+            [(v.value, v.count) for v in facets["author"]],
+            [("測試作者1", 2), ("測試作者3", 2), ("測試作者2", 1)],
+        )
+
+    def test_missing_column(self):
+        """測試沒有類別欄位時不產生類別分面"""
+        data = SheetData(headers=["作者名"], rows=[["測試作者1"]])
+
+        facets = build_facets(data, map_important_indices(data.headers))
+
+        self.assertEqual(list(facets), ["author"])
+
+    def test_bitmap(self):
+        """測試位元圖的位元順序"""
+        value = FacetValue("詩歌", rows=[0, 2, 9])
+
+        self.assertEqual(value.to_bitmap(10), bytes([0b00000101, 0b00000010]))
+
+    def test_json_format_selection(self):
+        """測試密集的值使用位元圖，稀疏的值使用資料行編號"""
+        dense = FacetValue("詩歌", rows=list(range(0, 1000, 2)))
+        sparse = FacetValue("測試作者1", rows=[3, 999])
+
+        dense_json = dense.to_json(1000)
+        self.assertEqual(dense_json["count"], 500)
+        self.assertEqual(base64.b64decode(dense_json["bits"]), dense.to_bitmap(1000))
+        self.assertEqual(sparse.to_json(1000)["rows"], [3, 999])
+
+        result = facets_to_json({"category": [dense]}, 1000)
+        self.assertEqual(result["row_count"], 1000)
+        self.assertEqual(result["facets"]["category"][0]["value"], "詩歌")
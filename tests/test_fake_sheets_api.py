@@ -0,0 +1,131 @@
+"""
+模擬 Google Sheets API 伺服器單元測試
+"""
+
+import gzip
+import json
+import time
+import unittest
+
+from gspread.exceptions import APIError
+
+from src.application.sheet_service import SheetService
+from src.infrastructure.fake_sheets_api import (
+    SYNTHETIC_HEADERS,
+    FakeSheetsApi,
+    FakeSheetsServer,
+    parse_range,
+    synthetic_values,
+)
+
+
+class TestFakeSheetsApi(unittest.TestCase):
+    """模擬 API 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.values = synthetic_values(50)
+        self.api = FakeSheetsApi()
+        self.api.add_spreadsheet(
+            "sheet-id",
+            {"Sheet1": self.values, "It's": [["a", "b", "c"], ["d", "e", "f"], [""]]},
+        )
+
+    def get(self, path, query="", accept_gzip=False):
+        status, body, compressed = self.api.handle(path, query, accept_gzip)
+        if compressed:
+            body = gzip.decompress(body)
+        return status, json.loads(body)
+
+    def test_synthetic_values(self):
+        """測試合成資料的格式與可重現性"""
+        self.assertEqual(self.values[0], SYNTHETIC_HEADERS)
+        self.assertEqual(len(self.values), 51)
+        self.assertRegex(
+            self.values[1][0], r"^\d{4}/\d+/\d+ [上下]午 \d{2}:\d{2}:\d{2}$"
+        )
+        self.assertEqual(synthetic_values(50), self.values)
+
+    def test_parse_range(self):
+        """測試拆解工作表名稱與 A1 範圍"""
+        self.assertEqual(parse_range("'Sheet1'"), ("Sheet1", None))
+        self.assertEqual(parse_range("Sheet1!A2:E100"), ("Sheet1", "A2:E100"))
+        self.assertEqual(parse_range("'It''s'!A:B"), ("It's", "A:B"))
+        self.assertEqual(parse_range("'a!b'!C3"), ("a!b", "C3"))
+
+    def test_values(self):
+        """測試擷取範圍內的值與多個範圍"""
+        status, body = self.get("/v4/spreadsheets/sheet-id/values/'Sheet1'")
+        self.assertEqual(status, 200)
+        self.assertEqual(body["values"], self.values)
+        self.assertEqual(body["range"], "'Sheet1'!A1:E51")
+
+        _, body = self.get("/v4/spreadsheets/sheet-id/values/Sheet1!B3:C4")
+        self.assertEqual(body["values"], [row[1:3] for row in self.values[2:4]])
+
+        # 末端的空白列不會傳回
+        _, body = self.get("/v4/spreadsheets/sheet-id/values/'It''s'!B:C")
+        self.assertEqual(body["values"], [["b", "c"], ["e", "f"]])
+
+        _, body = self.get(
+            "/v4/spreadsheets/sheet-id/values:batchGet",
+            "ranges=Sheet1!A1&ranges=%27It%27%27s%27!C2",
+            accept_gzip=True,
+        )
+        self.assertEqual(
+            [r["values"] for r in body["valueRanges"]], [[["時間戳記"]], [["f"]]]
+        )
+
+        _, body = self.get("/v4/spreadsheets/sheet-id")
+        self.assertEqual(
+            [s["properties"]["title"] for s in body["sheets"]], ["Sheet1", "It's"]
+        )
+
+    def test_errors(self):
+        """測試 Google API 格式的錯誤回應"""
+        status, body = self.get("/v4/spreadsheets/missing")
+        self.assertEqual(status, 404)
+        self.assertEqual(body["error"]["status"], "NOT_FOUND")
+        status, body = self.get("/v4/spreadsheets/sheet-id/values/Missing")
+        self.assertEqual(status, 400)
+
+        self.api.fail_next(2)
+        self.assertEqual(self.get("/drive/v3/files/sheet-id")[0], 429)
+        status, body = self.get("/drive/v3/files/sheet-id")
+        self.assertEqual(body["error"]["status"], "RESOURCE_EXHAUSTED")
+        self.assertEqual(self.get("/drive/v3/files/sheet-id")[0], 200)
+
+        self.api.requests_per_minute = 1
+        self.assertEqual(self.get("/drive/v3/files/sheet-id")[0], 200)
+        self.assertEqual(self.get("/drive/v3/files/sheet-id")[0], 429)
+        self.assertEqual(self.api.stats.errors[429], 3)
+
+    def test_sheet_service(self):
+        """測試 SheetService 透過 HTTP 擷取資料、偵測修訂版本並收到配額錯誤"""
+        with FakeSheetsServer(self.api) as server:
+            service = SheetService(api_base_url=server.url)
+            data = service.get_sheet_data("sheet-id", "Sheet1")
+            self.assertEqual(data.headers, SYNTHETIC_HEADERS)
+            self.assertEqual(data.rows, self.values[1:])
+            # requests 預設接受 gzip，傳輸量小於未壓縮的內容
+            self.assertLess(self.api.stats.bytes_sent, self.api.stats.raw_bytes)
+
+            modified = service.get_last_updated("sheet-id")
+            self.api.append_rows("sheet-id", "Sheet1", [["新投稿"] * 5])
+            self.assertGreater(service.get_last_updated("sheet-id"), modified)
+            data = service.get_sheet_data("sheet-id", "Sheet1")
+            self.assertEqual(data.rows[-1], ["新投稿"] * 5)
+
+            self.api.fail_next()
+            with self.assertRaises(APIError) as context:
+                service.get_sheet_data("sheet-id", "Sheet1")
+            self.assertEqual(context.exception.code, 429)
+
+            self.api.latency = 0.05
+            start = time.perf_counter()
+            service.get_last_updated("sheet-id")
+            self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+訂閱源生成器單元測試
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+from src.application.feed_generator import FeedGenerator
+from src.domain.models import SheetData, map_important_indices
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+SITEMAP = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+class TestFeedGenerator(unittest.TestCase):
+    """FeedGenerator 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.output_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.output_dir, "cache", "feed_state.json")
+        self.headers = ["時間戳記", "作者名", "作品連結", "類別", "作品標題"]
+        self.indices = map_important_indices(self.headers)
+        self.rows = [
+            ["2023/4/30 上午 10:30:45", "測試作者1", "example.com/1", "小說", "標題1"],
+            ["2023/5/1 下午 02:45:12", "測試作者2", "https://e.com/2", "詩歌", ""],
+            ["2023/5/2 上午 09:15:30", "測試作者3", "https://e.com/3", "", "標題3"],
+        ]
+        self.generator = FeedGenerator(
+            site_url="https://example.pages.dev/",
+            title="測試網站",
+            state_path=self.state_path,
+            max_items=2,
+        )
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _generate(self, rows):
+        return self.generator.generate(
+            SheetData(headers=self.headers, rows=rows), self.indices, self.output_dir
+        )
+
+    def _atom_titles(self):
+        tree = ET.parse(os.path.join(self.output_dir, "feed.xml"))
+        return [
+            entry.findtext(f"{ATOM}title")
+            for entry in tree.getroot().findall(f"{ATOM}entry")
+        ]
+
+    def test_generate(self):
+        """測試產生 Atom、JSON Feed 與 sitemap"""
+        entries = self._generate(self.rows)
+
+        # 由新到舊，並限制項目數量
+        self.assertEqual(
+            [entry.title for entry in entries], ["標題3", "測試作者2 的作品"]
+        )
+        self.assertEqual(self._atom_titles(), ["標題3", "測試作者2 的作品"])
+
+        with open(os.path.join(self.output_dir, "feed.json"), encoding="utf-8") as f:
+            feed = json.load(f)
+        self.assertEqual(feed["version"], "https://jsonfeed.org/version/1.1")
+        self.assertEqual(len(feed["items"]), 2)
+        self.assertEqual(
+            feed["items"][0]["date_published"], "2023-05-02T09:15:30+08:00"
+        )
+        self.assertEqual(feed["items"][1]["tags"], ["詩歌"])
+        self.assertEqual(feed["items"][1]["authors"], [{"name": "測試作者2"}])
+
+        sitemap = ET.parse(os.path.join(self.output_dir, "sitemap.xml")).getroot()
+        self.assertEqual(
+            [url.findtext(f"{SITEMAP}loc") for url in sitemap],
+            ["https://example.pages.dev/"],
+        )
+        self.assertEqual(
+            sitemap[0].findtext(f"{SITEMAP}lastmod"), "2023-05-02T09:15:30+08:00"
+        )
+
+    def test_incremental_update(self):
+        """測試只處理新增的資料行"""
+        self._generate(self.rows[:2])
+
+        with patch.object(
+            self.generator, "_to_entry", wraps=self.generator._to_entry
+        ) as to_entry:
+            entries = self._generate(self.rows)
+
+        # 只有新增的一行被轉換
+        self.assertEqual(to_entry.call_count, 1)
+        self.assertEqual(
+            [entry.title for entry in entries], ["標題3", "測試作者2 的作品"]
+        )
+
+    def test_rebuild_when_rows_removed(self):
+        """測試資料被刪除時從頭重建"""
+        self._generate(self.rows)
+
+        with patch.object(
+            self.generator, "_to_entry", wraps=self.generator._to_entry
+        ) as to_entry:
+            entries = self._generate(self.rows[:1])
+
+        self.assertEqual(to_entry.call_count, 1)
+        self.assertEqual([entry.title for entry in entries], ["標題1"])
+        self.assertEqual(entries[0].url, "https://example.com/1")
+
+    def test_rebuild_when_retained_row_edited(self):
+        """測試保留項目對應的資料行被修改時從頭重建"""
+        self._generate(self.rows[:2])
+
+        rows = [list(row) for row in self.rows]
+        rows[1][4] = "新標題2"
+        with patch.object(
+            self.generator, "_to_entry", wraps=self.generator._to_entry
+        ) as to_entry:
+            entries = self._generate(rows)
+
+        self.assertEqual(to_entry.call_count, 3)
+        self.assertEqual([entry.title for entry in entries], ["標題3", "新標題2"])
+
+    def test_rebuild_when_site_changed(self):
+        """測試網址或標題變更時從頭重建"""
+        self._generate(self.rows[:2])
+
+        generator = FeedGenerator(
+            site_url="https://example.org",
+            title="測試網站",
+            state_path=self.state_path,
+            max_items=2,
+        )
+        entries = generator.generate(
+            SheetData(headers=self.headers, rows=self.rows),
+            self.indices,
+            self.output_dir,
+        )
+
+        self.assertTrue(
+            all(entry.id.startswith("https://example.org/") for entry in entries)
+        )
+
+    def test_without_state(self):
+        """測試未設定狀態檔時每次從頭產生"""
+        generator = FeedGenerator(
+            site_url="https://example.pages.dev", title="測試網站"
+        )
+
+        entries = generator.generate(
+            SheetData(headers=self.headers, rows=self.rows),
+            self.indices,
+            self.output_dir,
+        )
+
+        self.assertEqual(len(entries), 3)
+        self.assertFalse(os.path.exists(self.state_path))
+
+    def test_item_images(self):
+        """測試在 JSON Feed 項目中加入圖片"""
+        self.generator.generate(
+            SheetData(headers=self.headers, rows=self.rows),
+            self.indices,
+            self.output_dir,
+            image_for=lambda entry: "og/a.jpg" if entry.title == "標題3" else None,
+        )
+
+        with open(os.path.join(self.output_dir, "feed.json"), encoding="utf-8") as f:
+            items = json.load(f)["items"]
+        self.assertEqual(items[0]["image"], "https://example.pages.dev/og/a.jpg")
+        self.assertNotIn("image", items[1])
@@ -0,0 +1,66 @@
+"""
+檔案監看器單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.infrastructure.file_watcher import PollingWatcher
+
+
+class TestPollingWatcher(unittest.TestCase):
+    """PollingWatcher 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "index.html")
+        self._write(self.path, "原始內容")
+        self.watcher = PollingWatcher([self.temp_dir])
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write(path, content):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_no_changes(self):
+        """測試沒有變更時回傳空集合"""
+        self.assertEqual(self.watcher.poll(), set())
+
+    def test_detect_modified_added_and_deleted(self):
+        """測試偵測修改、新增與刪除的檔案"""
+        self._write(self.path, "修改後的內容")
+        added = os.path.join(self.temp_dir, "css", "style.css")
+        os.makedirs(os.path.dirname(added))
+        self._write(added, "body {}")
+
+        self.assertEqual(self.watcher.poll(), {self.path, added})
+
+        os.remove(added)
+        self.assertEqual(self.watcher.poll(), {added})
+
+    def test_ignore_temporary_files(self):
+        """測試忽略隱藏檔與編輯器暫存檔"""
+        self._write(os.path.join(self.temp_dir, ".index.html.swp"), "x")
+        self._write(os.path.join(self.temp_dir, "index.html~"), "x")
+        os.makedirs(os.path.join(self.temp_dir, "__pycache__"))
+        self._write(os.path.join(self.temp_dir, "__pycache__", "a.pyc"), "x")
+
+        self.assertEqual(self.watcher.poll(), set())
+
+    def test_watch_until_stopped(self):
+        """測試 watch 在有變更時呼叫 callback，並可停止"""
+        batches = []
+        self._write(self.path, "修改後的內容")
+
+        watcher = self.watcher
+        watcher.interval = 0
+        watcher.watch(batches.append, should_stop=lambda: bool(batches))
+
+        self.assertEqual(batches, [{self.path}])
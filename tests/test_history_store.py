@@ -0,0 +1,123 @@
+"""
+投稿歷史紀錄單元測試
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.domain.models import SheetData, map_important_indices
+from src.infrastructure.history_store import HistoryStore
+
+
+class TestHistoryStore(unittest.TestCase):
+    """HistoryStore 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.store = HistoryStore(":memory:")
+        self.headers = ["時間戳記", "作者名", "作品連結", "類別"]
+        self.indices = map_important_indices(self.headers)
+        self.row1 = ["2023/4/30 上午 10:30:45", "測試作者1", "https://e.com/1", "小說"]
+        self.row2 = ["2023/5/1 下午 02:45:12", "測試作者2", "https://e.com/2", "詩歌"]
+        self.row3 = ["2023/5/2 上午 09:15:30", "測試作者3", "https://e.com/3", "小說"]
+
+    def tearDown(self):
+        """清理測試環境"""
+        self.store.close()
+
+    def _record(self, rows, fetched_at=None):
+        return self.store.record_run(
+            SheetData(headers=self.headers, rows=rows), self.indices, fetched_at
+        )
+
+    def test_first_run(self):
+        """測試第一次執行時所有資料都是新增"""
+        run_id = self._record([self.row1, self.row2])
+
+        diff = self.store.diff(0, run_id)
+
+        self.assertEqual(
+            [row["作者名"] for row in diff.added], ["測試作者1", "測試作者2"]
+        )
+        self.assertEqual(diff.changed, [])
+        self.assertEqual(diff.removed, [])
+
+    def test_diff_between_runs(self):
+        """測試兩次執行之間的新增、變更與移除"""
+        first = self._record([self.row1, self.row2])
+        edited = list(self.row2)
+        edited[3] = "散文"
+        second = self._record([edited, self.row3])
+
+        diff = self.store.diff(first, second)
+
+        self.assertEqual([row["作者名"] for row in diff.added], ["測試作者3"])
+        self.assertEqual([row["類別"] for row in diff.changed], ["散文"])
+        self.assertEqual([row["作者名"] for row in diff.removed], ["測試作者1"])
+
+    def test_unchanged_run(self):
+        """測試資料沒有變化時差異為空"""
+        first = self._record([self.row1, self.row2])
+        second = self._record([self.row2, self.row1])
+
+        self.assertTrue(self.store.diff(first, second).is_empty)
+
+    def test_reappearing_row(self):
+        """測試移除後又出現的資料視為變更"""
+        first = self._record([self.row1])
+        self._record([])
+        third = self._record([self.row1])
+
+        diff = self.store.diff(first + 1, third)
+
+        self.assertEqual(len(diff.changed), 1)
+        self.assertEqual(diff.added, [])
+
+    def test_duplicate_keys(self):
+        """測試同一次擷取中重複的識別鍵"""
+        run_id = self._record([self.row1, list(self.row1)])
+
+        self.assertEqual(len(self.store.diff(0, run_id).added), 2)
+
+    def test_diff_since(self):
+        """測試依時間查詢差異"""
+        now = datetime.now(timezone.utc)
+        self._record([self.row1], fetched_at=now - timedelta(days=10))
+        self._record([self.row1, self.row2], fetched_at=now - timedelta(days=3))
+
+        diff = self.store.diff_since(now - timedelta(days=7))
+
+        self.assertEqual([row["作者名"] for row in diff.added], ["測試作者2"])
+        self.assertEqual(self.store.latest_run(), 2)
+
+    def test_chronological_order(self):
+        """測試差異依解析後的時間排序，而非時間戳記字串"""
+        late = ["2025/4/10 上午 09:00:00", "測試作者4", "https://e.com/4", "小說"]
+        early = ["2025/4/9 下午 11:00:00", "測試作者5", "https://e.com/5", "小說"]
+        run_id = self._record([late, early, ["", "測試作者6", "https://e.com/6", ""]])
+
+        self.assertEqual(
+            [row["作者名"] for row in self.store.diff(0, run_id).added],
+            ["測試作者5", "測試作者4", "測試作者6"],
+        )
+
+    def test_indexes(self):
+        """測試類別、作者與時間戳記索引"""
+        indexes = {
+            row[0]
+            for row in self.store.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        for name in (
+            "idx_submissions_category",
+            "idx_submissions_author",
+            "idx_submissions_timestamp",
+        ):
+            self.assertIn(name, indexes)
+
+        plan = self.store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM submissions "
+            "WHERE first_seen_run > 1 AND first_seen_run <= 2"
+        ).fetchall()
+        self.assertIn("idx_submissions_first_seen", " ".join(str(p) for p in plan))
@@ -2,14 +2,19 @@
 HTML 產生器單元測試
 """
 
+import json
 import os
 import shutil
 import tempfile
 import unittest
+import zipfile
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from src.application.html_generator import HtmlGenerator
+from src.application.image_variants import ImageVariant
 from src.domain.models import SheetData
+from src.infrastructure.output_sink import MemorySink, create_output_sink
 
 
 class TestHtmlGenerator(unittest.TestCase):
@@ -74,6 +79,54 @@ class TestHtmlGenerator(unittest.TestCase):
             self.assertNotIn("test1@example.com", row)
             self.assertNotIn("test2@example.com", row)
 
+    def test_filter_sensitive_data_scrubs_cells(self):
+        """測試遮蔽其他欄位中的個人資料，但不修改作品連結"""
+        data = SheetData(
+            headers=["作者", "連結", "備註"],
+            rows=[["測試作者1", "https://example.com/1", "信箱 test1@example.com"]],
+        )
+
+        filtered_data = self.generator._filter_sensitive_data(data)
+
+        self.assertEqual(
+            filtered_data.rows[0],
+            ["測試作者1", "https://example.com/1", "信箱 [電子郵件已隱藏]"],
+        )
+
+    def test_prepare_data_removes_duplicates(self):
+        """測試渲染前合併作品連結相同的重複投稿"""
+        data = SheetData(
+            headers=["作者", "作品連結", "時間戳記"],
+            rows=[
+                ["作者1", "https://example.com/1", "2024/5/2 上午 10:00:00"],
+                [
+                    "作者1",
+                    "http://EXAMPLE.com/1/?utm_source=fb",
+                    "2024/5/1 上午 10:00:00",
+                ],
+            ],
+        )
+
+        prepared_data, _ = self.generator.prepare_data(data)
+        self.assertEqual(prepared_data.rows, [data.rows[1]])
+
+        self.generator.duplicate_policy = None
+        prepared_data, _ = self.generator.prepare_data(data)
+        self.assertEqual(len(prepared_data.rows), 2)
+
+    def test_generate_site_deduplicated(self):
+        """測試已合併重複投稿的資料不會再次合併"""
+        with patch(
+            "src.application.html_generator.dedupe_submissions",
+            side_effect=lambda data, *args, **kwargs: data,
+        ) as mock_dedupe:
+            data = self.generator.remove_duplicates(self.data)
+            self.generator.generate_site(data, MemorySink(), deduplicated=True)
+            self.assertEqual(mock_dedupe.call_count, 1)
+
+            self.generator.generate_site(data, MemorySink())
+            self.assertEqual(mock_dedupe.call_count, 2)
+
     def test_map_important_indices(self):
         """測試映射重要欄位索引"""
         indices = self.generator._map_important_indices(self.data)
@@ -152,6 +205,308 @@ class TestHtmlGenerator(unittest.TestCase):
             content = f.read()
             self.assertEqual(content, "測試 HTML 內容")
 
+    @patch("src.application.html_generator.datetime")
+    def test_generate_site_to_sink(self, mock_datetime):
+        """測試輸出到記憶體與封存檔的內容與輸出到目錄相同"""
+        mock_datetime.now.return_value = datetime(2024, 5, 1, 12, 0, 0)
+        self.generator.generate_site(self.data, self.test_output_dir)
+        expected = {}
+        for root, _, files in os.walk(self.test_output_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                rel_path = os.path.relpath(path, self.test_output_dir)
+                with open(path, "rb") as f:
+                    expected[rel_path.replace(os.sep, "/")] = f.read()
+        self.assertIn("static/css/style.css", expected)
+
+        sink = MemorySink()
+        HtmlGenerator().generate_site(self.data, sink)
+        self.assertEqual(sink.files, expected)
+
+        archive_path = os.path.join(self.test_output_dir, "site.zip")
+        with create_output_sink(archive_path) as archive_sink:
+            generator = HtmlGenerator()
+            generator.prepare_output(archive_sink)
+            # 已準備的封存檔不會再次寫入靜態資源
+            generator.generate_site(self.data, archive_sink)
+        with zipfile.ZipFile(archive_path) as archive:
+            self.assertEqual(
+                {name: archive.read(name) for name in archive.namelist()}, expected
+            )
+
+    def test_generate_site_exports(self):
+        """測試產生已過濾敏感欄位的資料下載檔，並在頁面中連結"""
+        sink = MemorySink()
+        self.generator.generate_site(self.data, sink)
+
+        records = json.loads(sink.files["works.json"])
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["標題"], "測試標題1")
+        # 電子郵件欄位已被過濾
+        self.assertNotIn("電子郵件", records[0])
+        self.assertNotIn(b"test1@example.com", sink.files["works.csv"])
+        self.assertIn(b'href="works.ndjson" download', sink.files["index.html"])
+
+        self.generator.data_exporter = None
+        sink = MemorySink()
+        self.generator.generate_site(self.data, sink)
+        self.assertNotIn("works.csv", sink.files)
+        self.assertNotIn(b"works.csv", sink.files["index.html"])
+
+    def test_generate_site_sitemap(self):
+        """測試 sitemap 列出首頁與統計頁面"""
+        sink = MemorySink()
+        self.generator.generate_site(self.data, sink)
+
+        sitemap = sink.files["sitemap.xml"].decode("utf-8")
+        self.assertIn("/</loc>", sitemap)
+        self.assertIn("/stats.html</loc>", sitemap)
+
+    def test_generate_site_icon_sprite(self):
+        """測試頁面內嵌只包含引用圖示的 sprite，不再載入圖示樣式表"""
+        sink = MemorySink()
+        self.generator.generate_site(self.data, sink)
+        html = sink.files["index.html"].decode("utf-8")
+
+        self.assertNotIn("font-awesome", html)
+        self.assertNotIn('class="fas', html)
+        self.assertIn('<symbol id="icon-search"', html)
+        # 排序腳本切換的圖示也包含在內
+        self.assertIn('<symbol id="icon-sort-up"', html)
+        self.assertNotIn('<symbol id="icon-unlink"', html)
+        self.assertNotIn('<symbol id="icon-trophy"', html)
+
+        self.generator.broken_links = {"https://example.com/gone"}
+        sink = MemorySink()
+        self.generator.generate_site(self.data, sink)
+        self.assertIn(b'<symbol id="icon-unlink"', sink.files["index.html"])
+
+    @patch("src.application.html_generator.datetime")
+    def test_service_worker(self, mock_datetime):
+        """測試預先快取清單只在內容改變時改變項目的雜湊值"""
+        mock_datetime.now.return_value = datetime(2024, 5, 1, 12, 0, 0)
+        self.generator.generate_site(self.data, self.test_output_dir)
+
+        with open(
+            os.path.join(self.test_output_dir, "precache-manifest.json"),
+            encoding="utf-8",
+        ) as f:
+            manifest = json.load(f)
+        revisions = {entry["url"]: entry["revision"] for entry in manifest["entries"]}
+        css_url = self.generator.asset_url("static/css/style.css")
+        self.assertEqual(
+            sorted(revisions),
+            sorted(
+                [
+                    "index.html",
+                    "facets.json",
+                    "sort_orders.json",
+                    "stats.html",
+                    "stats.json",
+                    css_url,
+                ]
+            ),
+        )
+        with open(os.path.join(self.test_output_dir, "sw.js"), encoding="utf-8") as f:
+            self.assertIn(manifest["version"], f.read())
+        with open(
+            os.path.join(self.test_output_dir, "index.html"), encoding="utf-8"
+        ) as f:
+            self.assertIn("serviceWorker.register('sw.js')", f.read())
+
+        # 新增資料後只有頁面與資料檔的雜湊值改變
+        data = SheetData(
+            headers=self.headers,
+            rows=self.rows
+            + [["測試標題3", "測試作者3", "https://example.com/3", "", "2023-01-03"]],
+        )
+        sink = MemorySink()
+        self.generator.generate_site(data, sink)
+        manifest = json.loads(sink.files["precache-manifest.json"])
+        changed = {
+            entry["url"]
+            for entry in manifest["entries"]
+            if revisions[entry["url"]] != entry["revision"]
+        }
+        self.assertEqual(
+            changed,
+            {
+                "index.html",
+                "facets.json",
+                "sort_orders.json",
+                "stats.html",
+                "stats.json",
+            },
+        )
+
+        # 停用時不產生 service worker
+        self.generator.service_worker = False
+        sink = MemorySink()
+        self.generator.generate_site(self.data, sink)
+        self.assertNotIn("sw.js", sink.files)
+        self.assertNotIn(b"serviceWorker", sink.files["index.html"])
+
+    def test_prepare_output(self):
+        """測試事先準備輸出目錄並為靜態資源加上內容指紋"""
+        self.generator.prepare_output(self.test_output_dir)
+
+        css_path = os.path.join(self.test_output_dir, "static", "css", "style.css")
+        self.assertTrue(os.path.exists(css_path))
+
+        url = self.generator.asset_url("static/css/style.css")
+        self.assertRegex(url, r"^static/css/style\.css\?v=[0-9a-f]{10}$")
+        self.assertEqual(
+            self.generator.asset_url("static/missing.css"), "static/missing.css"
+        )
+
+        # 已準備的輸出目錄不會再次複製靜態資源
+        with patch.object(self.generator, "_copy_static_files") as copy_static:
+            self.generator.generate_site(self.data, self.test_output_dir)
+        copy_static.assert_not_called()
+
+        with open(
+            os.path.join(self.test_output_dir, "index.html"), encoding="utf-8"
+        ) as f:
+            self.assertIn(url, f.read())
+
+    def test_render_pages_writes_facets(self):
+        """測試產生分面檔案，並以解析後的類別欄位產生篩選按鈕"""
+        data = SheetData(
+            headers=["作者名", "作品連結", "分類"],
+            rows=[
+                ["測試作者1", "https://example.com/1", "詩歌"],
+                ["測試作者2", "https://example.com/2", "小說"],
+            ],
+        )
+        filtered_data, indices = self.generator.prepare_data(data)
+
+        outputs = self.generator.render_pages(
+            filtered_data, self.test_output_dir, indices
+        )
+
+        self.assertEqual(
+            outputs,
+            [
+                "index.html",
+                "facets.json",
+                "sort_orders.json",
+                "stats.html",
+                "stats.json",
+            ],
+        )
+        with open(
+            os.path.join(self.test_output_dir, "facets.json"), encoding="utf-8"
+        ) as f:
+            facets = json.load(f)
+        self.assertEqual(facets["row_count"], 2)
+        self.assertEqual(
+            [v["value"] for v in facets["facets"]["category"]], ["小說", "詩歌"]
+        )
+        with open(
+            os.path.join(self.test_output_dir, "index.html"), encoding="utf-8"
+        ) as f:
+            html = f.read()
+        self.assertIn('data-filter="詩歌"', html)
+        self.assertIn('data-row="1"', html)
+        self.assertIn('data-sort-key="category"', html)
+
+        with open(
+            os.path.join(self.test_output_dir, "sort_orders.json"), encoding="utf-8"
+        ) as f:
+            self.assertEqual(json.load(f)["category"], [1, 0])
+
+    def test_render_pages_writes_stats(self):
+        """測試產生統計頁面與統計資料"""
+        data = SheetData(
+            headers=["時間戳記", "作者名", "作品連結", "類別"],
+            rows=[
+                ["2023/5/1 上午 9:00:00", "測試作者1", "https://example.com/1", "詩歌"],
+                ["2023/5/3 下午 2:00:00", "測試作者2", "https://example.com/2", "小說"],
+                ["2023/5/3 下午 3:00:00", "測試作者1", "https://example.com/3", "詩歌"],
+            ],
+        )
+        filtered_data, indices = self.generator.prepare_data(data)
+
+        self.generator.render_pages(filtered_data, self.test_output_dir, indices)
+
+        with open(
+            os.path.join(self.test_output_dir, "stats.json"), encoding="utf-8"
+        ) as f:
+            stats = json.load(f)
+        self.assertEqual(stats["daily"]["counts"], [1, 0, 2])
+        self.assertEqual(stats["authors"][0]["name"], "測試作者1")
+        with open(
+            os.path.join(self.test_output_dir, "stats.html"), encoding="utf-8"
+        ) as f:
+            html = f.read()
+        # 每個有投稿的日期一個長條，累計折線經過每一天
+        self.assertEqual(html.count("<rect "), 2)
+        self.assertIn('points="0.4,66.67 1.4,66.67 2.4,0.00 "', html)
+        self.assertIn(
+            "<td>測試作者1</td><td>2</td><td>詩歌</td><td>2023-05-03</td>", html
+        )
+        with open(
+            os.path.join(self.test_output_dir, "index.html"), encoding="utf-8"
+        ) as f:
+            self.assertIn('href="stats.html"', f.read())
+
+    @patch("src.application.html_generator.datetime")
+    def test_render_chunked_matches_serial(self, mock_datetime):
+        """測試分段平行渲染的頁面與直接渲染完全相同"""
+        mock_datetime.now.return_value = datetime(2024, 5, 1, 12, 0, 0)
+        data = SheetData(
+            headers=["時間戳記", "作者名", "作品連結", "類別", "作品標題"],
+            rows=[
+                [
+                    f"2024/5/{i % 28 + 1} 下午 02:{i % 60:02d}:00",
+                    f"作者{i % 17}",
+                    f"example.com/works/{i}",
+                    ["小說", "詩歌", "散文"][i % 3],
+                    f"標題 <{i}>",
+                ]
+                for i in range(203)
+            ],
+        )
+        self.generator.broken_links = {"https://example.com/works/7"}
+        data, indices = self.generator.prepare_data(data)
+
+        serial_dir = os.path.join(self.test_output_dir, "serial")
+        chunked_dir = os.path.join(self.test_output_dir, "chunked")
+        os.makedirs(serial_dir)
+        os.makedirs(chunked_dir)
+        self.generator.render_pages(data, serial_dir, indices)
+        self.generator.render_workers = 3
+        self.generator.render_chunk_rows = 10
+        with patch.object(
+            self.generator, "_render_chunked", wraps=self.generator._render_chunked
+        ) as render_chunked:
+            self.generator.render_pages(data, chunked_dir, indices)
+            render_chunked.assert_called_once()
+
+        with open(os.path.join(serial_dir, "index.html"), "rb") as f:
+            serial = f.read()
+        with open(os.path.join(chunked_dir, "index.html"), "rb") as f:
+            chunked = f.read()
+        self.assertEqual(chunked, serial)
+        self.assertIn(b'data-row="202"', serial)
+        self.assertIn("連結可能失效".encode("utf-8"), serial)
+
+    def test_image_variant(self):
+        """測試選擇寬度不小於需要寬度的最小變體"""
+        self.assertIsNone(self.generator.image_variant("static/img/a.jpg", 1200))
+
+        self.generator._image_variants["static/img/a.jpg"] = [
+            ImageVariant(f"static/img/a-{w}w.{ext}", w, w // 2, fmt)
+            for fmt, ext in (("jpeg", "jpg"), ("webp", "webp"))
+            for w in (480, 960, 1500)
+        ]
+
+        variant = self.generator.image_variant("static/img/a.jpg", 900)
+        self.assertEqual(variant.path, "static/img/a-960w.jpg")
+        variant = self.generator.image_variant("static/img/a.jpg", 2000, "webp")
+        self.assertEqual(variant.path, "static/img/a-1500w.webp")
+        self.assertIsNone(self.generator.image_variant("static/img/a.jpg", 480, "avif"))
+
     def test_to_link(self):
         """測試 URL 轉換為 HTML 連結功能"""
         # 測試一般 URL
@@ -175,6 +530,18 @@ class TestHtmlGenerator(unittest.TestCase):
         html_link = self.generator._to_link(url)
         self.assertEqual(html_link, "")
 
+    def test_to_checked_link(self):
+        """測試標示失效的連結"""
+        self.generator.broken_links = {"https://example.com/gone"}
+
+        html_link = self.generator._to_checked_link("example.com/gone")
+        self.assertIn('href="https://example.com/gone"', html_link)
+        self.assertIn("連結可能失效", html_link)
+
+        html_link = self.generator._to_checked_link("example.com/ok")
+        self.assertEqual(html_link, self.generator._to_link("example.com/ok"))
+        self.assertEqual(self.generator._to_checked_link(""), "")
+
     def test_format_date(self):
         """測試日期格式化功能"""
         # 這裡應該根據實際的 _format_date 方法實現來測試
@@ -183,3 +550,11 @@ class TestHtmlGenerator(unittest.TestCase):
         # 測試空值
         result = self.generator._format_date("")
         self.assertEqual(result, "")
+
+        # 測試 Google Forms 的時間戳記格式
+        result = self.generator._format_date("2023/4/30 下午 10:30:45")
+        self.assertEqual(result, "2023-04-30 22:30")
+
+        # 測試無法解析的值
+        result = self.generator._format_date("不是日期")
+        self.assertEqual(result, "不是日期")
@@ -0,0 +1,101 @@
+"""
+SVG 圖示單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from jinja2 import Environment
+
+from src.application.icons import (
+    ICON_DIR,
+    IconSprite,
+    IconTemplateLoader,
+    icon_html,
+    referenced_icons,
+    rewrite_icons,
+)
+
+
+class TestIcons(unittest.TestCase):
+    """SVG 圖示單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, content):
+        with open(os.path.join(self.temp_dir, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_rewrite_icons(self):
+        """測試將 Font Awesome 圖示標籤改寫為引用 sprite"""
+        source = (
+            '<p><i class="fas fa-clock"></i> 時間</p>'
+            '<i class="fas fa-sort text-muted" aria-hidden="true"></i>'
+            '<i class="fa-brands fa-github"></i>'
+        )
+        html = rewrite_icons(source)
+
+        self.assertEqual(
+            html,
+            f"<p>{icon_html('clock')} 時間</p>"
+            '<svg class="icon text-muted" aria-hidden="true">'
+            '<use href="#icon-sort"></use></svg>'
+            # 不支援的樣式維持原樣
+            '<i class="fa-brands fa-github"></i>',
+        )
+        self.assertEqual(
+            referenced_icons(html + "el.setAttribute('href', '#icon-sort-up')"),
+            {"clock", "sort", "sort-up"},
+        )
+
+    def test_sprite(self):
+        """測試 sprite 只包含指定的圖示，並拒絕缺少的圖示"""
+        self.write(
+            "dot.svg", '<svg xmlns="x" viewBox="0 0 10 10">\n<circle r="5"/>\n</svg>'
+        )
+        sprite = IconSprite(self.temp_dir)
+
+        html = sprite.render(["dot"])
+        self.assertEqual(
+            html,
+            '<svg xmlns="http://www.w3.org/2000/svg" style="display: none">'
+            '<symbol id="icon-dot" viewBox="0 0 10 10"><circle r="5"/></symbol></svg>',
+        )
+        self.assertEqual(sprite.render([]), "")
+        with self.assertRaises(ValueError):
+            sprite.render(["dot", "missing"])
+
+    def test_template_icons(self):
+        """測試記錄模板與其 include 的模板引用的圖示"""
+        self.write("page.html", '<i class="fas fa-rss"></i>{% include "_part.html" %}')
+        self.write("_part.html", '<i class="fas fa-fire"></i>')
+        self.write("other.html", '<i class="fas fa-tags"></i>')
+        loader = IconTemplateLoader(self.temp_dir)
+        env = Environment(loader=loader)
+
+        self.assertEqual(loader.template_icons(env, "page.html"), {"rss", "fire"})
+        self.assertIn(
+            '<use href="#icon-fire"></use>', env.get_template("page.html").render()
+        )
+
+    def test_vendored_icons(self):
+        """測試專案的模板引用的圖示都有來源"""
+        loader = IconTemplateLoader(ICON_DIR.parent / "templates")
+        env = Environment(loader=loader)
+        sprite = IconSprite()
+        for name in env.list_templates():
+            icons = loader.template_icons(env, name)
+            # 缺少來源時會拋出 ValueError
+            sprite.render(icons | {"unlink"})
+
+
+if __name__ == "__main__":
+    unittest.main()
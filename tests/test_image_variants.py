@@ -0,0 +1,75 @@
+"""
+圖片變體生成器單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.application.image_variants import ImageVariantBuilder
+
+
+@unittest.skipUnless(ImageVariantBuilder.available(), "需要 Pillow")
+class TestImageVariantBuilder(unittest.TestCase):
+    """ImageVariantBuilder 單元測試類"""
+
+    def setUp(self):
+        """建立含 EXIF 的測試圖片"""
+        from PIL import Image
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.source = os.path.join(self.temp_dir, "banner.jpg")
+        exif = Image.Exif()
+        exif[0x010F] = "測試相機"
+        Image.new("RGB", (1000, 500), (200, 30, 30)).save(self.source, exif=exif)
+        self.builder = ImageVariantBuilder(
+            cache_dir=self.cache_dir, widths=(480, 1200), formats=["webp"]
+        )
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build(self):
+        """測試產生各寬度與格式的變體"""
+        from PIL import Image
+
+        output_dir = os.path.join(self.temp_dir, "dist")
+        variants = self.builder.build(self.source, "static/img/banner.jpg", output_dir)
+
+        self.assertEqual(
+            [(v.path, v.width, v.height, v.format) for v in variants],
+            [
+                ("static/img/banner-480w.jpg", 480, 240, "jpeg"),
+                ("static/img/banner-1000w.jpg", 1000, 500, "jpeg"),
+                ("static/img/banner-480w.webp", 480, 240, "webp"),
+                ("static/img/banner-1000w.webp", 1000, 500, "webp"),
+            ],
+        )
+        for variant in variants:
+            with Image.open(os.path.join(output_dir, variant.path)) as image:
+                self.assertEqual(image.size, (variant.width, variant.height))
+                self.assertNotIn(0x010F, image.getexif())
+
+    def test_cache(self):
+        """測試來源圖片沒有變更時不重新編碼"""
+        self.builder.build(self.source, "static/img/banner.jpg", self.temp_dir)
+
+        with patch.object(self.builder, "_encode") as mock_encode:
+            output_dir = os.path.join(self.temp_dir, "dist")
+            variants = self.builder.build(
+                self.source, "static/img/banner.jpg", output_dir
+            )
+            mock_encode.assert_not_called()
+        self.assertEqual(len(variants), 4)
+        for variant in variants:
+            self.assertTrue(os.path.exists(os.path.join(output_dir, variant.path)))
+
+    def test_unsupported(self):
+        """測試不處理的檔案類型"""
+        self.assertEqual(
+            self.builder.build(self.source, "static/img/icon.svg", self.temp_dir), []
+        )
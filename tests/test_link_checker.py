@@ -0,0 +1,165 @@
+"""
+連結檢查器單元測試
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.infrastructure.link_checker import (
+    STATUS_BROKEN,
+    STATUS_OK,
+    STATUS_UNKNOWN,
+    LinkChecker,
+    LinkResult,
+    normalize_link,
+)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """模擬各種回應的本機 HTTP 伺服器"""
+
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self):
+        self.requests.append((self.command, self.path))
+        if self.path == "/ok":
+            self.send_response(200)
+        elif self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/ok")
+        elif self.path == "/loop":
+            self.send_response(302)
+            self.send_header("Location", "/loop")
+        elif self.path == "/no-head" and self.command == "HEAD":
+            self.send_response(405)
+        elif self.path == "/no-head":
+            self.send_response(200)
+        elif self.path == "/forbidden":
+            self.send_response(403)
+        else:
+            self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+
+class TestLinkChecker(unittest.TestCase):
+    """LinkChecker 單元測試類"""
+
+    @classmethod
+    def setUpClass(cls):
+        """啟動本機 HTTP 伺服器"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """停止本機 HTTP 伺服器"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """設置測試環境"""
+        _StandInHandler.requests.clear()
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, "link_check.json")
+        self.checker = LinkChecker(cache_path=self.cache_path, ttl=60, timeout=5)
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_check(self):
+        """測試分類各種回應"""
+        # 取得一個沒有在監聽的埠號
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed_port = sock.getsockname()[1]
+
+        urls = {
+            "ok": f"{self.base}/ok",
+            "moved": f"{self.base}/moved",
+            "no_head": f"{self.base}/no-head",
+            "missing": f"{self.base}/missing",
+            "forbidden": f"{self.base}/forbidden",
+            "loop": f"{self.base}/loop",
+            "refused": f"http://127.0.0.1:{closed_port}/",
+        }
+
+        results = self.checker.check(urls.values(), now=1000)
+
+        status = {name: results[url].status for name, url in urls.items()}
+        self.assertEqual(
+            status,
+            {
+                "ok": STATUS_OK,
+                "moved": STATUS_OK,
+                "no_head": STATUS_OK,
+                "missing": STATUS_BROKEN,
+                "forbidden": STATUS_UNKNOWN,
+                "loop": STATUS_UNKNOWN,
+                "refused": STATUS_BROKEN,
+            },
+        )
+        self.assertEqual(results[urls["missing"]].http_status, 404)
+        self.assertTrue(results[urls["missing"]].is_broken)
+
+    def test_cache_ttl(self):
+        """測試未過期的結果不會重新檢查"""
+        urls = [f"{self.base}/ok", f"{self.base}/ok", f"{self.base}/missing"]
+        self.checker.check(urls, now=1000)
+        self.assertEqual(len(_StandInHandler.requests), 2)
+
+        # 新的檢查器從快取檔讀取結果
+        checker = LinkChecker(cache_path=self.cache_path, ttl=60)
+        results = checker.check(urls, now=1030)
+        self.assertEqual(len(_StandInHandler.requests), 2)
+        self.assertTrue(results[f"{self.base}/missing"].is_broken)
+
+        # 過期後重新檢查
+        checker.check(urls, now=1100)
+        self.assertEqual(len(_StandInHandler.requests), 4)
+
+    def test_mixed_host_concurrency(self):
+        """測試大量同主機網址不會讓其他主機的網址排隊等待"""
+        checker = LinkChecker(max_concurrency=4, per_host_limit=1)
+        active = set()
+        peak = []
+
+        async def check_url(url, now):
+            active.add(url)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.discard(url)
+            return LinkResult(url, STATUS_OK, 200, now)
+
+        checker._check_url = check_url
+        urls = [f"https://a.example/{i}" for i in range(8)] + [
+            "https://b.example/",
+            "https://c.example/",
+            "https://d.example/",
+        ]
+        results = asyncio.run(checker._check_all(urls, now=1000))
+
+        self.assertEqual(len(results), 11)
+        # 每個主機同時一個連線，四個主機可以同時檢查
+        self.assertEqual(max(peak), 4)
+
+    def test_normalize_link(self):
+        """測試與頁面上產生的連結一致的網址轉換"""
+        self.assertEqual(normalize_link(" example.com/1 "), "https://example.com/1")
+        self.assertEqual(normalize_link("http://example.com"), "http://example.com")
+        self.assertEqual(normalize_link(""), "")
@@ -4,7 +4,7 @@
 
 import unittest
 
-from src.domain.models import SheetData
+from src.domain.models import SheetData, map_important_indices
 
 
 class TestSheetData(unittest.TestCase):
@@ -96,3 +96,16 @@ class TestSheetData(unittest.TestCase):
         # 完全空
         data3 = SheetData(headers=[], rows=[])
         self.assertEqual(data3.to_dict_list(), [])
+
+
+class TestMapImportantIndices(unittest.TestCase):
+    """map_important_indices 單元測試"""
+
+    def test_map_important_indices(self):
+        """測試依表頭名稱映射重要欄位"""
+        indices = map_important_indices(["Timestamp", "作者名", "URL", "分類", "備註"])
+
+        self.assertEqual(
+            indices,
+            {"link": 2, "timestamp": 0, "author": 1, "category": 3, "title": -1},
+        )
@@ -0,0 +1,144 @@
+"""
+多網站建置單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.application.multi_site import (
+    MultiSiteBuilder,
+    SiteConfig,
+    format_results,
+    load_site_configs,
+)
+from src.infrastructure.data_sources import create_data_source
+
+
+def _create_source(site):
+    return create_data_source(site.source, site.source_path)
+
+
+class TestMultiSite(unittest.TestCase):
+    """多網站建置單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sites = []
+        for name in ("north", "south"):
+            path = os.path.join(self.temp_dir, f"{name}.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("時間戳記,作者名,作品連結\n")
+                f.write(
+                    f"2024/5/1 上午 10:00:00,{name}作者,https://example.com/{name}\n"
+                )
+            self.sites.append(
+                SiteConfig(
+                    name=name,
+                    output_dir=os.path.join(self.temp_dir, "dist", name),
+                    title=f"{name} 接力",
+                    site_url=f"https://{name}.example.com",
+                    source="csv",
+                    source_path=path,
+                )
+            )
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_config(self, content):
+        path = os.path.join(self.temp_dir, "sites.toml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def test_load_site_configs(self):
+        """測試讀取設定檔並套用預設值"""
+        path = self._write_config(
+            """
+[defaults]
+sheet_name = "表單回應 1"
+subtitle = "作品目錄"
+
+[[sites]]
+name = "north"
+spreadsheet_id = "abc"
+output_dir = "dist/north"
+
+[[sites]]
+name = "south"
+title = "南部接力"
+source = "csv"
+source_path = "south.csv"
+output_dir = "dist/south"
+sheet_name = "Sheet1"
+"""
+        )
+
+        sites = load_site_configs(path)
+
+        self.assertEqual([site.name for site in sites], ["north", "south"])
+        self.assertEqual(sites[0].sheet_name, "表單回應 1")
+        self.assertEqual(sites[0].subtitle, "作品目錄")
+        self.assertEqual(sites[1].title, "南部接力")
+        self.assertEqual(sites[1].sheet_name, "Sheet1")
+
+    def test_load_site_configs_errors(self):
+        """測試不正確的設定檔"""
+        for content in [
+            "",
+            '[[sites]]\nname = "a"\noutput_dir = "d"\ncolour = "red"\n',
+            '[[sites]]\nname = "a"\noutput_dir = "d"\n',
+            '[[sites]]\nname = "a"\nsource = "csv"\n',
+            '[[sites]]\nname = "a"\nsource = "csv"\noutput_dir = "d"\n' * 2,
+        ]:
+            with self.assertRaises(ValueError, msg=content):
+                load_site_configs(self._write_config(content))
+
+    def _assert_built(self, results):
+        self.assertTrue(all(result.ok for result in results), format_results(results))
+        for site in self.sites:
+            with open(
+                os.path.join(site.output_dir, "index.html"), encoding="utf-8"
+            ) as f:
+                html = f.read()
+            self.assertIn(site.title, html)
+            self.assertIn(f"{site.name}作者", html)
+            with open(
+                os.path.join(site.output_dir, "feed.json"), encoding="utf-8"
+            ) as f:
+                self.assertIn(site.site_url, f.read())
+
+    def test_build_in_process_pool(self):
+        """測試以多個行程產生網站"""
+        results = MultiSiteBuilder(self.sites, _create_source, max_workers=2).build()
+
+        self._assert_built(results)
+        self.assertEqual([result.rows for result in results], [1, 1])
+
+    def test_build_sequential(self):
+        """測試在目前的行程中依序產生網站"""
+        results = MultiSiteBuilder(self.sites, _create_source, max_workers=1).build()
+
+        self._assert_built(results)
+
+    def test_fetch_error(self):
+        """測試單一網站擷取失敗時不影響其他網站"""
+        self.sites.append(
+            SiteConfig(
+                name="broken",
+                output_dir=os.path.join(self.temp_dir, "dist", "broken"),
+                source="csv",
+                source_path=os.path.join(self.temp_dir, "missing.csv"),
+            )
+        )
+
+        results = MultiSiteBuilder(self.sites, _create_source, max_workers=1).build()
+
+        self.assertEqual([result.ok for result in results], [True, True, False])
+        self.assertIn("擷取失敗", results[2].error)
+        self.assertIn("broken", format_results(results))
+        self.assertFalse(os.path.exists(self.sites[2].output_dir))
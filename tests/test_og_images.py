@@ -0,0 +1,123 @@
+"""
+Open Graph 圖片生成器單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.application.og_images import (
+    CARD_HEIGHT,
+    CARD_WIDTH,
+    OgCard,
+    OgImageGenerator,
+    cards_from_data,
+)
+from src.domain.models import SheetData, map_important_indices
+from src.infrastructure.output_sink import MemorySink
+
+
+def _fake_render(job):
+    """不需要 Pillow 的繪製函式，只寫入卡片標題"""
+    card, _, path, _, _ = job
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(card.title)
+    return path
+
+
+class TestOgImageGenerator(unittest.TestCase):
+    """OgImageGenerator 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.generator = OgImageGenerator(
+            "測試網站", cache_dir=self.cache_dir, max_workers=1
+        )
+        self.cards = [
+            OgCard("標題1", "作者1", "小說"),
+            OgCard("標題2", "作者2", "詩歌"),
+            OgCard("標題1", "作者1", "小說"),
+        ]
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cards_from_data(self):
+        """測試由資料行建立卡片內容"""
+        headers = ["作者名", "作品標題", "類別"]
+        data = SheetData(
+            headers=headers, rows=[["作者1", "", "小說"], ["", "標題", ""]]
+        )
+
+        cards = cards_from_data(data, map_important_indices(headers))
+
+        self.assertEqual(
+            cards, [OgCard("作者1 的作品", "作者1", "小說"), OgCard("標題", "", "")]
+        )
+
+    def test_filename(self):
+        """測試檔名隨內容與格式改變"""
+        card = self.cards[0]
+        self.assertEqual(self.generator.filename(card), self.generator.filename(card))
+        self.assertTrue(self.generator.filename(card).endswith(".jpg"))
+        self.assertNotEqual(
+            self.generator.filename(card),
+            self.generator.filename(OgCard("標題1（修訂）", "作者1", "小說")),
+        )
+
+        webp = OgImageGenerator("測試網站", image_format="webp")
+        self.assertTrue(webp.filename(card).endswith(".webp"))
+        with self.assertRaises(ValueError):
+            OgImageGenerator("測試網站", image_format="gif")
+
+    @patch("src.application.og_images.render_card", side_effect=_fake_render)
+    def test_generate_cache(self, mock_render):
+        """測試只繪製快取中沒有的卡片"""
+        output_dir = os.path.join(self.temp_dir, "dist1")
+        images = self.generator.generate(self.cards, output_dir)
+
+        self.assertEqual(mock_render.call_count, 2)
+        self.assertEqual(set(images), set(self.cards))
+        for path in images.values():
+            self.assertTrue(path.startswith("og/"))
+            self.assertTrue(os.path.exists(os.path.join(output_dir, path)))
+
+        # 新的輸出目錄直接使用快取，修改過的作品才重新繪製
+        output_dir = os.path.join(self.temp_dir, "dist2")
+        edited = OgCard("標題2", "作者2", "散文")
+        images = self.generator.generate([self.cards[0], edited], output_dir)
+
+        self.assertEqual(mock_render.call_count, 3)
+        with open(
+            os.path.join(output_dir, images[self.cards[0]]), encoding="utf-8"
+        ) as f:
+            self.assertEqual(f.read(), "標題1")
+
+    @patch("src.application.og_images.render_card", side_effect=_fake_render)
+    def test_generate_to_memory(self, mock_render):
+        """測試沒有快取目錄時經由暫存目錄輸出到不在檔案系統中的輸出目標"""
+        generator = OgImageGenerator("測試網站", max_workers=1)
+        sink = MemorySink()
+        images = generator.generate(self.cards, sink)
+
+        self.assertEqual(mock_render.call_count, 2)
+        self.assertEqual(set(sink.files), set(images.values()))
+        self.assertEqual(sink.files[images[self.cards[0]]].decode("utf-8"), "標題1")
+
+    @unittest.skipUnless(OgImageGenerator.available(), "需要 Pillow")
+    def test_render(self):
+        """測試以多個行程繪製卡片"""
+        from PIL import Image
+
+        generator = OgImageGenerator("測試網站", max_workers=2)
+        images = generator.generate(self.cards, self.temp_dir)
+
+        for path in images.values():
+            with Image.open(os.path.join(self.temp_dir, path)) as image:
+                self.assertEqual(image.size, (CARD_WIDTH, CARD_HEIGHT))
+                self.assertEqual(image.format, "JPEG")
@@ -0,0 +1,162 @@
+"""
+輸出目標單元測試
+"""
+
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from src.infrastructure.output_sink import (
+    FileSystemSink,
+    MemorySink,
+    TarSink,
+    ZipSink,
+    as_output_sink,
+    create_output_sink,
+)
+
+
+class TestOutputSink(unittest.TestCase):
+    """輸出目標單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.temp_dir, "logo.png")
+        with open(self.source, "wb") as f:
+            f.write(b"\x89PNG fake image")
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_site(self, sink):
+        """寫入一組測試檔案"""
+        sink.write_text("index.html", "<h1>作品</h1>\n")
+        with sink.open_text("data/facets.json") as f:
+            f.write('{"row_count":')
+            f.write("2}")
+        sink.copy_file(self.source, "static/img/logo.png", link=True)
+
+    def test_file_system_sink(self):
+        """測試寫入目錄，並可以移除已寫入的檔案"""
+        root = os.path.join(self.temp_dir, "dist")
+        sink = FileSystemSink(root)
+        self._write_site(sink)
+        sink.close()
+
+        with open(os.path.join(root, "data", "facets.json"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"row_count":2}')
+        with open(os.path.join(root, "index.html"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "<h1>作品</h1>\n")
+        self.assertEqual(sink.local_dir("og"), os.path.join(root, "og"))
+        self.assertTrue(os.path.isdir(os.path.join(root, "og")))
+
+        sink.remove("static/img/logo.png")
+        self.assertFalse(os.path.exists(os.path.join(root, "static/img/logo.png")))
+        # 來源檔案不受影響
+        self.assertTrue(os.path.exists(self.source))
+
+    def test_memory_sink(self):
+        """測試寫入記憶體"""
+        sink = MemorySink()
+        self._write_site(sink)
+
+        self.assertEqual(
+            sink.files,
+            {
+                "index.html": "<h1>作品</h1>\n".encode("utf-8"),
+                "data/facets.json": b'{"row_count":2}',
+                "static/img/logo.png": b"\x89PNG fake image",
+            },
+        )
+        self.assertIsNone(sink.local_dir("og"))
+
+    def test_zip_sink(self):
+        """測試寫入 zip 封存檔，已壓縮的圖片不再壓縮"""
+        path = os.path.join(self.temp_dir, "out", "site.zip")
+        with create_output_sink(path) as sink:
+            self.assertIsInstance(sink, ZipSink)
+            self._write_site(sink)
+            # 完成前不會產生目標檔案
+            self.assertFalse(os.path.exists(path))
+
+        with zipfile.ZipFile(path) as archive:
+            self.assertEqual(
+                archive.namelist(),
+                ["index.html", "data/facets.json", "static/img/logo.png"],
+            )
+            self.assertEqual(
+                archive.read("index.html").decode("utf-8"), "<h1>作品</h1>\n"
+            )
+            self.assertEqual(
+                archive.getinfo("static/img/logo.png").compress_type,
+                zipfile.ZIP_STORED,
+            )
+            self.assertEqual(
+                archive.getinfo("index.html").compress_type, zipfile.ZIP_DEFLATED
+            )
+        self.assertFalse(os.path.exists(path + ".tmp"))
+
+    def test_tar_sink(self):
+        """測試寫入 tar.gz 封存檔"""
+        path = os.path.join(self.temp_dir, "site.tar.gz")
+        with create_output_sink(path) as sink:
+            self.assertIsInstance(sink, TarSink)
+            self._write_site(sink)
+
+        with tarfile.open(path, "r:gz") as archive:
+            self.assertEqual(
+                archive.getnames(),
+                ["index.html", "data/facets.json", "static/img/logo.png"],
+            )
+            self.assertEqual(
+                archive.extractfile("data/facets.json").read(), b'{"row_count":2}'
+            )
+            self.assertEqual(
+                archive.extractfile("static/img/logo.png").read(),
+                b"\x89PNG fake image",
+            )
+
+    def test_archive_rejects_duplicates_and_removal(self):
+        """測試封存檔中不能重複寫入或移除檔案"""
+        path = os.path.join(self.temp_dir, "site.tar")
+        with create_output_sink(path) as sink:
+            sink.write_text("index.html", "a")
+            with self.assertRaises(ValueError):
+                sink.write_text("index.html", "b")
+            with self.assertRaises(ValueError):
+                sink.remove("index.html")
+
+        with tarfile.open(path) as archive:
+            self.assertEqual(archive.getnames(), ["index.html"])
+
+    def test_failed_archive_is_discarded(self):
+        """測試產生失敗時不會留下不完整的封存檔"""
+        path = os.path.join(self.temp_dir, "site.zip")
+        with open(path, "wb") as f:
+            f.write(b"previous")
+
+        with self.assertRaises(RuntimeError):
+            with create_output_sink(path) as sink:
+                sink.write_text("index.html", "a")
+                raise RuntimeError("產生失敗")
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertFalse(os.path.exists(path + ".tmp"))
+
+    def test_create_output_sink(self):
+        """測試依路徑決定輸出目標"""
+        root = os.path.join(self.temp_dir, "dist")
+        self.assertIsInstance(create_output_sink(root), FileSystemSink)
+        self.assertIsInstance(as_output_sink(root), FileSystemSink)
+        self.assertEqual(as_output_sink(root).key, FileSystemSink(root).key)
+
+        sink = MemorySink()
+        self.assertIs(as_output_sink(sink), sink)
+        with self.assertRaises(ValueError):
+            TarSink(os.path.join(self.temp_dir, "site.tar.xz"), "xz")
@@ -0,0 +1,204 @@
+"""
+效能預算檢查單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from src.application.html_generator import HtmlGenerator
+from src.application.perf_budget import (
+    PerfBudget,
+    check_budget,
+    format_report,
+    iter_output_files,
+    load_budget,
+    load_previous_metrics,
+    measure_file,
+    measure_output,
+    save_metrics,
+)
+from src.domain.models import SheetData
+
+PAGE = b"""<!DOCTYPE html>
+<html>
+<head>
+  <link rel="stylesheet" href="https://cdn.example.com/a.css">
+  <link rel="stylesheet" href="static/css/style.css">
+  <link rel="stylesheet" href="//cdn.example.com/print.css" media="print">
+  <script src="https://cdn.example.com/sync.js"></script>
+  <script src="https://cdn.example.com/deferred.js" defer></script>
+  <!-- <div><tr> -->
+</head>
+<body>
+  <table><tr><th>A</th></tr><tr><td>1</td></tr><tr><td>2</td></tr></table>
+  <script src="https://cdn.example.com/body.js"></script>
+  <script>if (a<b) { document.write("<tr>"); }</script>
+</body>
+</html>
+"""
+
+
+class TestPerfBudget(unittest.TestCase):
+    """效能預算檢查單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_budget(self, content):
+        path = os.path.join(self.temp_dir, "budget.toml")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def test_measure_html(self):
+        """測試量測元素數、表格列、阻擋渲染的資源與內嵌腳本，略過註解與腳本內容"""
+        metrics = measure_file("index.html", PAGE)
+
+        self.assertEqual(metrics.bytes, len(PAGE))
+        self.assertLess(metrics.gzip_bytes, metrics.bytes)
+        # html head link*3 script*2 body table tr*3 th td*2 script*2
+        self.assertEqual(metrics.dom_nodes, 17)
+        self.assertEqual(metrics.rows, 3)
+        self.assertEqual(
+            metrics.blocking_urls,
+            ["https://cdn.example.com/a.css", "https://cdn.example.com/sync.js"],
+        )
+        self.assertEqual(metrics.blocking_resources, 2)
+        self.assertEqual(
+            metrics.inline_script_bytes, len(b'if (a<b) { document.write("<tr>"); }')
+        )
+        rows = b"<tr><th>A</th></tr><tr><td>1</td></tr><tr><td>2</td></tr>"
+        self.assertEqual(metrics.bytes_per_row, len(rows) // 3)
+        self.assertEqual(metrics.nodes_per_row, 2)
+
+        # 非 HTML 檔案只量測大小，已壓縮的檔案不再壓縮
+        image = measure_file("static/img/a.jpg", b"\xff" * 1000)
+        self.assertEqual(image.gzip_bytes, 1000)
+        self.assertIsNone(image.value("dom_nodes"))
+
+    def test_iter_output_files(self):
+        """測試從輸出目錄與封存檔讀取檔案"""
+        os.makedirs(os.path.join(self.temp_dir, "site", "static"))
+        for path in ("index.html", "static/style.css"):
+            with open(os.path.join(self.temp_dir, "site", path), "wb") as f:
+                f.write(path.encode())
+        archive_path = os.path.join(self.temp_dir, "site.zip")
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("static/", b"")
+            archive.writestr("static/style.css", b"static/style.css")
+            archive.writestr("index.html", b"index.html")
+
+        expected = [
+            ("index.html", b"index.html"),
+            ("static/style.css", b"static/style.css"),
+        ]
+        self.assertEqual(
+            list(iter_output_files(os.path.join(self.temp_dir, "site"))), expected
+        )
+        self.assertEqual(list(iter_output_files(archive_path)), expected)
+
+    def test_load_budget(self):
+        """測試讀取預算設定並拒絕不支援的項目"""
+        budget = load_budget(
+            self.write_budget('[total]\ngzip_bytes = 100\n[files."*.html"]\nrows = 2\n')
+        )
+        self.assertEqual(budget.total, {"gzip_bytes": 100})
+        self.assertEqual(budget.files, [("*.html", {"rows": 2})])
+
+        for content in (
+            "[total]\nrows = 2\n",
+            '[files."*.html"]\nweight = 1\n',
+            '[files."*.html"]\nrows = -1\n',
+            "[pages]\n",
+        ):
+            with self.assertRaises(ValueError):
+                load_budget(self.write_budget(content))
+
+    def test_check_budget(self):
+        """測試超過預算的項目與上次建置的差異"""
+        metrics = [
+            measure_file("index.html", PAGE),
+            measure_file("about.html", b"<html><body></body></html>"),
+            measure_file("data.json", b"{}"),
+        ]
+        budget = PerfBudget(
+            total={"bytes": 10},
+            files=[("*.html", {"blocking_resources": 1}), ("*", {"rows": 0})],
+        )
+        previous = {"index.html": {"blocking_resources": 1}}
+        violations = check_budget(metrics, budget, previous)
+
+        self.assertEqual(
+            [(v.target, v.metric) for v in violations],
+            [
+                ("全部檔案", "bytes"),
+                ("index.html", "blocking_resources"),
+                ("index.html", "rows"),
+            ],
+        )
+        self.assertEqual(
+            violations[1].describe(),
+            "index.html 阻擋渲染的外部資源數 (blocking_resources): 2 > 預算 1 "
+            "(+1，+100.0%)；上次建置 1 (+1)",
+        )
+        report = format_report(metrics, violations)
+        self.assertIn("超過預算的項目（3）", report)
+        self.assertEqual(check_budget(metrics, PerfBudget()), [])
+        self.assertIn("所有項目都在預算內", format_report(metrics, []))
+
+        metrics_path = os.path.join(self.temp_dir, "cache", "perf.json")
+        self.assertIsNone(load_previous_metrics(metrics_path))
+        save_metrics(metrics_path, metrics)
+        saved = load_previous_metrics(metrics_path)
+        self.assertEqual(saved["index.html"]["rows"], 3)
+        self.assertEqual(saved["data.json"], {"bytes": 2, "gzip_bytes": 22})
+        self.assertEqual(saved[""]["bytes"], sum(m.bytes for m in metrics))
+
+    def test_site_within_repository_budget(self):
+        """測試產生的網站符合專案的效能預算設定"""
+        # 與實際表單相同的欄位，包含被過濾的電子郵件與較長的簡介
+        headers = [
+            "時間戳記",
+            "電子郵件地址",
+            "作者名",
+            "作品標題",
+            "作品連結",
+            "類別",
+            "作品簡介",
+            "授權方式",
+        ]
+        description = "這是作品的簡介，描述故事的背景與主要角色。" * 8
+        rows = [
+            [
+                f"2025/3/{i % 28 + 1} 下午 02:{i % 60:02d}:00",
+                f"writer{i}@example.com",
+                f"測試作者{i % 37}",
+                f"這是一篇比較長的作品標題第{i}號",
+                f"https://example.com/works/{i}?ref=share",
+                ["詩歌", "小說", "散文", "漫畫"][i % 4],
+                description[: 40 + i % 120],
+                "CC BY-NC 4.0",
+            ]
+            for i in range(200)
+        ]
+        output_dir = os.path.join(self.temp_dir, "dist")
+        HtmlGenerator().generate_site(SheetData(headers=headers, rows=rows), output_dir)
+
+        budget_path = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "perf-budget.toml"
+        )
+        metrics = measure_output(iter_output_files(output_dir))
+        violations = check_budget(metrics, load_budget(budget_path))
+        self.assertEqual(violations, [], format_report(metrics, violations))
+
+
+if __name__ == "__main__":
+    unittest.main()
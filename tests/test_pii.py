@@ -0,0 +1,93 @@
+"""
+個人資料遮蔽器單元測試
+"""
+
+import unittest
+
+from src.domain.models import SheetData
+from src.domain.pii import PiiScrubber
+
+
+class TestPiiScrubber(unittest.TestCase):
+    """PiiScrubber 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.scrubber = PiiScrubber()
+
+    def test_scrub_email(self):
+        """測試遮蔽電子郵件"""
+        self.assertEqual(
+            self.scrubber.scrub("聯絡我：writer.one+poem@example.com.tw 謝謝"),
+            "聯絡我：[電子郵件已隱藏] 謝謝",
+        )
+
+    def test_scrub_phone_numbers(self):
+        """測試遮蔽手機與市話號碼"""
+        for value in [
+            "0912-345-678",
+            "0912345678",
+            "+886 912 345 678",
+            "02-2345-6789",
+            "(02)2345-6789",
+            "+886-2-2345-6789",
+            "04 2345 678",
+            "037-323456",
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    self.scrubber.scrub(f"電話 {value}。"), "電話 [電話已隱藏]。"
+                )
+
+    def test_scrub_next_to_cjk(self):
+        """測試緊接在中文前後的電話與電子郵件"""
+        for value, expected in [
+            ("電話0912345678", "電話[電話已隱藏]"),
+            ("電話0912-345-678謝謝", "電話[電話已隱藏]謝謝"),
+            ("市話02-2345-6789", "市話[電話已隱藏]"),
+            ("信箱writer@example.com謝謝", "信箱[電子郵件已隱藏]謝謝"),
+            ("請寄到a@b.com或打0912345678", "請寄到[電子郵件已隱藏]或打[電話已隱藏]"),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(self.scrubber.scrub(value), expected)
+
+    def test_scrub_national_id(self):
+        """測試遮蔽身分證字號與居留證號碼"""
+        self.assertEqual(
+            self.scrubber.scrub("A123456789 / B823456789"),
+            "[身分證字號已隱藏] / [身分證字號已隱藏]",
+        )
+
+    def test_keep_non_pii(self):
+        """測試不遮蔽日期、時間與一般數字"""
+        for value in [
+            "2023/4/30 上午 10:30:45",
+            "2023-05-01",
+            "第 0912 號作品",
+            "共 12345678 字",
+            "AB123456789",
+            "版本 02 1234 5678",
+            "訂單 02-0123-4567",
+            "",
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(self.scrubber.scrub(value), value)
+
+    def test_scrub_data(self):
+        """測試遮蔽整個表格並略過指定欄位，相同的值只掃描一次"""
+        data = SheetData(
+            headers=["作者名", "作品連結", "備註"],
+            rows=[
+                ["測試作者1", "https://example.com/0912345678", "0912-345-678"],
+                ["測試作者2", "https://example.com/2", "0912-345-678"],
+                ["測試作者3", "https://example.com/3", "無"],
+            ],
+        )
+
+        result = self.scrubber.scrub_data(data, skip_columns=[1])
+
+        self.assertEqual(result.rows[0][1], "https://example.com/0912345678")
+        self.assertEqual(result.rows[0][2], "[電話已隱藏]")
+        self.assertEqual(result.rows[1][2], "[電話已隱藏]")
+        self.assertIs(result.rows[2], data.rows[2])
+        self.assertEqual(self.scrubber._scrub_cached.cache_info().hits, 1)
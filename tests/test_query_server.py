@@ -0,0 +1,135 @@
+"""
+查詢伺服器單元測試
+"""
+
+import gzip
+import http.client
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.application.html_generator import HtmlGenerator
+from src.application.query_server import QueryServer, QueryViews, ViewQuery
+from src.domain.models import SheetData
+
+
+class TestQueryServer(unittest.TestCase):
+    """查詢伺服器單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.headers = ["作品標題", "作者名", "作品連結", "類別", "電子郵件"]
+        self.rows = [
+            [
+                f"作品{i}",
+                f"測試作者{i % 3}",
+                f"https://example.com/{i}",
+                "詩歌" if i % 2 else "小說",
+                f"user{i}@example.com",
+            ]
+            for i in range(25)
+        ]
+        self.data = SheetData(headers=self.headers, rows=self.rows)
+        self.views = QueryViews(HtmlGenerator(), page_size=5, cache_size=8)
+        self.views.update(self.data)
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_view_query(self):
+        """測試解析查詢字串與產生查詢網址"""
+        query = ViewQuery.parse("category=%E8%A9%A9%E6%AD%8C&q=+%E6%B5%B7+&page=x")
+
+        self.assertEqual(query, ViewQuery(category="詩歌", q="海", page=1))
+        self.assertEqual(ViewQuery.parse("page=-3").page, 1)
+        self.assertEqual(
+            query.url(page=2), "?category=%E8%A9%A9%E6%AD%8C&q=%E6%B5%B7&page=2"
+        )
+        self.assertEqual(query.url(category="", q=""), "?")
+
+    def test_render_page(self):
+        """測試篩選並只渲染一頁的資料行，不含敏感欄位"""
+        response = self.views.response(ViewQuery(category="詩歌", page=2))
+        html = response.body.decode("utf-8")
+
+        # 詩歌為奇數編號的 12 件作品，第 2 頁為第 6 到 10 件
+        self.assertIn("12 個結果，共 25 個項目（第 2 / 3 頁）", html)
+        self.assertIn('data-row="11"', html)
+        self.assertIn('data-row="19"', html)
+        self.assertNotIn('data-row="9"', html)
+        self.assertNotIn('data-row="21"', html)
+        self.assertIn('href="?category=%E8%A9%A9%E6%AD%8C&amp;page=3"', html)
+        self.assertNotIn("user19@example.com", html)
+        # 篩選由伺服器處理，不需要瀏覽器端的篩選腳本與 service worker
+        self.assertNotIn("facets.json", html)
+        self.assertNotIn("serviceWorker", html)
+        self.assertEqual(gzip.decompress(response.gzipped), response.body)
+
+        # 超過最後一頁時顯示最後一頁
+        html = self.views.response(ViewQuery(q="作品2", page=9)).body.decode("utf-8")
+        self.assertIn("6 個結果，共 25 個項目（第 2 / 2 頁）", html)
+        html = self.views.response(ViewQuery(q="不存在")).body.decode("utf-8")
+        self.assertIn("沒有符合條件的作品", html)
+
+        # 查詢條件來自網址，輸出時需跳脫
+        query = ViewQuery(q='"><script>alert(1)</script>')
+        html = self.views.response(query).body.decode("utf-8")
+        self.assertNotIn("<script>alert(1)", html)
+        self.assertIn('value="&#34;&gt;&lt;script&gt;alert(1)&lt;/script&gt;"', html)
+
+    def test_cache(self):
+        """測試相同查詢使用快取，資料更新後重新渲染"""
+        first = self.views.response(ViewQuery(author="測試作者1"))
+        self.assertIs(self.views.response(ViewQuery(author="測試作者1")), first)
+        self.assertEqual(self.views.cache_info().hits, 1)
+
+        version = self.views.version
+        self.views.update(self.data)
+        self.assertEqual(self.views.version, version)
+        self.assertEqual(self.views.cache_info().currsize, 0)
+
+        self.views.update(SheetData(headers=self.headers, rows=self.rows[:3]))
+        self.assertNotEqual(self.views.version, version)
+        second = self.views.response(ViewQuery(author="測試作者1"))
+        self.assertNotEqual(second.etag, first.etag)
+        self.assertIn("1 個結果，共 3 個項目", second.body.decode("utf-8"))
+
+    def test_http(self):
+        """測試以持續連線提供首頁查詢結果、ETag 與輸出目錄中的檔案"""
+        with open(os.path.join(self.temp_dir, "stats.json"), "w") as f:
+            f.write('{"total":25}')
+        server = QueryServer(self.views, self.temp_dir, port=0)
+        server.start()
+        conn = http.client.HTTPConnection(
+            "127.0.0.1", server.httpd.server_address[1], timeout=5
+        )
+        try:
+            conn.request(
+                "GET", "/?q=%E4%BD%9C%E5%93%811", headers={"Accept-Encoding": "gzip"}
+            )
+            response = conn.getresponse()
+            body = gzip.decompress(response.read()).decode("utf-8")
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+            self.assertIn("11 個結果", body)
+            etag = response.getheader("ETag")
+
+            conn.request(
+                "GET",
+                "/index.html?q=%E4%BD%9C%E5%93%811",
+                headers={"If-None-Match": etag},
+            )
+            response = conn.getresponse()
+            self.assertEqual(response.status, 304)
+            self.assertEqual(response.read(), b"")
+
+            conn.request("GET", "/stats.json")
+            response = conn.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.read(), b'{"total":25}')
+        finally:
+            conn.close()
+            server.stop()
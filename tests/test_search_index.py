@@ -0,0 +1,45 @@
+"""
+查詢索引單元測試
+"""
+
+import unittest
+
+from src.domain.models import SheetData, map_important_indices
+from src.domain.search_index import SearchIndex
+
+
+class TestSearchIndex(unittest.TestCase):
+    """SearchIndex 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.headers = ["作品標題", "作者名", "作品連結", "類別"]
+        self.rows = [
+            ["春天的海", "測試作者1", "https://example.com/spring", "詩歌"],
+            ["夜晚", "測試作者2", "https://example.com/night", "小說"],
+            ["Spring Rain", "測試作者1", "https://example.com/3", "小說"],
+            ["海與山", "測試作者3", "https://example.com/4", "詩歌"],
+            ["短"],
+        ]
+        self.data = SheetData(headers=self.headers, rows=self.rows)
+        self.index = SearchIndex(self.data, map_important_indices(self.headers))
+
+    def test_facet_filters(self):
+        """測試依類別與作者篩選"""
+        self.assertEqual(self.index.search(category="詩歌"), [0, 3])
+        self.assertEqual(self.index.search(author="測試作者1"), [0, 2])
+        self.assertEqual(self.index.search(category="小說", author="測試作者1"), [2])
+        self.assertEqual(self.index.search(category="不存在"), [])
+        self.assertEqual(self.index.search(), [0, 1, 2, 3, 4])
+        self.assertEqual(self.index.values("category"), ["小說", "詩歌"])
+
+    def test_keyword(self):
+        """測試關鍵字為不分大小寫的子字串比對，並略過連結網址"""
+        self.assertEqual(self.index.search(query="春天"), [0])
+        self.assertEqual(self.index.search(query=" spring "), [2])
+        self.assertEqual(self.index.search(query="ng ra"), [2])
+        self.assertEqual(self.index.search(query="example"), [])
+        # 單一字元沒有二元組，直接逐行比對
+        self.assertEqual(self.index.search(query="海"), [0, 3])
+        self.assertEqual(self.index.search(query="海", category="詩歌"), [0, 3])
+        self.assertEqual(self.index.search(query="海山"), [])
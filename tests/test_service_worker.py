@@ -0,0 +1,75 @@
+"""
+Service worker 生成器單元測試
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.application.service_worker import (
+    MANIFEST_PATH,
+    PrecacheEntry,
+    build_precache_manifest,
+    render_service_worker,
+)
+
+
+class TestServiceWorker(unittest.TestCase):
+    """Service worker 生成器單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.entries = [
+            PrecacheEntry("sort_orders.json", "bbb"),
+            PrecacheEntry("index.html", "aaa"),
+            PrecacheEntry("static/css/style.css?v=ccc", "ccc"),
+        ]
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build_precache_manifest(self):
+        """測試清單依網址排序，版本只隨項目內容改變"""
+        manifest = build_precache_manifest(self.entries + [self.entries[0]])
+
+        self.assertEqual(
+            [entry["url"] for entry in manifest["entries"]],
+            ["index.html", "sort_orders.json", "static/css/style.css?v=ccc"],
+        )
+        self.assertEqual(
+            manifest["version"],
+            build_precache_manifest(list(reversed(self.entries)))["version"],
+        )
+
+        changed = self.entries[:2] + [
+            PrecacheEntry("static/css/style.css?v=ddd", "ddd")
+        ]
+        self.assertNotEqual(
+            manifest["version"], build_precache_manifest(changed)["version"]
+        )
+
+    def test_render_service_worker(self):
+        """測試在原始碼中填入設定"""
+        source = Path(self.temp_dir) / "sw.js"
+        source.write_text(
+            "const CONFIG = __SERVICE_WORKER_CONFIG__;\n", encoding="utf-8"
+        )
+        manifest = build_precache_manifest(self.entries)
+
+        script = render_service_worker(source, manifest, "index.html")
+
+        prefix = "const CONFIG = "
+        config = json.loads(script[len(prefix) : script.rindex(";")])
+        self.assertEqual(config["version"], manifest["version"])
+        self.assertEqual(config["manifest"], MANIFEST_PATH)
+        self.assertEqual(config["index"], "index.html")
+
+        source.write_text("const CONFIG = {};\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            render_service_worker(source, manifest, "index.html")
+        self.assertTrue(os.path.exists(source))
@@ -4,11 +4,14 @@ SheetService 單元測試
 
 import json
 import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
 from src.application.sheet_service import SheetService
 from src.domain.models import SheetData
+from src.infrastructure.snapshot import load_snapshot
 
 
 class TestSheetService(unittest.TestCase):
@@ -149,3 +152,72 @@ class TestSheetService(unittest.TestCase):
             self.assertIsInstance(result, SheetData)
             self.assertEqual(result.headers, [])
             self.assertEqual(result.rows, [])
+
+    @patch("src.application.sheet_service.gspread")
+    @patch("src.application.sheet_service.ServiceAccountCredentials")
+    def test_get_sheet_data_writes_snapshot(self, mock_credentials, mock_gspread):
+        """測試擷取資料後保存快照"""
+        test_creds = {"type": "service_account", "project_id": "test"}
+
+        mock_worksheet = MagicMock()
+        mock_worksheet.get_all_values.return_value = [
+            ["標題", "作者", "連結"],
+            ["測試標題1", "測試作者1", "https://example.com/1"],
+        ]
+        mock_client = MagicMock()
+        mock_client.open_by_key.return_value.worksheet.return_value = mock_worksheet
+        mock_gspread.authorize.return_value = mock_client
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        snapshot_path = os.path.join(temp_dir, "sheet.snapshot")
+
+        with patch.dict(os.environ, {"GOOGLE_CREDENTIALS": json.dumps(test_creds)}):
+            service = SheetService(snapshot_path=snapshot_path)
+            result = service.get_sheet_data("test_spreadsheet_id", "test_sheet_name")
+
+        snapshot = load_snapshot(snapshot_path)
+        self.assertEqual(snapshot.headers, result.headers)
+        self.assertEqual(snapshot.rows, result.rows)
+
+    @patch("src.application.sheet_service.gspread")
+    @patch("src.application.sheet_service.ServiceAccountCredentials")
+    def test_get_last_updated_reuses_spreadsheet(self, mock_credentials, mock_gspread):
+        """測試查詢最後修改時間並重複使用已開啟的試算表"""
+        test_creds = {"type": "service_account", "project_id": "test"}
+
+        mock_spreadsheet = MagicMock()
+        mock_spreadsheet.get_lastUpdateTime.return_value = "2023-05-02T01:15:30.000Z"
+        mock_spreadsheet.worksheet.return_value.get_all_values.return_value = []
+        mock_client = MagicMock()
+        mock_client.open_by_key.return_value = mock_spreadsheet
+        mock_gspread.authorize.return_value = mock_client
+
+        with patch.dict(os.environ, {"GOOGLE_CREDENTIALS": json.dumps(test_creds)}):
+            service = SheetService()
+            last_updated = service.get_last_updated("test_spreadsheet_id")
+            service.get_sheet_data("test_spreadsheet_id", "test_sheet_name")
+
+        self.assertEqual(last_updated, "2023-05-02T01:15:30.000Z")
+        mock_client.open_by_key.assert_called_once_with("test_spreadsheet_id")
+
+    @patch("src.application.sheet_service.ServiceAccountCredentials")
+    def test_api_base_url(self, mock_credentials):
+        """測試指定 API 位址時不需要憑證，並改寫 Google API 的網址"""
+        service = SheetService(api_base_url="http://127.0.0.1:8800/")
+
+        mock_credentials.from_json_keyfile_dict.assert_not_called()
+        mock_credentials.from_json_keyfile_name.assert_not_called()
+        session = service.client.http_client.session
+        with patch("requests.Session.request") as mock_request:
+            session.request("get", "https://sheets.googleapis.com/v4/spreadsheets/x")
+            session.request("get", "https://www.googleapis.com/drive/v3/files/x")
+            session.request("get", "https://example.com/other")
+        self.assertEqual(
+            [c.args[1] for c in mock_request.call_args_list],
+            [
+                "http://127.0.0.1:8800/v4/spreadsheets/x",
+                "http://127.0.0.1:8800/drive/v3/files/x",
+                "https://example.com/other",
+            ],
+        )
@@ -0,0 +1,82 @@
+"""
+資料快照單元測試
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.domain.models import SheetData
+from src.infrastructure.snapshot import Snapshot, load_snapshot, write_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    """快照讀寫單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "cache", "sheet.snapshot")
+        self.data = SheetData(
+            headers=["時間戳記", "作者名", "作品連結", "類別"],
+            rows=[
+                [
+                    "2023/4/30 上午 10:30:45",
+                    "測試作者1",
+                    "https://example.com/1",
+                    "小說",
+                ],
+                ["2023/5/1 下午 02:45:12", "", "https://example.com/2", "詩歌 🎉"],
+                ["2023/5/2 上午 09:15:30", "測試作者3"],
+            ],
+        )
+
+    def tearDown(self):
+        """清理測試環境"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """測試寫入後讀回相同資料"""
+        write_snapshot(self.data, self.path)
+
+        result = load_snapshot(self.path)
+
+        self.assertEqual(result.headers, self.data.headers)
+        # 長度不一致的資料行也要原樣還原
+        self.assertEqual(result.rows, self.data.rows)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_random_access(self):
+        """測試不解析整個檔案即可讀取單一欄位或儲存格"""
+        write_snapshot(self.data, self.path)
+
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.row_count, 3)
+            self.assertEqual(snapshot.headers, self.data.headers)
+            self.assertEqual(snapshot.cell(1, 3), "詩歌 🎉")
+            self.assertEqual(snapshot.column(1), ["測試作者1", "", "測試作者3"])
+            with self.assertRaises(IndexError):
+                snapshot.cell(3, 0)
+
+    def test_empty_data(self):
+        """測試空資料"""
+        write_snapshot(SheetData(headers=[], rows=[]), self.path)
+
+        result = load_snapshot(self.path)
+
+        self.assertEqual(result.headers, [])
+        self.assertEqual(result.rows, [])
+
+    def test_invalid_file(self):
+        """測試讀取無效的快照檔"""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot file")
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+        with open(self.path, "wb"):
+            pass
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
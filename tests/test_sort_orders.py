@@ -0,0 +1,45 @@
+"""
+排序索引單元測試
+"""
+
+import unittest
+
+from src.domain.models import SheetData, map_important_indices
+from src.domain.sort_orders import _natural_key, build_sort_orders
+
+
+class TestSortOrders(unittest.TestCase):
+    """排序索引單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.headers = ["時間戳記", "作者名", "作品連結", "類別", "作品標題"]
+        self.rows = [
+            ["2023/5/1 下午 02:45:12", "王小明", "https://e.com/1", "詩歌", "作品10"],
+            ["2023/5/1 上午 09:15:30", "Amy", "https://e.com/2", "小說", "作品2"],
+            ["", "王小明", "https://e.com/3", "", "ＡＢＣ"],
+            ["2023/4/30 下午 10:30:45", "amy", "https://e.com/4", "詩歌", "abd"],
+        ]
+        self.data = SheetData(headers=self.headers, rows=self.rows)
+        self.indices = map_important_indices(self.headers)
+
+    def test_build_sort_orders(self):
+        """測試各欄位的排序排列"""
+        orders = build_sort_orders(self.data, self.indices, text_key=_natural_key)
+
+        # 依解析後的時間排序，空白值排在最後
+        self.assertEqual(orders["timestamp"], [3, 1, 0, 2])
+        # 文字忽略大小寫且排序穩定
+        self.assertEqual(orders["author"], [1, 3, 0, 2])
+        self.assertEqual(orders["category"], [1, 0, 3, 2])
+        # 全形字元正規化，數字依數值比較
+        self.assertEqual(orders["title"], [2, 3, 1, 0])
+
+    def test_missing_columns(self):
+        """測試只為存在的欄位產生排列"""
+        data = SheetData(headers=["作者名"], rows=[["乙"], ["甲"]])
+
+        orders = build_sort_orders(data, map_important_indices(data.headers))
+
+        self.assertEqual(list(orders), ["author"])
+        self.assertEqual(sorted(orders["author"]), [0, 1])
@@ -0,0 +1,122 @@
+"""
+投稿統計單元測試
+"""
+
+import unittest
+from datetime import date
+
+from src.domain.models import SheetData, map_important_indices
+from src.domain.stats import DAILY_SERIES_MAX_DAYS, build_stats
+from src.domain.timestamps import TimestampParser
+
+
+class TestStats(unittest.TestCase):
+    """投稿統計單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.headers = ["時間戳記", "作者名", "類別"]
+        self.rows = [
+            ["2023/4/30 下午 11:30:00", "測試作者1", "詩歌"],
+            ["2023/5/1 上午 9:00:00", "測試作者2", "小說"],
+            ["2023/5/1 上午 10:15:00", "測試作者1", "詩歌"],
+            # 以 UTC 表示的時間換算為台灣時間後是 5/3 上午 8 時
+            ["2023-05-03T00:00:00Z", "測試作者1", "小說"],
+            ["無法解析", "測試作者3", " 詩歌 "],
+            ["2023/5/3 下午 1:00:00"],
+        ]
+        self.data = SheetData(headers=self.headers, rows=self.rows)
+        self.indices = map_important_indices(self.headers)
+
+    def test_build_stats(self):
+        """測試一次掃描計算每日投稿數、時段與星期分布"""
+        stats = build_stats(self.data, self.indices, TimestampParser())
+
+        self.assertEqual(stats.total, 6)
+        self.assertEqual(stats.dated, 5)
+        # 沒有投稿的日期補 0
+        self.assertEqual(
+            stats.daily,
+            [
+                (date(2023, 4, 30), 1),
+                (date(2023, 5, 1), 2),
+                (date(2023, 5, 2), 0),
+                (date(2023, 5, 3), 2),
+            ],
+        )
+        self.assertEqual(stats.cumulative, [1, 3, 3, 5])
+        self.assertEqual(stats.hourly[8], 1)
+        self.assertEqual(stats.hourly[23], 1)
+        self.assertEqual(sum(stats.hourly), 5)
+        # 2023/4/30 是星期日，5/1 是星期一
+        self.assertEqual(stats.weekdays, [2, 0, 2, 0, 0, 0, 1])
+        self.assertEqual(
+            stats.busiest_days,
+            [(date(2023, 5, 1), 2), (date(2023, 5, 3), 2), (date(2023, 4, 30), 1)],
+        )
+
+    def test_daily_series_window(self):
+        """測試打錯年份的時間戳記不會讓每日數列涵蓋數十萬天"""
+        rows = self.rows + [
+            ["2205/4/1 上午 9:00:00", "測試作者4", "小說"],
+            ["2013/5/1 上午 9:00:00", "測試作者5", "小說"],
+        ]
+        stats = build_stats(
+            SheetData(headers=self.headers, rows=rows),
+            self.indices,
+            TimestampParser(),
+            today=date(2023, 6, 1),
+        )
+
+        self.assertEqual(stats.dated, 7)
+        self.assertEqual(stats.daily[-1], (date(2023, 5, 3), 2))
+        self.assertEqual(len(stats.daily), DAILY_SERIES_MAX_DAYS)
+        self.assertEqual(stats.cumulative[-1], 5)
+
+    def test_leaderboards(self):
+        """測試類別與作者排行"""
+        stats = build_stats(
+            self.data, self.indices, TimestampParser(), leaderboard_size=2
+        )
+
+        self.assertEqual(stats.categories, [("詩歌", 3), ("小說", 2)])
+        self.assertEqual(stats.author_count, 3)
+        self.assertEqual([a.name for a in stats.authors], ["測試作者1", "測試作者2"])
+        author = stats.authors[0]
+        self.assertEqual(author.count, 3)
+        self.assertEqual(author.first, date(2023, 4, 30))
+        self.assertEqual(author.latest, date(2023, 5, 3))
+        self.assertEqual(author.top_category, "詩歌")
+
+    def test_to_json(self):
+        """測試輸出為 JSON 物件"""
+        result = build_stats(self.data, self.indices, TimestampParser()).to_json()
+
+        self.assertEqual(result["daily"]["start"], "2023-04-30")
+        self.assertEqual(result["daily"]["counts"], [1, 2, 0, 2])
+        self.assertEqual(result["daily"]["cumulative"], [1, 3, 3, 5])
+        self.assertEqual(result["categories"][0], {"value": "詩歌", "count": 3})
+        self.assertEqual(
+            result["authors"][0],
+            {
+                "name": "測試作者1",
+                "count": 3,
+                "first": "2023-04-30",
+                "latest": "2023-05-03",
+                "top_category": "詩歌",
+            },
+        )
+
+    def test_missing_columns(self):
+        """測試沒有時間戳記與類別欄位時只統計作者"""
+        data = SheetData(headers=["作者名"], rows=[["測試作者1"], ["測試作者1"]])
+
+        stats = build_stats(
+            data, map_important_indices(data.headers), TimestampParser()
+        )
+
+        self.assertEqual(stats.daily, [])
+        self.assertEqual(stats.categories, [])
+        self.assertEqual(stats.authors[0].count, 2)
+        self.assertIsNone(stats.authors[0].first)
+        self.assertIsNone(stats.to_json()["daily"]["start"])
@@ -0,0 +1,87 @@
+"""
+時間戳記解析器單元測試
+"""
+
+import unittest
+from datetime import datetime, timezone
+
+from src.domain.timestamps import TimestampParser
+
+
+class TestTimestampParser(unittest.TestCase):
+    """TimestampParser 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.parser = TimestampParser()
+
+    def test_parse_forms_timestamp(self):
+        """測試解析 Google Forms 的上午/下午時間戳記"""
+        morning = self.parser.parse("2023/4/30 上午 10:30:45")
+        afternoon = self.parser.parse("2023/5/1 下午 02:45:12")
+        midnight = self.parser.parse("2023/5/1 上午 12:05:00")
+        noon = self.parser.parse("2023/5/1 下午 12:05:00")
+
+        self.assertEqual(
+            morning.replace(tzinfo=None), datetime(2023, 4, 30, 10, 30, 45)
+        )
+        self.assertEqual(afternoon.hour, 14)
+        self.assertEqual(midnight.hour, 0)
+        self.assertEqual(noon.hour, 12)
+        self.assertEqual(morning.utcoffset().total_seconds(), 8 * 3600)
+
+    def test_parse_other_formats(self):
+        """測試解析 24 小時制與 ISO 格式"""
+        self.assertEqual(self.parser.parse("2023/5/1 14:45").hour, 14)
+        self.assertEqual(self.parser.parse("2023-01-01").day, 1)
+        self.assertEqual(
+            self.parser.parse("2023-05-01T06:45:12Z").tzinfo.utcoffset(None).seconds, 0
+        )
+        self.assertIsNone(self.parser.parse("不是日期"))
+        self.assertIsNone(self.parser.parse("2023/2/30 上午 10:00:00"))
+        self.assertIsNone(self.parser.parse(""))
+
+    def test_epoch(self):
+        """測試取得排序用的 epoch 值"""
+        expected = datetime(2023, 4, 30, 2, 30, 45, tzinfo=timezone.utc).timestamp()
+
+        self.assertEqual(self.parser.epoch("2023/4/30 上午 10:30:45"), expected)
+        self.assertIsNone(self.parser.epoch("未知"))
+        self.assertEqual(
+            self.parser.epochs(["2023/4/30 上午 10:30:45", "未知"], default=-1.0),
+            [expected, -1.0],
+        )
+
+    def test_local(self):
+        """測試取得當地時間，含時區的值換算為台灣時間"""
+        self.assertEqual(
+            self.parser.local("2023/4/30 下午 11:30:45"),
+            datetime(2023, 4, 30, 23, 30, 45),
+        )
+        self.assertEqual(
+            self.parser.local("2023-04-30T16:00:00Z"), datetime(2023, 5, 1, 0, 0)
+        )
+        self.assertIsNone(self.parser.local(""))
+
+    def test_format(self):
+        """測試格式化時間戳記"""
+        self.assertEqual(
+            self.parser.format("2023/5/1 下午 02:45:12"), "2023-05-01 14:45"
+        )
+        self.assertEqual(self.parser.format("2023-01-01"), "2023-01-01 00:00")
+        self.assertEqual(self.parser.format("未知"), "未知")
+        self.assertEqual(self.parser.format(""), "")
+
+    def test_detect_and_memoize(self):
+        """測試偵測欄位格式並快取重複的值"""
+        values = ["", "2023-05-01T06:45:12", "2023-05-02T06:45:12"]
+
+        self.assertEqual(self.parser.detect(values), "iso")
+        self.assertEqual(self.parser.format_name, "iso")
+        self.assertIsNone(TimestampParser().detect(["", "不是日期"]))
+
+        for _ in range(3):
+            self.parser.parse("2023/4/30 上午 10:30:45")
+        info = self.parser._parse_cached.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
@@ -0,0 +1,72 @@
+"""
+監看模式單元測試
+"""
+
+import os
+import unittest
+from unittest.mock import MagicMock
+
+from src.application.watch_mode import WatchBuilder
+from src.domain.models import SheetData
+
+
+class TestWatchBuilder(unittest.TestCase):
+    """WatchBuilder 單元測試類"""
+
+    def setUp(self):
+        """設置測試環境"""
+        self.root = os.path.abspath("project")
+        self.generator = MagicMock()
+        self.generator.template_dir = os.path.join(self.root, "templates")
+        self.generator.static_dir = os.path.join(self.root, "static")
+        self.data = SheetData(headers=["作者名"], rows=[["測試作者"]])
+        self.generator.prepare_data.return_value = (self.data, {"author": 0})
+        self.generator.render_pages.return_value = ["index.html"]
+        self.generator.copy_static_file.side_effect = lambda path, output_dir: (
+            "static/" + os.path.basename(path)
+        )
+        self.builder = WatchBuilder(self.generator, self.data, "dist")
+
+    def test_prepare_data_once(self):
+        """測試敏感資料只在初始化時過濾一次"""
+        self.builder.rebuild({os.path.join(self.root, "templates", "index.html")})
+        self.builder.rebuild({os.path.join(self.root, "templates", "index.html")})
+
+        self.generator.prepare_data.assert_called_once_with(self.data)
+
+    def test_build_all_reuses_prepared_data(self):
+        """測試完整建置沿用過濾過的資料，不會再次過濾"""
+        self.builder.build_all()
+
+        self.generator.prepare_data.assert_called_once_with(self.data)
+        self.generator.generate_prepared.assert_called_once_with(
+            self.data, "dist", {"author": 0}
+        )
+        self.generator.generate_site.assert_not_called()
+
+    def test_template_change_renders_pages(self):
+        """測試模板變更時只重新渲染頁面"""
+        outputs = self.builder.rebuild(
+            {os.path.join(self.root, "templates", "index.html")}
+        )
+
+        self.assertEqual(outputs, ["index.html"])
+        self.generator.render_pages.assert_called_once_with(
+            self.data, "dist", {"author": 0}
+        )
+        self.generator.copy_static_file.assert_not_called()
+
+    def test_static_change_copies_file(self):
+        """測試靜態資源變更時只複製變更的檔案"""
+        path = os.path.join(self.root, "static", "css", "style.css")
+        outputs = self.builder.rebuild({path})
+
+        self.assertEqual(outputs, ["static/style.css"])
+        self.generator.copy_static_file.assert_called_once_with(path, "dist")
+        self.generator.render_pages.assert_not_called()
+
+    def test_unrelated_change(self):
+        """測試與網站無關的檔案變更不會重建"""
+        self.assertEqual(
+            self.builder.rebuild({os.path.join(self.root, "README.md")}), []
+        )